@@ -0,0 +1,191 @@
+"""Admission control: priority classes with their own concurrency and queue limits.
+
+Each request is classified before it reaches a handler. It is ``interactive``
+(single-record reads and small writes), ``listing`` (whole-store reads) or
+``batch`` (scoring runs, bulk actions, previews, imports). A class runs at
+most ``concurrency`` requests at once, and all classes together run at most
+``total``. When a slot frees up, it goes to the waiter of the most urgent
+class that can use it; a class held only by its own limit does not block the
+others. So a queue of agent bulk jobs never stands in front of a recruiter's
+click, and only one or two batch jobs compete with clicks for the
+interpreter.
+
+Queues are bounded. A request arriving at a full queue gets 429, and one that
+waits longer than its class's ``timeout`` gets 503. Both carry
+``Retry-After``, estimated from the class's recent service time.
+"""
+import asyncio
+import collections
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from fastapi.responses import JSONResponse
+
+from metrics import REGISTRY
+
+# Weight of the newest request in the per-class service time average.
+_EWMA_ALPHA = 0.2
+
+ADMISSION_WAIT_SECONDS = REGISTRY.histogram(
+    "hr_admission_wait_seconds", "Time requests spent queued for admission", ("priority",),
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "hr_admission_rejected_total", "Requests turned away by admission control", ("priority", "reason"),
+)
+
+
+@dataclass(frozen=True)
+class AdmissionClass:
+    name: str
+    priority: int  # lower is more urgent
+    concurrency: int
+    queue: int
+    timeout: float
+
+
+DEFAULT_CLASSES = (
+    AdmissionClass("interactive", 0, int(os.environ.get("HR_ADMIT_INTERACTIVE", "64")), 512, 5.0),
+    AdmissionClass("listing", 1, int(os.environ.get("HR_ADMIT_LISTING", "2")), 64, 15.0),
+    AdmissionClass("batch", 2, int(os.environ.get("HR_ADMIT_BATCH", "1")), 16, 60.0),
+)
+DEFAULT_TOTAL = int(os.environ.get("HR_ADMIT_TOTAL", "64"))
+
+
+class Rejected(Exception):
+    def __init__(self, status: int, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class Admission:
+    """Slot accounting for one event loop; every method runs on that loop."""
+
+    def __init__(self, classes=DEFAULT_CLASSES, total: int = DEFAULT_TOTAL):
+        self.classes = {c.name: c for c in classes}
+        self.total = total
+        self._by_priority = sorted(classes, key=lambda c: c.priority)
+        self._running = collections.Counter()
+        self._waiters: dict[str, collections.deque] = {c.name: collections.deque() for c in classes}
+        self._service = {c.name: 0.0 for c in classes}
+
+    def running(self, name: str) -> int:
+        return self._running[name]
+
+    def waiting(self, name: str) -> int:
+        return len(self._waiters[name])
+
+    def _retry_after(self, cls: AdmissionClass) -> int:
+        backlog = (self.waiting(cls.name) + 1) / max(1, cls.concurrency)
+        return max(1, math.ceil(self._service[cls.name] * backlog))
+
+    def _can_run(self, cls: AdmissionClass) -> bool:
+        return self._running[cls.name] < cls.concurrency and sum(self._running.values()) < self.total
+
+    def _held_back(self, cls: AdmissionClass) -> bool:
+        """Whether a request of ``cls`` must queue behind someone already waiting.
+
+        That is anyone in its own queue, or a more urgent waiter that could take
+        the slot. A more urgent class queued only on its own concurrency limit
+        cannot, so it does not hold back the classes below it.
+        """
+        for c in self._by_priority:
+            if c.priority > cls.priority:
+                return False
+            if self._waiters[c.name] and (c is cls or self._running[c.name] < c.concurrency):
+                return True
+        return False
+
+    async def acquire(self, name: str) -> None:
+        cls = self.classes[name]
+        if self._can_run(cls) and not self._held_back(cls):
+            self._running[name] += 1
+            return
+        waiters = self._waiters[name]
+        if len(waiters) >= cls.queue:
+            ADMISSION_REJECTED.inc(priority=name, reason="queue_full")
+            raise Rejected(429, f"Too many {name} requests queued; retry later", self._retry_after(cls))
+        slot = asyncio.get_running_loop().create_future()
+        waiters.append(slot)
+        t0 = time.perf_counter()
+        try:
+            await asyncio.wait((slot,), timeout=cls.timeout)
+        except asyncio.CancelledError:
+            self._abandon(name, slot)
+            raise
+        finally:
+            ADMISSION_WAIT_SECONDS.observe(time.perf_counter() - t0, priority=name)
+        if not slot.done():
+            self._abandon(name, slot)
+            ADMISSION_REJECTED.inc(priority=name, reason="timeout")
+            raise Rejected(503, f"Server busy; {name} request not admitted within {cls.timeout:g}s",
+                           self._retry_after(cls))
+
+    def _abandon(self, name: str, slot: asyncio.Future) -> None:
+        if slot.done() and not slot.cancelled():
+            # Granted just as the caller gave up: hand the slot on.
+            self.release(name)
+            return
+        slot.cancel()
+        try:
+            self._waiters[name].remove(slot)
+        except ValueError:
+            pass
+
+    def release(self, name: str, seconds: Optional[float] = None) -> None:
+        self._running[name] -= 1
+        if seconds is not None:
+            self._service[name] += _EWMA_ALPHA * (seconds - self._service[name])
+        self._grant()
+
+    def _grant(self) -> None:
+        for cls in self._by_priority:
+            waiters = self._waiters[cls.name]
+            while waiters and self._can_run(cls):
+                slot = waiters.popleft()
+                if not slot.done():
+                    self._running[cls.name] += 1
+                    slot.set_result(None)
+            if waiters and self._running[cls.name] < cls.concurrency:
+                # Out of total capacity: less urgent classes wait, as in ``acquire``.
+                return
+
+    def stats(self) -> dict:
+        return {
+            name: {"running": self._running[name], "waiting": len(self._waiters[name]),
+                   "limit": cls.concurrency, "queue": cls.queue, "service_s": round(self._service[name], 4)}
+            for name, cls in self.classes.items()
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware holding an admission slot for the whole request, streamed body included.
+
+    ``classify(method, path)`` names the request's class, or None to let it
+    through unmetered (health checks, metrics, static files).
+    """
+
+    def __init__(self, app, admission: Admission, classify: Callable[[str, str], Optional[str]]):
+        self.app = app
+        self.admission = admission
+        self.classify = classify
+
+    async def __call__(self, scope, receive, send):
+        name = self.classify(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if name is None:
+            return await self.app(scope, receive, send)
+        try:
+            await self.admission.acquire(name)
+        except Rejected as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status,
+                                    headers={"Retry-After": str(e.retry_after)})
+            return await response(scope, receive, send)
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission.release(name, time.perf_counter() - t0)
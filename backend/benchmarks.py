@@ -0,0 +1,152 @@
+"""Benchmarks for the backend hot paths.
+
+Builds seeded populations with ``synthetic.py`` (so a size always means the
+same applicants) and times the scoring, parsing, rendering and list endpoints, both as plain
+function calls and through the in-process ASGI test client (needs ``httpx``).
+Results are written as JSON so runs can be compared:
+
+    python benchmarks.py --sizes 1000 10000 --out bench.json
+    python benchmarks.py --sizes 1000 10000 --out bench2.json --compare bench.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import main
+import synthetic
+from mock_data import score_applicant
+from records import Applicant
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+REPLY_TEXTS = [
+    "Thank you! I'm excited and can confirm I'm available weekends and early mornings. I have 3 seasons of lift experience and my OSHA 10.",
+    "Hi, I can make it. Let me know the time.",
+    "Hello, thanks for the invitation. I'm happy to interview and available for holiday shifts at the resort.",
+]
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    idx = min(len(sorted_samples) - 1, int(round(pct / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[idx]
+
+
+def _run_case(name: str, size: int, fn, items_per_call: int, iterations: int) -> dict:
+    """Time ``iterations`` calls of ``fn``, then one more under tracemalloc for peak memory."""
+    samples = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort()
+    total = sum(samples)
+    return {
+        "case": name,
+        "size": size,
+        "iterations": iterations,
+        "throughput_per_s": round(items_per_call * iterations / total, 1) if total else None,
+        "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "peak_kb": peak // 1024,
+    }
+
+
+def run(sizes, request_iterations: int = 5, seed: int = 0) -> list[dict]:
+    from fastapi.testclient import TestClient
+
+    main.SCORE_ALL_DELAY = 0
+    client = TestClient(main.app)
+    results = []
+    for size in sizes:
+        generated = list(synthetic.generate(size, seed=seed, freeform=True))
+        population = [Applicant.from_dict(d) for d in generated]
+        main._store.reset(population)
+        main._applicant_json.clear()
+        main._preview_json.clear()
+        print(f"== {size} applicants", file=sys.stderr)
+
+        it = iter(population * 2)
+        sample_n = min(size, 2_000)
+        results.append(_run_case("score_applicant", size, lambda: score_applicant(next(it)), 1, sample_n))
+
+        resumes = [d["resume_text"] for d in generated[:sample_n]]
+        rit = iter(resumes * 2)
+        results.append(_run_case("_parse_freeform_resume", size, lambda: main._parse_freeform_resume(next(rit)), 1, sample_n))
+
+        settings = main._settings_store.current()
+        pit = iter(population * 2)
+        results.append(_run_case("_render_email", size, lambda: main._render_email(next(pit), None, settings), 1, sample_n))
+
+        sit = iter(population * 2)
+        results.append(_run_case(
+            "_score_response", size, lambda: main._score_response(REPLY_TEXTS[0], next(sit)), 1, sample_n,
+        ))
+
+        results.append(_run_case(
+            "POST /api/score/all", size, lambda: client.post("/api/score/all").raise_for_status(), size, request_iterations,
+        ))
+        results.append(_run_case(
+            "GET /api/applicants", size, lambda: client.get("/api/applicants").raise_for_status(), size, request_iterations,
+        ))
+
+        batch = [a.id for a in population[:min(size, 1_000)]]
+        body = {"applicant_ids": batch, "action": "send_invite"}
+        results.append(_run_case(
+            "POST /api/bulk send_invite", size, lambda: client.post("/api/bulk", json=body).raise_for_status(),
+            len(batch), request_iterations,
+        ))
+    return results
+
+
+def compare(current: list[dict], previous: list[dict]) -> list[str]:
+    prev = {(r["case"], r["size"]): r for r in previous}
+    lines = []
+    for r in current:
+        old = prev.get((r["case"], r["size"]))
+        if not old or not old.get("p50_ms"):
+            continue
+        ratio = r["p50_ms"] / old["p50_ms"]
+        flag = "  REGRESSION" if ratio > 1.2 else ""
+        lines.append(f"{r['case']:<28} n={r['size']:<7} p50 {old['p50_ms']:>10.3f} -> {r['p50_ms']:>10.3f} ms ({ratio:.2f}x){flag}")
+    return lines
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark backend hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--iterations", type=int, default=5, help="Requests per endpoint case")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic population seed")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="Previous results JSON to diff against")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.iterations, args.seed)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for r in results:
+        print(f"{r['case']:<28} n={r['size']:<7} {r['throughput_per_s']:>12} /s  p50 {r['p50_ms']:>9.3f} ms  p99 {r['p99_ms']:>9.3f} ms  peak {r['peak_kb']} KiB")
+    if args.compare:
+        with open(args.compare) as f:
+            print("\n".join(compare(results, json.load(f)["results"])))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,70 @@
+"""Precompressed static assets for the built frontend.
+
+API responses are gzipped on the fly by ``GZipMiddleware``; the static bundle
+never changes between deploys, so it is compressed once ahead of time and the
+matching ``.br``/``.gz`` sibling is served by content negotiation.
+
+    python compression.py ../frontend/dist
+"""
+import gzip
+import os
+import stat
+import sys
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+
+COMPRESSIBLE_SUFFIXES = (".html", ".js", ".css", ".svg", ".json", ".txt", ".map")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that prefers a precompressed ``.br``/``.gz`` sibling when the client accepts it."""
+
+    async def get_response(self, path: str, scope):
+        if scope["method"] in ("GET", "HEAD"):
+            accept = Headers(scope=scope).get("accept-encoding", "")
+            for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+                if encoding not in accept:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = self.file_response(full_path, stat_result, scope)
+                    response.headers["Content-Encoding"] = encoding
+                    response.headers.add_vary_header("Accept-Encoding")
+                    return response
+        return await super().get_response(path, scope)
+
+
+def precompress(directory: str, min_size: int = 1024) -> list[str]:
+    """Write ``.gz`` (and ``.br`` when brotli is installed) next to each compressible asset."""
+    written = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < min_size:
+                continue
+            outputs = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                outputs.append((".br", brotli.compress(data, quality=11)))
+            for suffix, compressed in outputs:
+                if len(compressed) < len(data):
+                    with open(path + suffix, "wb") as f:
+                        f.write(compressed)
+                    written.append(path + suffix)
+    return written
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "../frontend/dist")
+    for p in precompress(target):
+        print(p)
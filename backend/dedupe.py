@@ -0,0 +1,355 @@
+"""Near-duplicate applicant detection with MinHash signatures and LSH.
+
+Each applicant becomes a set of features:
+
+- word 3-shingles of the resume;
+- character trigrams of the normalized name and email local part;
+- the phone number.
+
+The set is sketched into a 64-value MinHash signature with one-permutation
+hashing: every feature is hashed once and lands in one of 64 bins, and empty
+bins borrow from their neighbour. That is the same estimator as classic
+MinHash at a fraction of the cost.
+
+The signature is cut into 16 bands of 4, and each band is a bucket key. Two
+applicants become candidates when they share a band bucket, or the same
+normalized email, phone or name. At 70% feature overlap (the default threshold)
+a band is shared about 99% of the time. So both a lookup on insert and a sweep of the
+whole store only touch colliding applicants, never all pairs.
+
+Candidates are confirmed from the full signature (estimated Jaccard
+similarity), the exact contact keys and name similarity. The same name with a
+similar email local part also confirms a pair, whatever the profiles say: a
+re-upload under a new address rarely shares 70% of its features with the synced
+record (different resume layout, no phone). Like the relevance index, the
+listener only queues records and the index catches up on the next read.
+"""
+import gc
+import operator
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from records import Applicant
+from relevance import resume_text, tokenize
+
+NUM_HASHES = 64
+BANDS = 16
+ROWS = 4
+THRESHOLD = 0.7
+# Band and name buckets with more pairs than this hold boilerplate resumes or common names, not
+# people; the sweep skips them (a lookup on insert still checks every mate).
+MAX_BUCKET_PAIRS = 45
+# Trigram similarity of two email local parts (digits ignored) that, with the same name, confirms a pair.
+LOCAL_PART_THRESHOLD = 0.5
+_BIN_BITS = 6  # log2(NUM_HASHES)
+_VALUE_MASK = (1 << (32 - _BIN_BITS)) - 1
+_EMPTY = 1 << 32
+_PHONE_WEIGHT = 3
+
+
+def normalize_name(first: str, last: str) -> str:
+    text = unicodedata.normalize("NFKD", f"{first} {last}").encode("ascii", "ignore").decode().lower()
+    return " ".join(re.findall(r"[a-z]+", text))
+
+
+def normalize_email(email: str) -> str:
+    local, _, domain = email.strip().lower().partition("@")
+    local = local.split("+", 1)[0].replace(".", "")
+    if domain == "googlemail.com":
+        domain = "gmail.com"
+    return f"{local}@{domain}" if domain else local
+
+
+def email_local_part(email: str) -> tuple[str, str]:
+    """The normalized local part split into its letters and its digits."""
+    local = normalize_email(email).split("@", 1)[0]
+    return re.sub(r"\d", "", local), "".join(re.findall(r"\d", local))
+
+
+def normalize_phone(phone: str) -> str:
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] if len(digits) >= 7 else ""
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def features(applicant: Applicant) -> set[str]:
+    words = tokenize(resume_text(applicant))
+    out = {" ".join(words[i:i + 3]) for i in range(len(words) - 2)} if len(words) >= 3 else set(words)
+    out.update("n:" + t for t in _trigrams(normalize_name(applicant.first_name, applicant.last_name)))
+    out.update("e:" + t for t in _trigrams(normalize_email(applicant.email).split("@", 1)[0]))
+    phone = normalize_phone(applicant.phone)
+    if phone:
+        out.update(f"p{i}:{phone}" for i in range(_PHONE_WEIGHT))
+    return out
+
+
+def signature(feature_set: set[str]) -> tuple[int, ...]:
+    sig = [_EMPTY] * NUM_HASHES
+    shift = 32 - _BIN_BITS
+    # The index lives in memory only, so the per-process string hash is good enough.
+    for h in map(hash, feature_set):
+        h &= 0xFFFFFFFF
+        b, v = h >> shift, h & _VALUE_MASK
+        if v < sig[b]:
+            sig[b] = v
+    if _EMPTY in sig and len(feature_set):
+        # Densify: an empty bin takes the next filled bin to its right (wrapping), offset by the distance.
+        filled = [v for v in sig]
+        nearest, distance = _EMPTY, 0
+        for i in range(2 * NUM_HASHES - 1, -1, -1):
+            v = filled[i % NUM_HASHES]
+            if v != _EMPTY:
+                nearest, distance = v, 0
+            else:
+                distance += 1
+                if i < NUM_HASHES and nearest != _EMPTY:
+                    sig[i] = nearest + distance * (_VALUE_MASK + 1)
+    return tuple(sig)
+
+
+def similarity(a: tuple, b: tuple) -> float:
+    return sum(map(operator.eq, a, b)) / NUM_HASHES
+
+
+def _name_similarity(a: str, b: str) -> float:
+    ta, tb = _trigrams(a), _trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta and tb else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    signature: tuple
+    name: str
+    email: str
+    local: str
+    local_digits: str
+    phone: str
+    bands: tuple
+
+
+class DuplicateIndex:
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, Applicant] = {}
+        self._reset_pending = False
+        self._entries: dict[str, _Entry] = {}
+        # Bucket key -> one ID, or a set once a second applicant lands there.
+        self._buckets: dict = {}
+        self._version = 0
+        self._sweep: Optional[tuple[int, dict]] = None
+
+    def on_change(self, kind: str, payload) -> None:
+        """``ApplicantStore.subscribe`` listener."""
+        with self._pending_lock:
+            if kind == "reset":
+                self._reset_pending = True
+                self._pending = {r.id: r for r in payload}
+            elif kind == "add":
+                self._pending[payload.id] = payload
+            elif kind == "update":
+                for before, after in payload:
+                    if (after.resume is not before.resume or after.email != before.email
+                            or after.phone != before.phone or after.first_name != before.first_name
+                            or after.last_name != before.last_name):
+                        self._pending[after.id] = after
+
+    # -- index maintenance --------------------------------------------------
+
+    def _drain(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            reset, self._reset_pending = self._reset_pending, False
+        if reset:
+            self._entries, self._buckets = {}, {}
+        if not pending and not reset:
+            return
+        was_enabled = gc.isenabled() and len(pending) > 10_000
+        if was_enabled:
+            gc.disable()
+        try:
+            for applicant_id, record in pending.items():
+                self._remove(applicant_id)
+                self._add(record)
+        finally:
+            if was_enabled:
+                gc.enable()
+        self._version += 1
+
+    @staticmethod
+    def _keys(sig: tuple, name: str, email: str, phone: str) -> tuple:
+        keys = [hash((band,) + sig[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+        if name:
+            keys.append(("name", name))
+        if email:
+            keys.append(("email", email))
+        if phone:
+            keys.append(("phone", phone))
+        return tuple(keys)
+
+    def _add(self, applicant: Applicant) -> None:
+        sig = signature(features(applicant))
+        name = normalize_name(applicant.first_name, applicant.last_name)
+        email, phone = normalize_email(applicant.email), normalize_phone(applicant.phone)
+        entry = _Entry(sig, name, email, *email_local_part(applicant.email), phone,
+                       self._keys(sig, name, email, phone))
+        self._entries[applicant.id] = entry
+        buckets = self._buckets
+        for key in entry.bands:
+            held = buckets.get(key)
+            if held is None:
+                buckets[key] = applicant.id
+            elif isinstance(held, set):
+                held.add(applicant.id)
+            else:
+                buckets[key] = {held, applicant.id}
+
+    def _remove(self, applicant_id: str) -> None:
+        entry = self._entries.pop(applicant_id, None)
+        if entry is None:
+            return
+        for key in entry.bands:
+            held = self._buckets.get(key)
+            if isinstance(held, set):
+                held.discard(applicant_id)
+                if len(held) == 1:
+                    self._buckets[key] = next(iter(held))
+            elif held == applicant_id:
+                del self._buckets[key]
+
+    # -- matching -----------------------------------------------------------
+
+    def _match(self, a_id: str, b_id: str) -> Optional[dict]:
+        a, b = self._entries[a_id], self._entries[b_id]
+        sim = similarity(a.signature, b.signature)
+        same_email = bool(a.email) and a.email == b.email
+        same_phone = bool(a.phone) and a.phone == b.phone
+        local_sim = 0.0
+        # Differently numbered variants of one address (``jake.morrison12`` / ``jake.morrison40``)
+        # are separate mailboxes, usually separate people; a number added to a plain one is not.
+        numbered_apart = a.local_digits and b.local_digits and a.local_digits != b.local_digits
+        if a.name and a.name == b.name and not same_email and not numbered_apart:
+            local_sim = _name_similarity(a.local, b.local)
+        similar_email = local_sim >= LOCAL_PART_THRESHOLD
+        if sim < self.threshold and not (same_email or same_phone or similar_email):
+            return None
+        name_sim = _name_similarity(a.name, b.name)
+        reasons = []
+        if same_email:
+            reasons.append("same email")
+        if same_phone:
+            reasons.append("same phone")
+        if name_sim >= 0.5:
+            reasons.append("same name" if a.name == b.name else f"similar name ({name_sim:.2f})")
+        if similar_email:
+            reasons.append(f"similar email ({local_sim:.2f})")
+        # Alike profiles of people with unrelated names are boilerplate resumes, not duplicates.
+        if not (reasons and (sim >= self.threshold or same_email or same_phone or similar_email)):
+            return None
+        reasons.append(f"profile similarity {sim:.2f}")
+        confidence = max(sim, 0.95 if same_email else 0.0, 0.85 if same_phone else 0.0,
+                         0.8 if similar_email else 0.0)
+        return {"id": b_id, "similarity": round(sim, 3), "confidence": round(confidence, 3), "reasons": reasons}
+
+    def candidates(self, applicant_id: str) -> list[dict]:
+        """Likely duplicates of one applicant, best first; touches only its bucket mates."""
+        with self._lock:
+            self._drain()
+            entry = self._entries.get(applicant_id)
+            if entry is None:
+                return []
+            mates = set()
+            for key in entry.bands:
+                held = self._buckets.get(key)
+                if isinstance(held, set):
+                    mates |= held
+            mates.discard(applicant_id)
+            matches = [m for m in (self._match(applicant_id, other) for other in mates) if m]
+        return sorted(matches, key=lambda m: m["confidence"], reverse=True)
+
+    def sweep(self) -> dict:
+        """Every confirmed duplicate pair in the store, found bucket by bucket. Cached until the index changes."""
+        with self._lock:
+            self._drain()
+            if self._sweep is not None and self._sweep[0] == self._version:
+                return self._sweep[1]
+            t0 = time.perf_counter()
+            seen: set = set()
+            pairs: dict[tuple, dict] = {}
+            for key, held in self._buckets.items():
+                if not isinstance(held, set):
+                    continue
+                members = sorted(held)
+                capped = isinstance(key, int) or key[0] == "name"
+                if capped and len(members) * (len(members) - 1) // 2 > MAX_BUCKET_PAIRS:
+                    continue
+                for i, a in enumerate(members):
+                    for b in members[i + 1:]:
+                        if (a, b) in seen:
+                            continue
+                        seen.add((a, b))
+                        match = self._match(a, b)
+                        if match:
+                            pairs[a, b] = match
+            result = {"pairs": pairs, "checked": len(seen), "seconds": round(time.perf_counter() - t0, 4)}
+            self._sweep = (self._version, result)
+            return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._drain()
+            return {"applicants": len(self._entries), "buckets": len(self._buckets)}
+
+
+def merge_suggestions(pairs: dict[tuple, dict], get: Callable[[str], Optional[Applicant]],
+                      min_confidence: float = 0.0) -> list[dict]:
+    """Group confirmed pairs into clusters, each with the record to keep and the ones to merge into it.
+
+    The keeper is the earliest application, preferring synced records over uploads.
+    """
+    parent: dict[str, str] = {}
+
+    def root(x: str) -> str:
+        while parent.get(x, x) != x:
+            parent[x] = parent.get(parent[x], parent[x])
+            x = parent[x]
+        return x
+
+    kept = {k: m for k, m in pairs.items() if m["confidence"] >= min_confidence}
+    for a, b in kept:
+        parent.setdefault(a, a)
+        parent.setdefault(b, b)
+        parent[root(a)] = root(b)
+    clusters: dict[str, list[str]] = {}
+    for x in parent:
+        clusters.setdefault(root(x), []).append(x)
+
+    out = []
+    for members in clusters.values():
+        records = [r for r in map(get, members) if r is not None]
+        if len(records) < 2:
+            continue
+        keep = min(records, key=lambda r: (r.applied_date, r.id.startswith("PAY-UPL-"), r.id))
+        merge = []
+        for r in records:
+            if r.id == keep.id:
+                continue
+            match = kept.get((keep.id, r.id)) or kept.get((r.id, keep.id))
+            merge.append({
+                "id": r.id, "name": r.name, "email": r.email,
+                "confidence": match["confidence"] if match else None,
+                "reasons": match["reasons"] if match else ["linked through another duplicate"],
+            })
+        merge.sort(key=lambda m: m["confidence"] or 0, reverse=True)
+        out.append({"keep": {"id": keep.id, "name": keep.name, "email": keep.email}, "merge": merge})
+    out.sort(key=lambda g: max((m["confidence"] or 0) for m in g["merge"]), reverse=True)
+    return out
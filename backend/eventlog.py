@@ -0,0 +1,418 @@
+"""Append-only applicant event log with periodic snapshots.
+
+Opt in with ``HR_DATA_DIR``. Every committed store change is appended as one
+compact JSON line to ``events-<first seq>.ndjson``::
+
+    {"seq":42,"ts":"2026-03-05T08:00:00Z","type":"booked","id":"PAY-0007","from":"awaiting_reply","changes":{...}}
+
+Event types are ``reset``, ``created``, ``scored``, ``status_changed``,
+``emailed``, ``booked``, ``responded`` and ``updated``. Update events carry the
+new value of every changed field, so replaying an event twice is harmless.
+
+The store calls its listeners while it holds a lock, so ``EventLog`` only
+queues each change there. A log thread turns queued changes into events and
+writes them, one write (and one fsync with ``HR_EVENTLOG_FSYNC=1``) per drained
+batch, so writers never wait on the disk. Queue order is commit order, and
+sequence numbers are assigned in that order. ``flush`` waits for the queue to
+drain; reads of the log do that first (for at most ``HR_EVENTLOG_FLUSH_TIMEOUT``
+seconds), and a crash loses at most the changes still queued. A failed write is
+rolled back and the batch stays queued, retried with backoff, so the log never
+skips a change. Meanwhile ``error`` says why, ``flush`` returns False and
+``pending`` counts what is waiting.
+
+Every ``HR_SNAPSHOT_EVERY`` events the log rolls over to a new segment, and a
+background thread writes ``snapshot-<seq>.bin`` in the compact fixture format
+(see ``fixtures.py``). Startup maps the newest snapshot and replays only the
+segments after it, so restart time is bounded by the snapshot interval rather
+than by total history. Older segments are kept as
+the audit trail. ``history`` finds one applicant's events through an offset
+index built on first use and kept up to date by every append.
+"""
+import collections
+import glob
+import json
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from dataclasses import fields
+from typing import Iterator, Optional
+
+import fixtures
+from records import Applicant, Resume
+from store import ApplicantStore
+
+SNAPSHOT_EVERY = int(os.environ.get("HR_SNAPSHOT_EVERY", "50000"))
+FSYNC = os.environ.get("HR_EVENTLOG_FSYNC", "") == "1"
+KEEP_SNAPSHOTS = 2
+FLUSH_TIMEOUT = float(os.environ.get("HR_EVENTLOG_FLUSH_TIMEOUT", "2"))
+MAX_RETRY_DELAY = 5.0
+
+_FIELDS = tuple(f.name for f in fields(Applicant) if f.name != "id")
+_log = logging.getLogger("uvicorn.error")
+# The applicant id that follows an event's type; ``created`` records carry their own id later on.
+_EVENT_ID = re.compile(rb'^\{"seq":\d+,"ts":"[^"]*","type":"\w+","id":("(?:[^"\\]|\\.)*")')
+# Index entries pack (segment number, byte offset) into one integer.
+_OFFSET_BITS = 40
+
+
+def _dumps(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _changes(before: Applicant, after: Applicant) -> dict:
+    out = {}
+    for name in _FIELDS:
+        value = getattr(after, name)
+        if value is not getattr(before, name) and value != getattr(before, name):
+            out[name] = value.value if name == "status" else value.to_dict() if name == "resume" else value
+    return out
+
+
+def _update_type(after: Applicant, changes: dict) -> str:
+    if "response_data" in changes and after.response_data is not None:
+        return "responded"
+    if "calendar_event" in changes and after.calendar_event is not None:
+        return "booked"
+    if "email_sent_at" in changes:
+        return "emailed"
+    if "status" in changes:
+        return "status_changed"
+    return "updated"
+
+
+def _apply_changes(record: Applicant, changes: dict) -> Applicant:
+    if "resume" in changes:
+        changes = {**changes, "resume": Resume.from_dict(changes["resume"])}
+    return record.with_changes(**changes)
+
+
+def _seq_of(path: str) -> int:
+    return int(os.path.basename(path).split("-", 1)[1].split(".", 1)[0])
+
+
+class EventLog:
+    def __init__(self, directory: str, snapshot_every: int = SNAPSHOT_EVERY, fsync: bool = FSYNC):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.seq = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._path: Optional[str] = None
+        self._store: Optional[ApplicantStore] = None
+        self._since_snapshot = 0
+        self._snapshot_thread: Optional[threading.Thread] = None
+        # Store changes waiting for the log thread, and how many were queued / written so far.
+        self._queue: collections.deque = collections.deque()
+        self._queued = self._drained = 0
+        self._cond = threading.Condition()
+        self._closing = False
+        self._writer: Optional[threading.Thread] = None
+        # Why the last write failed, while its batch waits for a retry; None when writes succeed.
+        self.error: Optional[str] = None
+        self.failures = 0
+        self._attempts = 0
+        # Applicant id -> packed (segment, offset) of each of its events; built by ``history``.
+        self._index: Optional[dict[str, array]] = None
+        self._indexed_segments: list[str] = []
+        os.makedirs(directory, exist_ok=True)
+
+    def _segments(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "events-*.ndjson")), key=_seq_of)
+
+    def _snapshots(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "snapshot-*.bin")), key=_seq_of)
+
+    # -- startup ------------------------------------------------------------
+
+    def open(self, store: ApplicantStore) -> dict:
+        """Load the newest snapshot and later events into ``store``, then log its changes."""
+        t0 = time.perf_counter()
+        snapshot_seq, records, scores = self._load_snapshot()
+        replayed, tail = 0, []
+        for event in self._read(after=snapshot_seq, tail=tail):
+            replayed += 1
+            self.seq = event["seq"]
+            kind, applicant_id = event["type"], event.get("id")
+            if kind == "reset":
+                records, scores = {}, {}
+            elif kind == "created":
+                records[applicant_id] = Applicant.from_dict(event["record"])
+            elif kind == "scored":
+                if applicant_id in records:
+                    scores[applicant_id] = event["score"]
+            elif applicant_id in records:
+                records[applicant_id] = _apply_changes(records[applicant_id], event.get("changes", {}))
+        self.seq = max(self.seq, snapshot_seq)
+        fresh = snapshot_seq == 0 and replayed == 0
+        if not fresh:
+            store.reset(records.values())
+            for applicant_id, result in scores.items():
+                store.set_score(applicant_id, result)
+
+        if tail:
+            path, valid_bytes = tail
+            with open(path, "r+b") as f:
+                f.truncate(valid_bytes)  # drop a line cut short by a crash
+        else:
+            path = self._segment_path(self.seq + 1)
+        self._path = path
+        self._file = open(path, "ab")
+        self._store = store
+        self._writer = threading.Thread(target=self._run, name="hr-eventlog", daemon=True)
+        self._writer.start()
+        store.subscribe(self._on_change)
+        if fresh:
+            self._on_change("reset", store.snapshot())
+        return {
+            "snapshot_seq": snapshot_seq, "replayed": replayed, "seq": self.seq,
+            "seconds": round(time.perf_counter() - t0, 4),
+        }
+
+    def _load_snapshot(self) -> tuple[int, dict, dict]:
+        for path in reversed(self._snapshots()):
+            try:
+                meta, records, scores = fixtures.load(path)
+            except (OSError, ValueError):
+                continue
+            return meta["seq"], {r.id: r for r in records}, scores
+        return 0, {}, {}
+
+    def _read(self, after: int = 0, tail: Optional[list] = None) -> Iterator[dict]:
+        """Events with ``seq > after``. ``tail`` is set to ``[last segment, bytes of complete lines]``."""
+        segments = self._segments()
+        for i, path in enumerate(segments):
+            if i + 1 < len(segments) and _seq_of(segments[i + 1]) <= after + 1:
+                continue
+            pos = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    pos += len(line)
+                    event = json.loads(line)
+                    if event["seq"] > after:
+                        yield event
+            if tail is not None:
+                tail[:] = [path, pos]
+
+    def _segment_path(self, first_seq: int) -> str:
+        return os.path.join(self.directory, f"events-{first_seq:012d}.ndjson")
+
+    # -- appending ----------------------------------------------------------
+
+    def _on_change(self, kind: str, payload) -> None:
+        """``ApplicantStore.subscribe`` listener; runs under the store's locks, so it only queues."""
+        with self._cond:
+            self._queue.append((kind, payload))
+            self._queued += 1
+            self._cond.notify_all()
+
+    @property
+    def pending(self) -> int:
+        """Changes queued but not yet written."""
+        return self._queued - self._drained
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every change queued so far is written; False on timeout or once a write attempt fails."""
+        with self._cond:
+            target, attempts = self._queued, self._attempts
+            self._cond.wait_for(
+                lambda: (self._drained >= target or self._writer is None
+                         or (self.error is not None and self._attempts > attempts)),
+                timeout,
+            )
+            return self._drained >= target
+
+    def _run(self) -> None:
+        delay = 0.0
+        while True:
+            with self._cond:
+                if delay:
+                    self._cond.wait_for(lambda: self._closing, delay)
+                self._cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+            try:
+                events = [e for kind, payload in batch for e in self._events(kind, payload)]
+                if events:
+                    self._append(events, roll=any(kind == "reset" for kind, _ in batch))
+            except Exception as e:
+                self.failures += 1
+                with self._cond:
+                    self._attempts += 1
+                    if self._closing:
+                        _log.exception("Event log write failed at shutdown; %d change(s) not logged",
+                                       len(batch) + len(self._queue))
+                        return
+                    # Put the batch back in front of anything queued since, so order is kept.
+                    self._queue.extendleft(reversed(batch))
+                    self.error = f"{type(e).__name__}: {e}"
+                    self._cond.notify_all()
+                delay = min(MAX_RETRY_DELAY, delay * 2 or 0.1)
+                _log.exception("Event log write failed; retrying %d change(s) in %.1fs", len(batch), delay)
+                continue
+            delay = 0.0
+            with self._cond:
+                self._attempts += 1
+                self.error = None
+                self._drained += len(batch)
+                self._cond.notify_all()
+
+    @staticmethod
+    def _events(kind: str, payload) -> list[dict]:
+        if kind == "reset":
+            events = [{"type": "reset", "count": len(payload)}]
+            events += [{"type": "created", "id": r.id, "record": r.to_dict()} for r in payload]
+        elif kind == "add":
+            events = [{"type": "created", "id": payload.id, "record": payload.to_dict()}]
+        elif kind == "score":
+            events = [{"type": "scored", "id": payload[0], "score": payload[1]}]
+        else:
+            events = []
+            for before, after in payload:
+                changes = _changes(before, after)
+                if not changes:
+                    continue
+                event = {"type": _update_type(after, changes), "id": after.id}
+                if "status" in changes:
+                    event["from"] = before.status.value
+                event["changes"] = changes
+                events.append(event)
+        return events
+
+    def _append(self, events: list[dict], roll: bool = False) -> None:
+        """Write ``events`` as the next sequence numbers, all or none of them."""
+        ts = _now()
+        with self._lock:
+            if self._file.closed:
+                self._file = open(self._path, "ab")  # a rewind could not reopen it
+            lines = [_dumps({"seq": self.seq + i, "ts": ts, **event}) for i, event in enumerate(events, 1)]
+            start = self._file.tell()
+            try:
+                self._file.write(b"\n".join(lines) + b"\n")
+                self._file.flush()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+            except BaseException:
+                self._rewind(start)
+                raise
+            self.seq += len(lines)
+            if self._index is not None:
+                self._index_lines(self._path, start, lines)
+            self._since_snapshot += len(lines)
+            if roll or self._since_snapshot >= self.snapshot_every:
+                self._roll()
+
+    def _rewind(self, position: int) -> None:
+        """Drop a partly written batch so its retry starts on a clean line."""
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        with open(self._path, "r+b") as f:
+            f.truncate(position)
+        self._file = open(self._path, "ab")
+
+    def _roll(self) -> None:
+        """Start a new segment and snapshot the store as of ``self.seq`` in the background."""
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+        self._file.close()
+        self._path = self._segment_path(self.seq + 1)
+        self._file = open(self._path, "ab")
+        self._since_snapshot = 0
+        # Writers commit before they log, so a copy taken after this point holds every
+        # event up to ``seq``; any later ones it also holds are harmless to replay.
+        self._snapshot_thread = threading.Thread(
+            target=self._write_snapshot, args=(self.seq,), name="hr-snapshot", daemon=True,
+        )
+        self._snapshot_thread.start()
+
+    def _write_snapshot(self, seq: int) -> None:
+        records, scores = self._store.snapshot(), self._store.scores_snapshot()
+        path = os.path.join(self.directory, f"snapshot-{seq:012d}.bin")
+        fixtures.dump(path, records, scores, meta={"seq": seq, "ts": _now()})
+        for old in self._snapshots()[:-KEEP_SNAPSHOTS]:
+            os.remove(old)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # -- audit --------------------------------------------------------------
+
+    def _index_lines(self, path: str, offset: int, lines: list[bytes]) -> None:
+        if not self._indexed_segments or self._indexed_segments[-1] != path:
+            self._indexed_segments.append(path)
+        segment = (len(self._indexed_segments) - 1) << _OFFSET_BITS
+        for line in lines:
+            match = _EVENT_ID.match(line)
+            if match:
+                applicant_id = json.loads(match.group(1))
+                entries = self._index.get(applicant_id)
+                if entries is None:
+                    entries = self._index[applicant_id] = array("q")
+                entries.append(segment | offset)
+            offset += len(line) + 1
+
+    def _build_index(self) -> None:
+        """Scan every segment once; later appends keep the index current. Holds ``_lock``."""
+        self._index, self._indexed_segments = {}, []
+        for path in self._segments():
+            with open(path, "rb") as f:
+                lines = [line[:-1] for line in f if line.endswith(b"\n")]
+            self._index_lines(path, 0, lines)
+
+    def history(self, applicant_id: str, limit: int = 500) -> list[dict]:
+        """Logged events for one applicant, oldest first (the last ``limit``)."""
+        self.flush(FLUSH_TIMEOUT)
+        with self._lock:
+            if self._index is None:
+                self._build_index()
+            entries = self._index.get(applicant_id, ())[-limit:] if limit > 0 else ()
+            segments = list(self._indexed_segments)
+        out = []
+        mask = (1 << _OFFSET_BITS) - 1
+        current, f = None, None
+        try:
+            for entry in entries:
+                path = segments[entry >> _OFFSET_BITS]
+                if path != current:
+                    if f is not None:
+                        f.close()
+                    current, f = path, open(path, "rb")
+                f.seek(entry & mask)
+                out.append(json.loads(f.readline()))
+        finally:
+            if f is not None:
+                f.close()
+        return out
+
+    def tail(self, after: int = 0, limit: int = 500) -> list[dict]:
+        self.flush(FLUSH_TIMEOUT)
+        out = []
+        for event in self._read(after):
+            out.append(event)
+            if len(out) >= limit:
+                break
+        return out
@@ -0,0 +1,101 @@
+"""Compact store fixtures for fast cold starts.
+
+A fixture holds a short header and a ``marshal``-encoded ``(meta, rows,
+scores)`` triple, with one flat tuple per applicant. Loading maps the file
+and decodes straight from the mapping. Cyclic GC is paused while the records
+are rebuilt; with large fixtures, constructing the records takes most of the
+time. Load only fixtures you built yourself: marshal does not defend against
+malicious input.
+
+    python fixtures.py build fixture.bin                  # the mock applicants
+    python fixtures.py build fixture.bin --count 100000   # seeded synthetic.py applicants
+    HR_FIXTURE=fixture.bin uvicorn main:app --port 8787
+"""
+import argparse
+import gc
+import marshal
+import mmap
+import os
+import time
+
+from records import _AVAILABILITY, Applicant, Experience, Resume, Status
+
+MAGIC = b"HRFX1" + bytes([marshal.version]) + b"\n"
+
+
+def _row(a: Applicant) -> tuple:
+    r = a.resume
+    av = r.availability
+    return (
+        a.id, a.first_name, a.last_name, a.email, a.phone, a.location, a.distance_miles, a.applied_date,
+        a.status.value, r.summary, tuple((e.title, e.company, e.years, e.ski_related) for e in r.experience),
+        r.certifications, (av.weekends, av.holidays, av.early_am), r.skills,
+        a.email_sent_at, a.calendar_event, a.response_data,
+    )
+
+
+def dump(path: str, records, scores: dict = None, meta: dict = None) -> None:
+    payload = marshal.dumps((meta or {}, [_row(a) for a in records], scores or {}))
+    with open(path + ".tmp", "wb") as f:
+        f.write(MAGIC)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def load(path: str) -> tuple[dict, list[Applicant], dict]:
+    """``(meta, records, scores)``; raises ``ValueError`` for a foreign or truncated file."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a fixture for this Python version")
+        with memoryview(mm) as view:
+            try:
+                meta, rows, scores = marshal.loads(view[len(MAGIC):])
+            except (EOFError, TypeError) as e:
+                raise ValueError(f"{path} is truncated or corrupt") from e
+    status = {s.value: s for s in Status}
+    experiences: dict[tuple, Experience] = {}
+    records = []
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for (aid, first, last, email, phone, location, distance, applied, st,
+             summary, experience, certifications, availability, skills, sent_at, event, response) in rows:
+            resume = Resume(
+                summary,
+                tuple(experiences.get(e) or experiences.setdefault(e, Experience(*e)) for e in experience),
+                certifications, _AVAILABILITY[availability], skills,
+            )
+            records.append(Applicant(aid, first, last, email, phone, location, distance, applied, status[st],
+                                     resume, sent_at, event, response))
+    finally:
+        if was_enabled:
+            gc.enable()
+    return meta, records, scores
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Build a store fixture")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build")
+    build.add_argument("path")
+    build.add_argument("--count", type=int, default=0, help="synthetic applicants (default: the mock set)")
+    build.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.count:
+        from synthetic import generate_records
+        records = list(generate_records(args.count, args.seed))
+    else:
+        from mock_data import APPLICANTS
+        records = [Applicant.from_dict(a) for a in APPLICANTS]
+    dump(args.path, records, meta={"built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())})
+    t0 = time.perf_counter()
+    _, loaded, _ = load(args.path)
+    print(f"Wrote {len(loaded)} applicants to {args.path} ({os.path.getsize(args.path) / 1e6:.1f} MB); "
+          f"loads in {time.perf_counter() - t0:.3f}s")
+
+
+if __name__ == "__main__":
+    main_cli()
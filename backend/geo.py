@@ -0,0 +1,285 @@
+"""Offline geocoding and a grid index for proximity and radius queries.
+
+``Geocoder`` resolves free-text locations ("Vail, CO", "glenwood springs
+colorado 81601") against a gazetteer of US places. The bundled
+``gazetteer.tsv`` covers the resort's hiring area and major US cities. Point
+``HR_GAZETTEER`` at the Census Bureau national places file
+(``*_Gaz_place_national.txt``) for every incorporated place and CDP. Each
+distinct location string is resolved once and cached, so a store of 100k
+applicants costs one lookup per town.
+
+``RadiusIndex`` follows the store like the relevance index. It buckets the
+resolved places of all applicants into a lat/lon grid, so "within 25 miles of
+X" checks only the cells overlapping the circle. The places in those cells are
+then measured with one batch haversine, which uses numpy when it is installed.
+"""
+import csv
+import math
+import os
+import re
+import threading
+from typing import NamedTuple, Optional, Sequence
+
+from records import Applicant
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GAZETTEER_PATH = os.environ.get("HR_GAZETTEER") or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                 "gazetteer.tsv")
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE = 69.09
+CELL_DEGREES = 0.25
+_MAX_CACHED_LOCATIONS = 100_000
+
+STATES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA", "colorado": "CO",
+    "connecticut": "CT", "delaware": "DE", "district of columbia": "DC", "florida": "FL", "georgia": "GA",
+    "hawaii": "HI", "idaho": "ID", "illinois": "IL", "indiana": "IN", "iowa": "IA", "kansas": "KS",
+    "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD", "massachusetts": "MA",
+    "michigan": "MI", "minnesota": "MN", "mississippi": "MS", "missouri": "MO", "montana": "MT",
+    "nebraska": "NE", "nevada": "NV", "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM",
+    "new york": "NY", "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK",
+    "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC", "south dakota": "SD",
+    "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA", "washington": "WA",
+    "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY", "puerto rico": "PR",
+}
+_STATE_CODES = {code.lower(): code for code in STATES.values()}
+_ZIP = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+_COUNTRY = re.compile(r",?\s*\b(?:usa|u\.s\.a\.|us|united states(?: of america)?)\s*$")
+# Census names carry the legal type in lower case: "Vail town", "Edwards CDP", "Denver city".
+_CENSUS_SUFFIX = re.compile(r"(?:\s+(?:[a-z()/-]+|CDP))+$")
+
+
+class Place(NamedTuple):
+    name: str
+    state: str
+    lat: float
+    lon: float
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}, {self.state}"
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "state": self.state, "lat": self.lat, "lon": self.lon}
+
+
+def _key(name: str) -> str:
+    name = name.lower().replace("saint ", "st ").replace("st. ", "st ").replace("mount ", "mt ")
+    return " ".join(re.findall(r"[a-z0-9]+", name))
+
+
+def _state(text: str) -> Optional[str]:
+    text = text.strip().lower().rstrip(".")
+    return _STATE_CODES.get(text) or STATES.get(text)
+
+
+def load_gazetteer(path: str) -> list[Place]:
+    """Places from the bundled TSV (name, state, lat, lon) or a Census gazetteer file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = csv.reader(f, delimiter="\t")
+        header = [h.strip() for h in next(rows)]
+        if "INTPTLAT" in header:
+            cols = (header.index("NAME"), header.index("USPS"), header.index("INTPTLAT"), header.index("INTPTLONG"))
+        else:
+            cols = (header.index("name"), header.index("state"), header.index("lat"), header.index("lon"))
+        places = []
+        for row in rows:
+            if len(row) < len(header):
+                continue
+            name, state, lat, lon = (row[i].strip() for i in cols)
+            places.append(Place(_CENSUS_SUFFIX.sub("", name), state, float(lat), float(lon)))
+    return places
+
+
+def haversine_miles(lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]) -> list[float]:
+    """Great-circle miles from one point to each of many."""
+    if not lats:
+        return []
+    if numpy is not None:
+        la, lo = numpy.radians(numpy.asarray(lats, dtype=float)), numpy.radians(numpy.asarray(lons, dtype=float))
+        lat0, lon0 = math.radians(lat), math.radians(lon)
+        h = numpy.sin((la - lat0) / 2) ** 2 + math.cos(lat0) * numpy.cos(la) * numpy.sin((lo - lon0) / 2) ** 2
+        return (2 * EARTH_RADIUS_MILES * numpy.arcsin(numpy.sqrt(numpy.minimum(h, 1.0)))).tolist()
+    lat0, lon0 = math.radians(lat), math.radians(lon)
+    cos0, sin, cos, asin, sqrt, rad = math.cos(lat0), math.sin, math.cos, math.asin, math.sqrt, math.radians
+    out = []
+    for la, lo in zip(lats, lons):
+        la, lo = rad(la), rad(lo)
+        h = sin((la - lat0) / 2) ** 2 + cos0 * cos(la) * sin((lo - lon0) / 2) ** 2
+        out.append(2 * EARTH_RADIUS_MILES * asin(sqrt(min(h, 1.0))))
+    return out
+
+
+class Geocoder:
+    def __init__(self, home: str, path: str = GAZETTEER_PATH):
+        self._path = path
+        self._lock = threading.Lock()
+        self._by_name: Optional[dict[str, list[Place]]] = None
+        self._cache: dict[str, Optional[Place]] = {}
+        self.hits = self.misses = self.unresolved = 0
+        self._home_text = home
+        self._home: Optional[Place] = None
+
+    def _places(self) -> dict[str, list[Place]]:
+        # Loaded on first use so startup does not pay for a 30k-row Census file.
+        if self._by_name is None:
+            by_name: dict[str, list[Place]] = {}
+            for place in load_gazetteer(self._path):
+                by_name.setdefault(_key(place.name), []).append(place)
+            self._by_name = by_name
+        return self._by_name
+
+    @property
+    def home(self) -> Optional[Place]:
+        """The job's own location, which distances are measured from."""
+        if self._home is None:
+            with self._lock:
+                self._load_home()
+        return self._home
+
+    def _load_home(self) -> None:
+        if self._home is None:
+            self._home = self._lookup(self._home_text)
+
+    def resolve(self, location: str) -> Optional[Place]:
+        """The gazetteer place a location string names, or None; cached per distinct string."""
+        location = location or ""
+        try:
+            place = self._cache[location]
+            self.hits += 1
+            return place
+        except KeyError:
+            pass
+        with self._lock:
+            self._load_home()
+            place = self._lookup(location)
+            if len(self._cache) < _MAX_CACHED_LOCATIONS:
+                self._cache[location] = place
+            self.misses += 1
+            if place is None:
+                self.unresolved += 1
+        return place
+
+    def _lookup(self, location: str) -> Optional[Place]:
+        text = _COUNTRY.sub("", _ZIP.sub(" ", location.lower())).strip(" ,")
+        if not text:
+            return None
+        parts = [p.strip() for p in text.split(",") if p.strip()]
+        state = _state(parts[-1]) if len(parts) > 1 else None
+        name = parts[0]
+        if state is None and len(parts) == 1:
+            # "vail co", "glenwood springs colorado", "new york new york"
+            words = name.split()
+            for n in (2, 1):
+                if len(words) > n and _state(" ".join(words[-n:])):
+                    state, name = _state(" ".join(words[-n:])), " ".join(words[:-n])
+                    break
+        candidates = self._places().get(_key(name), [])
+        if state is not None:
+            candidates = [p for p in candidates if p.state == state]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        # "Aurora" alone: the namesake nearest the job is the one a local applicant means.
+        home = self._home
+        if home is None:
+            return candidates[0]
+        miles = haversine_miles(home.lat, home.lon, [p.lat for p in candidates], [p.lon for p in candidates])
+        return candidates[miles.index(min(miles))]
+
+    def miles_from_home(self, place: Place) -> Optional[float]:
+        home = self.home
+        if home is None:
+            return None
+        return haversine_miles(home.lat, home.lon, [place.lat], [place.lon])[0]
+
+    def stats(self) -> dict:
+        return {"cached": len(self._cache), "hits": self.hits, "misses": self.misses, "unresolved": self.unresolved}
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return int(math.floor(lat / CELL_DEGREES)), int(math.floor(lon / CELL_DEGREES))
+
+
+class RadiusIndex:
+    def __init__(self, geocoder: Geocoder):
+        self._geo = geocoder
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, Applicant] = {}
+        self._reset_pending = False
+        self._where: dict[str, Place] = {}
+        self._unresolved: set[str] = set()
+        self._at: dict[Place, set[str]] = {}
+        self._cells: dict[tuple[int, int], set[Place]] = {}
+
+    def on_change(self, kind: str, payload) -> None:
+        """``ApplicantStore.subscribe`` listener."""
+        with self._pending_lock:
+            if kind == "reset":
+                self._reset_pending = True
+                self._pending = {r.id: r for r in payload}
+            elif kind == "add":
+                self._pending[payload.id] = payload
+            elif kind == "update":
+                for before, after in payload:
+                    if after.location != before.location:
+                        self._pending[after.id] = after
+
+    def _drain(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            reset, self._reset_pending = self._reset_pending, False
+        if reset:
+            self._where, self._unresolved, self._at, self._cells = {}, set(), {}, {}
+        for applicant_id, record in pending.items():
+            self._remove(applicant_id)
+            place = self._geo.resolve(record.location)
+            if place is None:
+                self._unresolved.add(applicant_id)
+                continue
+            self._where[applicant_id] = place
+            ids = self._at.get(place)
+            if ids is None:
+                ids = self._at[place] = set()
+                self._cells.setdefault(_cell(place.lat, place.lon), set()).add(place)
+            ids.add(applicant_id)
+
+    def _remove(self, applicant_id: str) -> None:
+        self._unresolved.discard(applicant_id)
+        place = self._where.pop(applicant_id, None)
+        if place is None:
+            return
+        ids = self._at[place]
+        ids.discard(applicant_id)
+        if not ids:
+            del self._at[place]
+            cell = self._cells[_cell(place.lat, place.lon)]
+            cell.discard(place)
+            if not cell:
+                del self._cells[_cell(place.lat, place.lon)]
+
+    def within(self, center: Place, miles: float) -> list[tuple[str, float]]:
+        """(applicant id, miles) for every applicant within ``miles`` of ``center``, nearest first."""
+        dlat = miles / MILES_PER_DEGREE
+        dlon = miles / (MILES_PER_DEGREE * max(0.01, math.cos(math.radians(min(89.0, abs(center.lat) + dlat)))))
+        (i0, j0), (i1, j1) = _cell(center.lat - dlat, center.lon - dlon), _cell(center.lat + dlat, center.lon + dlon)
+        with self._lock:
+            self._drain()
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+                places = list(self._at)
+            else:
+                places = [p for i in range(i0, i1 + 1) for j in range(j0, j1 + 1) for p in self._cells.get((i, j), ())]
+            distances = haversine_miles(center.lat, center.lon, [p.lat for p in places], [p.lon for p in places])
+            hits = [(aid, d) for p, d in zip(places, distances) if d <= miles for aid in self._at[p]]
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._drain()
+            return {"located": len(self._where), "unresolved": len(self._unresolved),
+                    "places": len(self._at), "cells": len(self._cells)}
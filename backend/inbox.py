@@ -0,0 +1,192 @@
+"""Ingest candidate replies from a local Maildir or mbox.
+
+Each poll reads only messages it has not seen (past a byte offset for mbox; for
+Maildir, base names not yet read), matches them to applicants by sender address,
+scores them in batches and writes ``response_data`` with one ``update_many`` per
+batch. A Maildir base name is the file name before ``:``, which stays the same
+when a mail client moves the message from ``new/`` to ``cur/`` and adds flags.
+The state is saved next to the mailbox so a restart resumes where the last poll
+stopped. A message that cannot be parsed (an unknown charset, a broken MIME
+structure) is logged, counted as ``failed`` and skipped like any other, so it
+never holds up the messages behind it.
+"""
+import email
+import email.policy
+import email.utils
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import timezone
+from typing import Callable, Iterator, Optional
+
+from store import ApplicantStore
+
+BATCH_SIZE = int(os.environ.get("HR_INBOX_BATCH", "500"))
+
+_log = logging.getLogger("uvicorn.error")
+
+_QUOTE_HEADER = re.compile(r"^On .+ wrote:\s*$", re.MULTILINE)
+
+
+def _reply_text(msg) -> str:
+    part = msg.get_body(preferencelist=("plain",))
+    text = part.get_content() if part is not None else ""
+    match = _QUOTE_HEADER.search(text)
+    if match:
+        text = text[:match.start()]
+    return "\n".join(line for line in text.splitlines() if not line.startswith(">")).strip()
+
+
+def _received_at(msg) -> str:
+    try:
+        dt = email.utils.parsedate_to_datetime(msg["Date"])
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class InboxIngester:
+    def __init__(self, path: str, store: ApplicantStore, score_fn: Callable, batch_size: int = BATCH_SIZE,
+                 state_path: Optional[str] = None):
+        self.path = path
+        self.store = store
+        self.score_fn = score_fn
+        self.batch_size = batch_size
+        self.state_path = state_path or path.rstrip("/") + ".hwm.json"
+        self.high_water: Optional[int] = None
+        # Maildir base names already read; pruned to the ones still in the mailbox.
+        self.seen: set[str] = set()
+        self._legacy_mark: Optional[tuple] = None
+        self._load_state()
+        self._lock = threading.Lock()
+
+    @property
+    def is_maildir(self) -> bool:
+        return os.path.isdir(self.path)
+
+    def _load_state(self) -> None:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.seen = set(state.get("seen", ()))
+        mark = state.get("high_water")
+        if isinstance(mark, list):
+            # Older Maildir state: an (mtime_ns, filename) mark, converted on the next poll.
+            self._legacy_mark = tuple(mark)
+        else:
+            self.high_water = mark
+
+    def _save_state(self) -> None:
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"seen": sorted(self.seen)} if self.is_maildir else {"high_water": self.high_water}, f)
+        os.replace(tmp, self.state_path)
+
+    def _iter_maildir(self) -> Iterator[tuple[bytes, str]]:
+        entries = {}
+        for sub in ("new", "cur"):
+            folder = os.path.join(self.path, sub)
+            if not os.path.isdir(folder):
+                continue
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        base = entry.name.split(":", 1)[0]
+                        entries[base] = (entry.stat().st_mtime_ns, base, entry.path, entry.name)
+        if self._legacy_mark is not None:
+            self.seen.update(base for mtime_ns, base, _, name in entries.values()
+                             if (mtime_ns, name) <= self._legacy_mark)
+            self._legacy_mark = None
+        # A deleted message never comes back, so its name need not be kept.
+        self.seen.intersection_update(entries)
+        for mtime_ns, base, path, _ in sorted(entries.values()):
+            if base in self.seen:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                # Moved (new/ -> cur/) since the scan; the next poll finds it under its new name.
+                continue
+            yield raw, base
+
+    def _iter_mbox(self) -> Iterator[tuple[bytes, int]]:
+        if not os.path.exists(self.path):
+            return
+        pos = self.high_water or 0
+        with open(self.path, "rb") as f:
+            f.seek(pos)
+            current: list[bytes] = []
+            for line in f:
+                if line.startswith(b"From ") and current:
+                    yield b"".join(current[1:]), pos
+                    current = []
+                current.append(line)
+                pos += len(line)
+            # A trailing message without its closing blank line may still be being appended.
+            if current and current[-1] in (b"\n", b"\r\n"):
+                yield b"".join(current[1:]), pos
+
+    def _messages(self) -> Iterator[tuple[bytes, object]]:
+        """``(raw message, position)`` for every unread message: its Maildir base name, or the mbox offset past it."""
+        return self._iter_maildir() if self.is_maildir else self._iter_mbox()
+
+    def poll(self) -> dict:
+        """Process every new message once; safe to call from several threads."""
+        with self._lock:
+            stats = {"read": 0, "matched": 0, "unmatched": 0, "failed": 0}
+            batch: dict[str, dict] = {}
+            consumed = []
+            for raw, position in self._messages():
+                stats["read"] += 1
+                consumed.append(position)
+                try:
+                    msg = email.message_from_bytes(raw, policy=email.policy.default)
+                    _, addr = email.utils.parseaddr(msg.get("From", ""))
+                    applicant = self.store.find_by_email(addr) if addr else None
+                    if applicant is None and msg.get("X-HR-Applicant-Id"):
+                        applicant = self.store.get(msg["X-HR-Applicant-Id"].strip())
+                    text = _reply_text(msg)
+                    received_at = _received_at(msg)
+                except Exception:
+                    _log.warning("Skipping unreadable inbox message at %r", position, exc_info=True)
+                    stats["failed"] += 1
+                    continue
+                if applicant is None or not text:
+                    stats["unmatched"] += 1
+                    continue
+                stats["matched"] += 1
+                batch[applicant.id] = (applicant, text, received_at)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, consumed)
+                    batch, consumed = {}, []
+            self._flush(batch, consumed)
+            if self.is_maildir:
+                stats["seen"] = len(self.seen)
+            else:
+                stats["high_water"] = self.high_water
+            return stats
+
+    def _flush(self, batch: dict[str, tuple], consumed: list) -> None:
+        if batch:
+            scored = {
+                aid: {"text": text, "received_at": received_at, **self.score_fn(text, applicant)}
+                for aid, (applicant, text, received_at) in batch.items()
+            }
+            self.store.update_many({
+                aid: (lambda a, rd=rd: a.with_changes(response_data=rd)) for aid, rd in scored.items()
+            })
+        if not consumed:
+            return
+        if self.is_maildir:
+            self.seen.update(consumed)
+        else:
+            self.high_water = consumed[-1]
+        self._save_state()
@@ -0,0 +1,348 @@
+"""Background dispatch of rendered interview invites.
+
+``bulk_action`` renders invites and hands them to a ``Dispatcher``, which
+returns straight away. A small pool of worker threads, each holding one reusable
+SMTP connection, drains the queue in batches under a shared token-bucket rate
+limit. Transient failures (4xx replies, dropped connections) are retried with
+exponential backoff; 5xx replies fail the message at once. Every message keeps
+its own delivery state for ``/api/email/jobs/{id}``.
+
+Without ``HR_SMTP_HOST`` messages go to an in-memory ``NullTransport``. For
+local runs and tests, start the bundled SMTP sink and point the app at it:
+
+    python mailer.py --debug-server 8025
+    HR_SMTP_HOST=localhost HR_SMTP_PORT=8025 uvicorn main:app --port 8787
+"""
+import collections
+import heapq
+import itertools
+import os
+import random
+import smtplib
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from typing import Optional
+
+SMTP_HOST = os.environ.get("HR_SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("HR_SMTP_PORT", "25"))
+SMTP_USER = os.environ.get("HR_SMTP_USER", "")
+SMTP_PASSWORD = os.environ.get("HR_SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.environ.get("HR_SMTP_STARTTLS", "") == "1"
+SENDER = os.environ.get("HR_EMAIL_FROM", "Mountain Operations HR <hr@vailmountain.example>")
+RATE_PER_SECOND = float(os.environ.get("HR_EMAIL_RATE", "10"))
+BATCH_SIZE = int(os.environ.get("HR_EMAIL_BATCH", "50"))
+CONNECTIONS = int(os.environ.get("HR_SMTP_CONNECTIONS", "2"))
+MAX_ATTEMPTS = int(os.environ.get("HR_EMAIL_MAX_ATTEMPTS", "5"))
+BACKOFF_SECONDS = float(os.environ.get("HR_EMAIL_BACKOFF", "2"))
+MAX_JOBS = 200
+
+QUEUED, SENDING, RETRYING, SENT, FAILED = "queued", "sending", "retrying", "sent", "failed"
+
+
+@dataclass
+class OutboundMessage:
+    id: str
+    job_id: str
+    applicant_id: str
+    to: str
+    subject: str
+    body: str
+    state: str = QUEUED
+    attempts: int = 0
+    last_error: Optional[str] = None
+    sent_at: Optional[str] = None
+    next_attempt: float = field(default=0.0, repr=False)
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id, "applicant_id": self.applicant_id, "to": self.to, "state": self.state,
+            "attempts": self.attempts, "last_error": self.last_error, "sent_at": self.sent_at,
+        }
+
+
+class RateLimiter:
+    """Token bucket shared by all workers."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMTPTransport:
+    """One persistent SMTP connection, reopened on demand."""
+
+    def __init__(self, host: str, port: int, user: str = "", password: str = "", starttls: bool = False):
+        self.host, self.port = host, port
+        self.user, self.password, self.starttls = user, password, starttls
+        self._conn: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.starttls:
+            conn.starttls()
+        if self.user:
+            conn.login(self.user, self.password)
+        return conn
+
+    def send(self, msg: EmailMessage) -> None:
+        if self._conn is None:
+            self._conn = self._connect()
+        try:
+            self._conn.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._conn = None
+
+
+class NullTransport:
+    """Accepts every message; used when no SMTP server is configured."""
+
+    delivered: collections.deque = collections.deque(maxlen=1000)
+
+    def send(self, msg: EmailMessage) -> None:
+        self.delivered.append(msg)
+
+    def close(self) -> None:
+        pass
+
+
+def default_transport():
+    if SMTP_HOST:
+        return SMTPTransport(SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_STARTTLS)
+    return NullTransport()
+
+
+def permanent(error: Exception) -> bool:
+    """Whether a send error will recur on retry: a 5xx reply, or an SMTP error without a connection problem."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    # SMTPException subclasses OSError; plain OSErrors are socket trouble and worth another try.
+    return isinstance(error, smtplib.SMTPException) and not isinstance(error, smtplib.SMTPServerDisconnected)
+
+
+class Dispatcher:
+    def __init__(self, transport_factory=default_transport, rate: float = RATE_PER_SECOND, batch_size: int = BATCH_SIZE,
+                 connections: int = CONNECTIONS, max_attempts: int = MAX_ATTEMPTS, backoff: float = BACKOFF_SECONDS):
+        self.transport_factory = transport_factory
+        self.limiter = RateLimiter(rate)
+        self.batch_size = batch_size
+        self.connections = connections
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._ready: collections.deque[OutboundMessage] = collections.deque()
+        self._delayed: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._jobs: collections.OrderedDict[str, list[OutboundMessage]] = collections.OrderedDict()
+        self._workers: list[threading.Thread] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        with self._cond:
+            if self._workers:
+                return
+            self._stopping = False
+            for i in range(self.connections):
+                t = threading.Thread(target=self._run, name=f"hr-mailer-{i}", daemon=True)
+                t.start()
+                self._workers.append(t)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for t in self._workers:
+            t.join(timeout)
+        self._workers = []
+
+    def submit(self, messages: list[dict]) -> str:
+        """Queue ``{applicant_id, to, subject, body}`` dicts as one job; returns the job ID."""
+        job_id = uuid.uuid4().hex[:12]
+        outbound = [
+            OutboundMessage(id=f"{job_id}-{i}", job_id=job_id, applicant_id=m["applicant_id"], to=m["to"],
+                            subject=m["subject"], body=m["body"])
+            for i, m in enumerate(messages)
+        ]
+        with self._cond:
+            self._jobs[job_id] = outbound
+            while len(self._jobs) > MAX_JOBS:
+                self._jobs.popitem(last=False)
+            self._ready.extend(outbound)
+            self._cond.notify_all()
+        self.start()
+        return job_id
+
+    def job(self, job_id: str, include_messages: bool = False) -> Optional[dict]:
+        with self._cond:
+            messages = self._jobs.get(job_id)
+            if messages is None:
+                return None
+            counts = collections.Counter(m.state for m in messages)
+            out = {"id": job_id, "total": len(messages), "states": dict(counts),
+                   "done": counts[SENT] + counts[FAILED] == len(messages)}
+            if include_messages:
+                out["messages"] = [m.summary() for m in messages]
+            return out
+
+    def jobs(self) -> list[dict]:
+        with self._cond:
+            ids = list(reversed(self._jobs))
+        return [self.job(j) for j in ids]
+
+    def queue_depth(self) -> int:
+        return len(self._ready) + len(self._delayed)
+
+    def in_flight_jobs(self) -> int:
+        with self._cond:
+            return sum(1 for msgs in self._jobs.values() if any(m.state not in (SENT, FAILED) for m in msgs))
+
+    def _next_batch(self) -> Optional[list[OutboundMessage]]:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    self._ready.append(heapq.heappop(self._delayed)[2])
+                if self._ready:
+                    batch = [self._ready.popleft() for _ in range(min(self.batch_size, len(self._ready)))]
+                    for m in batch:
+                        m.state = SENDING
+                    return batch
+                if self._stopping:
+                    return None
+                timeout = self._delayed[0][0] - now if self._delayed else None
+                self._cond.wait(timeout)
+
+    def _run(self) -> None:
+        transport = self.transport_factory()
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                for m in batch:
+                    self.limiter.acquire()
+                    self._deliver(transport, m)
+        finally:
+            transport.close()
+
+    def _deliver(self, transport, m: OutboundMessage) -> None:
+        msg = EmailMessage()
+        msg["From"] = SENDER
+        msg["To"] = m.to
+        msg["Subject"] = m.subject
+        msg["X-HR-Applicant-Id"] = m.applicant_id
+        msg.set_content(m.body)
+        m.attempts += 1
+        try:
+            transport.send(msg)
+        except (smtplib.SMTPException, OSError) as e:
+            m.last_error = str(e)
+            if permanent(e) or m.attempts >= self.max_attempts:
+                m.state = FAILED
+                return
+            m.state = RETRYING
+            m.next_attempt = time.monotonic() + self.backoff * 2 ** (m.attempts - 1) * random.uniform(0.8, 1.2)
+            with self._cond:
+                heapq.heappush(self._delayed, (m.next_attempt, next(self._seq), m))
+                self._cond.notify()
+        else:
+            m.state, m.last_error = SENT, None
+            m.sent_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class _DebugSMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self) -> None:
+        self._reply("220 hr-debug-smtp ready")
+        rcpts: list[str] = []
+        sender = ""
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode("utf-8", "replace").strip()
+            verb = cmd[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self._reply("250 hr-debug-smtp")
+            elif verb == "MAIL":
+                sender, rcpts = cmd[10:].strip(), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                rcpts.append(cmd[8:].strip())
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if not chunk or chunk in (b".\r\n", b".\n"):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                self.server.messages.append({"from": sender, "to": rcpts, "data": b"".join(data)})
+                self._reply("250 OK: queued")
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class DebugSMTPServer(socketserver.ThreadingTCPServer):
+    """Minimal SMTP sink that keeps received messages in ``messages``."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8025):
+        super().__init__((host, port), _DebugSMTPHandler)
+        self.messages: list[dict] = []
+
+    def start(self) -> threading.Thread:
+        t = threading.Thread(target=self.serve_forever, name="hr-debug-smtp", daemon=True)
+        t.start()
+        return t
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--debug-server":
+        server = DebugSMTPServer(port=int(sys.argv[2]) if len(sys.argv) > 2 else 8025)
+        print(f"Debug SMTP server listening on {server.server_address[0]}:{server.server_address[1]}")
+        server.serve_forever()
+    else:
+        print(__doc__)
@@ -1,47 +1,306 @@
 import time
+
+_STARTED = time.perf_counter()
+
 import asyncio
-import copy
+import base64
+import heapq
+import json
+import logging
+import collections
+import gc
 import re
 import random
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
+import threading
+from contextlib import asynccontextmanager
+from typing import Iterator, Optional
+
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import os
 
-from mock_data import APPLICANTS, JOB_POSTING, score_applicant
-
-app = FastAPI(title="HR Resume Processing Demo")
+import mock_data
+from admission import Admission, AdmissionMiddleware
+from mailer import Dispatcher
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, MetricsMiddleware, timed
+from mock_data import JOB_POSTING, recommendation_for, score_applicant
+from pipeline import Effect, Pipeline, TransitionError, allowed_targets
+from profiling import ProfileBuffer, ProfilingMiddleware, authorized as profile_authorized
+from dedupe import DuplicateIndex, merge_suggestions
+from geo import Geocoder, RadiusIndex
+from relevance import RelevanceIndex, posting_text
+from records import STATUS_VALUES, Applicant, Resume, Status
+from scheduler import Scheduler
+from settings import DEFAULT_SETTINGS, SettingsSnapshot, SettingsStore, compile_template
+from serialization import FragmentCache, IdentityCache, encode, join_array, join_object, json_response, list_response
+from singleflight import AsyncSingleFlight, SingleFlight
+from snapshot import GenerationHeaderMiddleware, Publisher
+from store import ApplicantStore
+from uploads import Extractor, UploadRejected, detect_kind, spool
+
+# The event log and inbox modules are imported only when configured (see below).
+_IMPORTED = time.perf_counter()
+
+score_applicant = timed("score_applicant")(score_applicant)
+
+THREADPOOL_SIZE = int(os.environ.get("HR_THREADPOOL_SIZE", "100"))
+GZIP_MIN_BYTES = int(os.environ.get("HR_GZIP_MIN_BYTES", "1024"))
+# Per-applicant pause in score_all so the dashboard can animate scoring; 0 disables it.
+SCORE_ALL_DELAY = float(os.environ.get("HR_SCORE_ALL_DELAY", "0.05"))
+INBOX_PATH = os.environ.get("HR_INBOX_PATH", "")
+DATA_DIR = os.environ.get("HR_DATA_DIR", "")
+# Prebuilt store fixture (see fixtures.py) used instead of the mock applicants.
+FIXTURE_PATH = os.environ.get("HR_FIXTURE", "")
+INBOX_POLL_SECONDS = float(os.environ.get("HR_INBOX_POLL_SECONDS", "60"))
+# "writer" also publishes read snapshots for reader.py workers (see run.sh); "standalone" serves everything itself.
+ROLE = os.environ.get("HR_ROLE", "standalone")
+SNAPSHOT_PATH = os.environ.get("HR_SNAPSHOT_PATH", "hr-snapshot.bin")
+SNAPSHOT_INTERVAL = float(os.environ.get("HR_SNAPSHOT_INTERVAL", "0.25"))
+# Rendered invite bodies kept for reuse between preview pages and the send.
+RENDER_CACHE_SIZE = int(os.environ.get("HR_RENDER_CACHE", "20000"))
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Move the startup heap (fixture records included) out of the collector's reach so later
+    # full collections do not rescan it.
+    gc.freeze()
+    STARTUP["ready_s"] = round(time.perf_counter() - _STARTED, 4)
+    logging.getLogger("uvicorn.error").info("Startup timings: %s", STARTUP)
+    _mailer.start()
+    if _publisher:
+        _publisher.start()
+    # Build the relevance and duplicate indexes off the request path; the first read would otherwise pay for them.
+    threading.Thread(target=_warm_indexes, name="hr-index-warmup", daemon=True).start()
+    poller = asyncio.create_task(_poll_inbox_forever()) if _inbox and INBOX_POLL_SECONDS > 0 else None
+    yield
+    if poller:
+        poller.cancel()
+    _mailer.stop()
+    if _publisher:
+        _publisher.stop()
+    _extractor.close()
+    if _events:
+        _events.close()
+
+
+def _warm_indexes():
+    _relevance.scores()
+    _dupes.stats()
+    _nearby.stats()
+
+
+async def _poll_inbox_forever():
+    while True:
+        await asyncio.sleep(INBOX_POLL_SECONDS)
+        try:
+            stats = await anyio.to_thread.run_sync(_inbox.poll)
+        except Exception:
+            # A broken mailbox must not end polling for the life of the process.
+            logging.getLogger("uvicorn.error").exception("Inbox poll failed")
+            continue
+        _count_inbox(stats)
+
+
+def _count_inbox(stats: dict) -> None:
+    for result in ("matched", "unmatched", "failed"):
+        INBOX_MESSAGES.inc(stats[result], result=result)
+
+
+app = FastAPI(title="HR Resume Processing Demo", lifespan=_lifespan)
+# Heavy batch and listing calls queue behind interactive clicks instead of crowding them out.
+_BATCH_ROUTES = frozenset({
+    ("POST", "/api/score/all"), ("POST", "/api/bulk"), ("POST", "/api/email/preview"),
+    ("POST", "/api/applicants/transitions"), ("POST", "/api/paycom/refresh"), ("POST", "/api/inbox/poll"),
+    ("POST", "/api/batch"),
+})
+_LISTING_ROUTES = frozenset({
+    ("GET", "/api/applicants"), ("GET", "/api/relevance"), ("GET", "/api/duplicates"), ("GET", "/api/nearby"),
+    ("GET", "/api/events"),
+})
+_UNMETERED_ROUTES = frozenset({"/api/health", "/api/metrics"})
+
+
+def _admission_class(method: str, path: str):
+    if not path.startswith("/api/") or path in _UNMETERED_ROUTES or path.startswith("/api/debug/"):
+        return None
+    if (method, path) in _BATCH_ROUTES:
+        # A score_all sent during a run only joins it (see _jobs), so it must not queue behind it.
+        if path == "/api/score/all" and _jobs.running("score_all"):
+            return None
+        return "batch"
+    if (method, path) in _LISTING_ROUTES:
+        return "listing"
+    return "interactive"
+
+
+_admission = Admission()
+app.add_middleware(AdmissionMiddleware, admission=_admission, classify=_admission_class)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
-
-_applicant_store: dict = {a["id"]: dict(a) for a in APPLICANTS}
-_scores_cache: dict = {}
-
-DEFAULT_SETTINGS = {
-    "scoring": {
-        "auto_promote_threshold": 75,
-        "strong_hire_threshold": 75,
-        "consider_threshold": 55,
-    },
-    "email": {
-        "mode": "mock",
-        "mock_email": "test@yourdomain.com",
-        "real_email": "",
-        "subject": "Interview Invitation — Ski Lift Operator at Vail Mountain",
-        "template": "Hi {{first_name}},\n\nWe reviewed your application and were impressed by your background{{ski_experience_note}}.\n\nWe'd love to invite you for a 30-minute interview for the Ski Lift Operator position at Vail Mountain.\n\n{{interview_details}}\n\nTo help us prepare, here are a few questions we'd love for you to reflect on:\n\n{{interview_questions}}\n\nPlease reply to confirm your availability.\n\nBest regards,\nMountain Operations HR Team",
-        "interview_details": "We have availability this week — Tuesday through Thursday, 8am–4pm.",
-    },
-    "questions": [
-        "Can you describe your experience operating ski lifts or similar equipment?",
-        "Are you available to work weekends, holidays, and early morning shifts starting at 6am?",
-        "Do you hold any safety certifications (OSHA, First Aid, CPR)?",
-        "How do you handle a situation where a guest refuses to follow safety instructions?",
-        "What's your experience working in cold outdoor conditions for extended periods?",
-        "How would you respond if the lift stopped unexpectedly with guests on board?",
-    ],
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=6)
+app.add_middleware(MetricsMiddleware)
+_profiles = ProfileBuffer()
+app.add_middleware(ProfilingMiddleware, buffer=_profiles)
+
+
+
+def _seed_records() -> list[Applicant]:
+    if FIXTURE_PATH:
+        from fixtures import load
+        return load(FIXTURE_PATH)[1]
+    return [Applicant.from_dict(a) for a in mock_data.APPLICANTS]
+
+
+_store = ApplicantStore(_seed_records())
+_SEEDED = time.perf_counter()
+# With HR_DATA_DIR set, state is replayed from (and every change appended to) the event log.
+if DATA_DIR:
+    from eventlog import EventLog
+    _events = EventLog(DATA_DIR)
+    _replay = _events.open(_store)
+else:
+    _events = _replay = None
+# BM25 match of every resume against the posting; the store feeds it changes.
+_relevance = RelevanceIndex(posting_text(JOB_POSTING))
+_relevance.on_change("reset", _store.snapshot())
+_store.subscribe(_relevance.on_change)
+# MinHash/LSH index of likely duplicate applicants, fed the same way.
+_dupes = DuplicateIndex()
+_dupes.on_change("reset", _store.snapshot())
+_store.subscribe(_dupes.on_change)
+# Offline geocoder (cached per location string) and the grid index behind radius queries.
+_geo = Geocoder(JOB_POSTING["location"])
+_nearby = RadiusIndex(_geo)
+_nearby.on_change("reset", _store.snapshot())
+_store.subscribe(_nearby.on_change)
+STARTUP = {
+    "imports_s": round(_IMPORTED - _STARTED, 4),
+    "seed_s": round(_SEEDED - _IMPORTED, 4),
+    "seed_source": FIXTURE_PATH or "mock_data",
+    "replay": _replay,
+    "applicants": len(_store),
 }
+_applicant_json = FragmentCache()
+_preview_json = FragmentCache()
+_email_renders = IdentityCache(max_entries=RENDER_CACHE_SIZE)
+# Concurrent identical reads and score_all runs share one in-flight computation.
+_reads = SingleFlight()
+_jobs = AsyncSingleFlight()
+
+REGISTRY.gauge("hr_applicants", "Applicants in the store", fn=lambda: len(_store))
+REGISTRY.counter("hr_events_logged_total", "Events appended to the event log", fn=lambda: _events.seq if _events else 0)
+REGISTRY.counter("hr_eventlog_write_failures_total", "Event log writes that failed and were retried",
+                 fn=lambda: _events.failures if _events else 0)
+REGISTRY.gauge("hr_eventlog_pending", "Store changes not yet written to the event log",
+               fn=lambda: _events.pending if _events else 0)
+REGISTRY.gauge("hr_scores_cached", "Applicants with a cached resume score", fn=_store.score_count)
+REGISTRY.counter(
+    "hr_json_cache_hits_total", "Encoded JSON fragment cache hits", ("cache",),
+    fn=lambda: {("applicants",): _applicant_json.hits, ("previews",): _preview_json.hits,
+                ("renders",): _email_renders.hits},
+)
+REGISTRY.counter(
+    "hr_json_cache_misses_total", "Encoded JSON fragment cache misses", ("cache",),
+    fn=lambda: {("applicants",): _applicant_json.misses, ("previews",): _preview_json.misses,
+                ("renders",): _email_renders.misses},
+)
+REGISTRY.counter(
+    "hr_coalesced_requests_total", "Requests that ran (leader) or joined (shared) a single-flight computation",
+    ("key", "role"), fn=lambda: {**_reads.stats, **_jobs.stats},
+)
+JOBS_IN_FLIGHT = REGISTRY.gauge("hr_jobs_in_flight", "Bulk and scoring jobs currently running", ("job",))
+
+_mailer = Dispatcher()
+REGISTRY.gauge("hr_email_queue_depth", "Invites waiting to be sent or retried", fn=_mailer.queue_depth)
+REGISTRY.gauge("hr_email_jobs_in_flight", "Invite dispatch jobs with undelivered messages", fn=_mailer.in_flight_jobs)
+_extractor = Extractor()
+REGISTRY.gauge("hr_extractions_running", "Resume text extractions in the process pool", fn=lambda: _extractor.running)
+REGISTRY.gauge("hr_extractions_waiting", "Resume uploads waiting for an extraction slot", fn=lambda: _extractor.waiting)
+RESUME_UPLOADS = REGISTRY.counter("hr_resume_uploads_total", "Resume file uploads by outcome", ("kind", "result"))
+REGISTRY.counter(
+    "hr_geocode_lookups_total", "Location lookups by outcome", ("result",),
+    fn=lambda: {("hit",): _geo.hits, ("miss",): _geo.misses},
+)
+REGISTRY.gauge("hr_geocode_cached", "Distinct location strings in the geocode cache", fn=lambda: _geo.stats()["cached"])
+REGISTRY.gauge("hr_admission_running", "Requests holding an admission slot", ("priority",),
+               fn=lambda: {(name,): _admission.running(name) for name in _admission.classes})
+REGISTRY.gauge("hr_admission_queue_depth", "Requests queued for admission", ("priority",),
+               fn=lambda: {(name,): _admission.waiting(name) for name in _admission.classes})
+INBOX_MESSAGES = REGISTRY.counter("hr_inbox_messages_total", "Inbound replies read from the mailbox", ("result",))
+
+# Validated, versioned settings; every request reads one snapshot throughout.
+_settings_store = SettingsStore(DEFAULT_SETTINGS)
+_scheduler = Scheduler(_settings_store.current()["scheduling"])
+_scheduler.restore({
+    a.id: a.calendar_event for a in _store.snapshot()
+    if a.calendar_event and a.status in (Status.BOOKED, Status.HIRED)
+})
+REGISTRY.gauge("hr_interviews_booked", "Interview seats currently reserved", fn=lambda: len(_scheduler))
+REGISTRY.gauge("hr_settings_version", "Version of the settings in effect", fn=lambda: _settings_store.current().version)
+
+
+def _reschedule(settings: SettingsSnapshot, previous: SettingsSnapshot) -> None:
+    if settings["scheduling"] != previous["scheduling"]:
+        _scheduler.configure(settings["scheduling"])
+
+
+_settings_store.subscribe(_reschedule)
+
+
+def _stamp_email_sent(batch):
+    sent_at = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {record.id: {"email_sent_at": sent_at} for record, _ in batch}
+
+
+def _reserve_interviews(batch):
+    names = {record.id: record.name for record, _ in batch}
+    reservations = _scheduler.reserve_many(names)
+    return {
+        aid: {"calendar_event": r.calendar_event(f"Ski Lift Operator Interview — {names[aid]}")}
+        for aid, r in reservations.items()
+    }
+
+
+def _release_new_reservations(batch):
+    for record, _ in batch:
+        if record.status is not Status.BOOKED:
+            _scheduler.release(record.id)
+
 
-_settings = copy.deepcopy(DEFAULT_SETTINGS)
+def _clear_interviews(batch):
+    # Hired candidates keep their interview on record; every other exit frees the seat.
+    return {record.id: {} if target is Status.HIRED else {"calendar_event": None} for record, target in batch}
+
+
+def _release_interviews(batch):
+    for record, target in batch:
+        if target is not Status.HIRED:
+            _scheduler.release(record.id)
+
+
+STATUS_TRANSITIONS = REGISTRY.counter(
+    "hr_status_transitions_total", "Applicant status changes", ("from_status", "to_status"),
+)
+REGISTRY.gauge(
+    "hr_applicants_by_status", "Applicants in each pipeline status", ("status",),
+    fn=lambda: {(status,): n for status, n in _store.status_counts().items()},
+)
+
+
+def _count_transitions(counts) -> None:
+    for (before, after), n in counts.items():
+        STATUS_TRANSITIONS.inc(n, from_status=before.value, to_status=after.value)
+
+
+_pipeline = Pipeline(_store, effects={
+    "stamp_email_sent": Effect(_stamp_email_sent),
+    "reserve_interview": Effect(_reserve_interviews, rollback=_release_new_reservations, failure="no_slot_available"),
+    "release_interview": Effect(_clear_interviews, commit=_release_interviews),
+}, on_batch=_count_transitions)
 
 MOCK_RESPONSES_HIGH = [
     "Hi, thank you so much for the invitation! I'm really excited about this opportunity. I can confirm I'm available on March 5th. I have {ski_years} years of lift experience and hold my OSHA certification — safety is always my top priority. I'm available weekends, holidays, and early morning shifts. Looking forward to meeting the team!",
@@ -57,32 +316,38 @@ MOCK_RESPONSES_LOW = [
 ]
 
 
-def _pick_questions_for_candidate(applicant: dict) -> list[str]:
-    questions = _settings["questions"]
-    ski_jobs = [e for e in applicant["resume"]["experience"] if e.get("ski_related")]
-    certs = applicant["resume"].get("certifications", [])
-    avail = applicant["resume"].get("availability", {})
+def _question_buckets(settings: SettingsSnapshot) -> dict:
+    """The first question for each candidate need, found once per settings version."""
+    lowered = [(q, q.lower()) for q in settings["questions"]]
+
+    def first(*words):
+        return next((q for q, low in lowered if any(w in low for w in words)), None)
+
+    return {
+        "all": settings["questions"],
+        "lift": first("lift", "equipment"),
+        "availability": first("available", "shift"),
+        "certs": first("certif", "osha"),
+        "safety": tuple(q for q, low in lowered if "safety" in low),
+    }
+
+
+@timed("pick_questions_for_candidate")
+def _pick_questions_for_candidate(applicant: Applicant, settings: Optional[SettingsSnapshot] = None) -> list[str]:
+    buckets = (settings or _settings_store.current()).derive("question_buckets", _question_buckets)
+    resume = applicant.resume
 
     picked = []
-    if ski_jobs:
-        for q in questions:
-            if "lift" in q.lower() or "equipment" in q.lower():
-                picked.append(q)
-                break
-    if not avail.get("weekends") or not avail.get("early_am"):
-        for q in questions:
-            if "available" in q.lower() or "shift" in q.lower():
-                picked.append(q)
-                break
-    if not certs:
-        for q in questions:
-            if "certif" in q.lower() or "osha" in q.lower():
-                picked.append(q)
-                break
-    for q in questions:
-        if "safety" in q.lower() and q not in picked:
-            picked.append(q)
-            break
+    if buckets["lift"] and any(e.ski_related for e in resume.experience):
+        picked.append(buckets["lift"])
+    if buckets["availability"] and (not resume.availability.weekends or not resume.availability.early_am):
+        picked.append(buckets["availability"])
+    if buckets["certs"] and not resume.certifications:
+        picked.append(buckets["certs"])
+    safety = next((q for q in buckets["safety"] if q not in picked), None)
+    if safety:
+        picked.append(safety)
+    questions = buckets["all"]
     if len(picked) < 2 and questions:
         for q in questions:
             if q not in picked:
@@ -92,9 +357,16 @@ def _pick_questions_for_candidate(applicant: dict) -> list[str]:
     return picked[:3]
 
 
-def _render_email(template: str, applicant: dict, score_data) -> str:
-    ski_years = sum(e.get("years", 0) for e in applicant["resume"]["experience"] if e.get("ski_related"))
-    certs = applicant["resume"].get("certifications", [])
+def _compiled_template(settings: SettingsSnapshot) -> tuple[str, ...]:
+    return compile_template(settings["email"]["template"])
+
+
+@timed("render_email")
+def _render_email(applicant: Applicant, score_data, settings: Optional[SettingsSnapshot] = None,
+                  questions: Optional[list[str]] = None) -> str:
+    settings = settings or _settings_store.current()
+    ski_years = applicant.resume.ski_years
+    certs = applicant.resume.certifications
     cert_str = ", ".join(certs[:2]) if certs else ""
 
     ski_note = ""
@@ -103,22 +375,25 @@ def _render_email(template: str, applicant: dict, score_data) -> str:
     elif cert_str:
         ski_note = f" — especially your {cert_str} certifications"
 
-    questions = _pick_questions_for_candidate(applicant)
-    questions_block = "\n".join(f"{i+1}. {q}" for i, q in enumerate(questions))
-
-    out = template
-    out = out.replace("{{first_name}}", applicant["first_name"])
-    out = out.replace("{{last_name}}", applicant["last_name"])
-    out = out.replace("{{ski_experience_note}}", ski_note)
-    out = out.replace("{{interview_details}}", _settings["email"]["interview_details"])
-    out = out.replace("{{interview_questions}}", questions_block)
-    out = out.replace("{{location}}", applicant.get("location", ""))
+    if questions is None:
+        questions = _pick_questions_for_candidate(applicant, settings)
+    values = {
+        "first_name": applicant.first_name,
+        "last_name": applicant.last_name,
+        "ski_experience_note": ski_note,
+        "interview_details": settings["email"]["interview_details"],
+        "interview_questions": "\n".join(f"{i+1}. {q}" for i, q in enumerate(questions)),
+        "location": applicant.location,
+    }
     if score_data:
-        out = out.replace("{{score}}", str(score_data.get("score", "")))
-    return out
+        values["score"] = str(score_data.get("score", ""))
+    # Literals at even indices, placeholder names at odd ones; unfilled placeholders stay as written.
+    parts = settings.derive("template", _compiled_template)
+    return "".join(part if i % 2 == 0 else values.get(part, f"{{{{{part}}}}}") for i, part in enumerate(parts))
 
 
-def _score_response(text: str, applicant: dict) -> dict:
+@timed("score_response")
+def _score_response(text: str, applicant: Applicant) -> dict:
     text_lower = text.lower()
     score = 0
     breakdown = {}
@@ -173,61 +448,431 @@ def _score_response(text: str, applicant: dict) -> dict:
     return {"score": total, "max_score": 50, "recommendation": rec, "breakdown": breakdown, "reasons": reasons}
 
 
+if INBOX_PATH:
+    from inbox import InboxIngester
+    _inbox = InboxIngester(INBOX_PATH, _store, _score_response)
+else:
+    _inbox = None
+
+
 @app.get("/api/health")
 def health():
+    if _events is not None and _events.error:
+        # Still serving, but changes are piling up unlogged until the disk recovers.
+        return {"status": "degraded", "event_log": _events.error, "event_log_pending": _events.pending}
     return {"status": "ok"}
 
 
+@app.get("/api/metrics")
+def get_metrics():
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+def _require_profile_token(request: Request) -> None:
+    # Stored stacks expose code paths and timings, so reading them needs the same
+    # token as recording them.
+    if not profile_authorized(request.headers.get("x-profile")):
+        raise HTTPException(403, "X-Profile token required")
+
+
+@app.get("/api/debug/profiles")
+def list_profiles(request: Request):
+    _require_profile_token(request)
+    return {"profiles": [p.summary() for p in _profiles.list()]}
+
+
+@app.get("/api/debug/profiles/{profile_id}")
+def get_profile(profile_id: str, request: Request):
+    _require_profile_token(request)
+    profile = _profiles.get(profile_id)
+    if profile is None:
+        raise HTTPException(404, "Profile not found")
+    return Response(profile.collapsed(), media_type="text/plain")
+
+
+@app.get("/api/debug/admission")
+def get_admission():
+    return _admission.stats()
+
+
+@app.get("/api/debug/startup")
+def get_startup():
+    return STARTUP
+
+
 @app.get("/api/job")
 def get_job():
     return JOB_POSTING
 
 
+def _applicant_entry(applicant: Applicant, sd) -> dict:
+    entry = applicant.to_dict()
+    if sd is not None:
+        entry["score_data"] = sd
+    return entry
+
+
+def _applicant_fragment(applicant: Applicant) -> bytes:
+    sd = _store.score(applicant.id)
+    return _applicant_json.get(applicant.id, (applicant, sd), lambda: _applicant_entry(applicant, sd))
+
+
+_SORT_KEYS = ("score", "relevance")
+
+
+def _ranked(sort: str = "score") -> list[Applicant]:
+    if sort == "relevance":
+        relevance = _relevance.scores()
+        key = lambda a: relevance.get(a.id, -1)
+    else:
+        scores = _store.scores_snapshot()
+        key = lambda a: scores[a.id]["score"] if a.id in scores else -1
+    return sorted(_store.snapshot(), key=key, reverse=True)
+
+
+def _ranked_fragments(sort: str = "score") -> list[bytes]:
+    return [_applicant_fragment(a) for a in _ranked(sort)]
+
+
+def _snapshot_contents() -> tuple:
+    """What reader workers serve: applicants by score, the other sort orders and the small GETs."""
+    ranked = _ranked("score")
+    position = {a.id: i for i, a in enumerate(ranked)}
+    orders = {
+        sort: [position[a.id] for a in _ranked(sort) if a.id in position]
+        for sort in _SORT_KEYS if sort != "score"
+    }
+    blobs = {"job": encode(JOB_POSTING), "settings": _settings_store.current().encoded,
+             "schedule": encode(_scheduler.summary())}
+    return [(a.id, _applicant_fragment(a)) for a in ranked], orders, blobs
+
+
+_publisher = Publisher(SNAPSHOT_PATH, _snapshot_contents, SNAPSHOT_INTERVAL) if ROLE == "writer" else None
+if _publisher:
+    _store.subscribe(_publisher.mark_dirty)
+    _settings_store.subscribe(_publisher.mark_dirty)
+    app.add_middleware(GenerationHeaderMiddleware, publisher=_publisher)
+    REGISTRY.gauge("hr_snapshot_generation", "Latest change generation", ("state",), fn=lambda: {
+        ("current",): _publisher.generation, ("published",): _publisher.published,
+    })
+    REGISTRY.gauge("hr_snapshot_publish_seconds", "Time to build and write the last snapshot",
+                   fn=lambda: _publisher.last_seconds)
+    REGISTRY.gauge("hr_snapshot_bytes", "Size of the last snapshot", fn=lambda: _publisher.last_bytes)
+    REGISTRY.counter("hr_snapshot_failures_total", "Snapshot publishes that failed and were retried",
+                     fn=lambda: _publisher.failures)
+
+
 @app.get("/api/applicants")
-def get_applicants():
-    result = []
-    for a in _applicant_store.values():
-        entry = dict(a)
-        if a["id"] in _scores_cache:
-            entry["score_data"] = _scores_cache[a["id"]]
-        result.append(entry)
-    result.sort(key=lambda x: x.get("score_data", {}).get("score", -1), reverse=True)
-    return result
+def get_applicants(sort: str = "score"):
+    """All applicants, best first by resume ``score`` or by BM25 ``relevance`` to the posting."""
+    if sort not in _SORT_KEYS:
+        raise HTTPException(400, f"sort must be one of {', '.join(_SORT_KEYS)}")
+    fragments = _reads.do(("applicants", sort), lambda: _ranked_fragments(sort))
+    return list_response(iter(fragments), len(fragments))
+
+
+@app.get("/api/relevance")
+def get_relevance(limit: int = 20):
+    """Applicants whose resumes best match the posting, with the terms that matched."""
+    relevance = _relevance.scores()
+    top = sorted(relevance, key=relevance.get, reverse=True)[:max(0, min(limit, 500))]
+    results = []
+    for aid in top:
+        applicant = _store.get(aid)
+        results.append({
+            "id": aid, "name": applicant.name if applicant else None,
+            "relevance": relevance[aid], "terms": _relevance.explain(aid),
+        })
+    return {"index": _relevance.stats(), "results": results}
+
+
+@app.get("/api/duplicates")
+def get_duplicates(min_confidence: float = 0.7, limit: int = 100):
+    """Merge suggestions: clusters of applicants that are probably the same person."""
+    sweep = _dupes.sweep()
+    groups = merge_suggestions(sweep["pairs"], _store.get, min_confidence)
+    return {
+        "groups": groups[:max(0, limit)], "total_groups": len(groups),
+        "pairs_checked": sweep["checked"], "seconds": sweep["seconds"], "index": _dupes.stats(),
+    }
+
+
+@app.get("/api/geocode")
+def geocode(q: str):
+    place = _geo.resolve(q)
+    if place is None:
+        raise HTTPException(404, f"Unknown location: {q!r}")
+    miles = _geo.miles_from_home(place)
+    return {"query": q, "place": place.to_dict(), "miles_from_job": round(miles, 1) if miles is not None else None}
+
+
+@app.get("/api/nearby")
+def get_nearby(miles: float = 25, near: str = "", limit: int = 200):
+    """Applicants living within ``miles`` (straight line) of ``near``, the job's location by default."""
+    if not 0 < miles <= 3000:
+        raise HTTPException(400, "miles must be between 0 and 3000")
+    center = _geo.resolve(near) if near else _geo.home
+    if center is None:
+        raise HTTPException(400, f"Unknown location: {near or JOB_POSTING['location']!r}")
+    hits = _nearby.within(center, miles)
+    results = []
+    for aid, distance in hits[:max(0, limit)]:
+        applicant = _store.get(aid)
+        if applicant is not None:
+            results.append({
+                "id": aid, "name": applicant.name, "location": applicant.location,
+                "miles": round(distance, 1), "reported_miles": applicant.distance_miles,
+            })
+    return {"center": center.to_dict(), "miles": miles, "count": len(hits), "results": results,
+            "index": _nearby.stats()}
+
+
+# Columns ``/api/applicants/page`` can project, each from (applicant, score data, relevance).
+_PAGE_FIELDS = {
+    "id": lambda a, sd, rel: a.id,
+    "name": lambda a, sd, rel: a.name,
+    "email": lambda a, sd, rel: a.email,
+    "phone": lambda a, sd, rel: a.phone,
+    "location": lambda a, sd, rel: a.location,
+    "distance_miles": lambda a, sd, rel: a.distance_miles,
+    "applied_date": lambda a, sd, rel: a.applied_date,
+    "status": lambda a, sd, rel: a.status.value,
+    "score": lambda a, sd, rel: sd["score"] if sd else None,
+    "recommendation": lambda a, sd, rel: sd["recommendation"] if sd else None,
+    "response_score": lambda a, sd, rel: a.response_data.get("score") if a.response_data else None,
+    "relevance": lambda a, sd, rel: rel.get(a.id),
+    "geocoded_miles": lambda a, sd, rel: sd.get("geocoded_miles") if sd else None,
+    "ski_years": lambda a, sd, rel: sum(e.years for e in a.resume.experience if e.ski_related),
+    "certifications": lambda a, sd, rel: len(a.resume.certifications),
+    "email_sent_at": lambda a, sd, rel: a.email_sent_at,
+    "interview": lambda a, sd, rel: (f"{a.calendar_event['date']} {a.calendar_event['time']}"
+                                     if a.calendar_event else None),
+}
+DEFAULT_PAGE_FIELDS = ("id", "name", "score", "status", "location")
+MAX_PAGE_SIZE = 500
+
+
+def _encode_cursor(sort: str, key: tuple) -> str:
+    return base64.urlsafe_b64encode(encode([sort, *key])).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    try:
+        name, rank, applicant_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(rank, (int, float)) or not isinstance(applicant_id, str):
+            raise ValueError(cursor)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+    if name != sort:
+        raise HTTPException(400, f"Cursor belongs to sort={name}")
+    return rank, applicant_id
+
+
+@app.get("/api/applicants/page")
+def get_applicant_page(sort: str = "score", status: Optional[str] = None, min_score: Optional[int] = None,
+                       q: str = "", fields: str = "", limit: int = 25, cursor: Optional[str] = None,
+                       max_chars: Optional[int] = None):
+    """One page of applicants with only the requested ``fields``, for clients that cannot take the full list.
+
+    Pages follow ``sort`` best first, ties by id. ``next_cursor`` resumes after the
+    last item, so applicants added meanwhile do not shift later pages. With
+    ``max_chars`` the page also stops before its encoded items pass that size.
+    """
+    if sort not in _SORT_KEYS:
+        raise HTTPException(400, f"sort must be one of {', '.join(_SORT_KEYS)}")
+    if status is not None and status not in STATUS_VALUES:
+        raise HTTPException(400, f"Status must be one of: {set(STATUS_VALUES)}")
+    columns = [f.strip() for f in fields.split(",") if f.strip()] or list(DEFAULT_PAGE_FIELDS)
+    unknown = [f for f in columns if f not in _PAGE_FIELDS]
+    if unknown:
+        raise HTTPException(400, f"Unknown fields {unknown}; choose from {', '.join(_PAGE_FIELDS)}")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    scores = _store.scores_snapshot()
+    relevance = _relevance.scores() if sort == "relevance" or "relevance" in columns else {}
+    if sort == "relevance":
+        rank = lambda a: -relevance.get(a.id, -1)
+    else:
+        rank = lambda a: -scores[a.id]["score"] if a.id in scores else 1
+    wanted = Status(status) if status is not None else None
+    q = q.strip().lower()
+    matches = [
+        a for a in _store.snapshot()
+        if (wanted is None or a.status is wanted)
+        and (min_score is None or (a.id in scores and scores[a.id]["score"] >= min_score))
+        and (not q or q in a.name.lower())
+    ]
+    after = _decode_cursor(cursor, sort) if cursor else None
+    remaining = [a for a in matches if (rank(a), a.id) > after] if after else matches
+    # Only the page is ordered, not every match.
+    page = heapq.nsmallest(limit + 1, remaining, key=lambda a: (rank(a), a.id))
+
+    items, used = [], 0
+    for a in page[:limit]:
+        item = encode({f: _PAGE_FIELDS[f](a, scores.get(a.id), relevance) for f in columns})
+        if max_chars is not None and items and used + len(item) > max_chars:
+            break
+        items.append((a, item))
+        used += len(item) + 1
+    more = len(items) < len(remaining)
+    last = items[-1][0] if items else None
+    return json_response(join_object({
+        "items": join_array(item for _, item in items), "count": len(items), "total": len(matches),
+        "remaining": len(remaining) - len(items), "fields": columns, "sort": sort,
+        "next_cursor": _encode_cursor(sort, (rank(last), last.id)) if more and last else None,
+    }))
 
 
 @app.get("/api/applicants/{applicant_id}")
 def get_applicant(applicant_id: str):
-    if applicant_id not in _applicant_store:
+    applicant = _store.get(applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    a = dict(_applicant_store[applicant_id])
-    if applicant_id in _scores_cache:
-        a["score_data"] = _scores_cache[applicant_id]
-    return a
+    return json_response(_applicant_fragment(applicant))
+
+
+def _event_log():
+    if _events is None:
+        raise HTTPException(404, "Event log is disabled; set HR_DATA_DIR to enable it")
+    return _events
+
+
+@app.get("/api/applicants/{applicant_id}/duplicates")
+def get_applicant_duplicates(applicant_id: str):
+    if applicant_id not in _store:
+        raise HTTPException(404, "Applicant not found")
+    return {"id": applicant_id, "duplicates": _dupes.candidates(applicant_id)}
+
+
+@app.get("/api/applicants/{applicant_id}/history")
+def get_applicant_history(applicant_id: str, limit: int = 500):
+    log = _event_log()
+    events = log.history(applicant_id, limit=limit)
+    if not events and applicant_id not in _store:
+        raise HTTPException(404, "Applicant not found")
+    # False while recent changes are still waiting to be written (see /api/health).
+    return {"id": applicant_id, "events": events, "complete": log.pending == 0}
+
+
+@app.get("/api/events")
+def get_events(after: int = 0, limit: int = 500):
+    log = _event_log()
+    events = log.tail(after, limit=min(limit, 5000))
+    return {"seq": log.seq, "events": events, "complete": log.pending == 0}
+
+
+def _geocoded_miles(location: str) -> Optional[float]:
+    """Miles from the job to ``location`` by the gazetteer, or None for an unknown place."""
+    place = _geo.resolve(location)
+    if place is None or _geo.home is None:
+        return None
+    return round(_geo.miles_from_home(place), 1)
+
+
+def _thresholds(settings: SettingsSnapshot) -> tuple[int, int]:
+    scoring = settings["scoring"]
+    return scoring["strong_hire_threshold"], scoring["consider_threshold"]
+
+
+def _score(applicant: Applicant, settings: Optional[SettingsSnapshot] = None) -> dict:
+    """``score_applicant`` plus the resume's BM25 match with the posting.
+
+    ``relevance`` is always reported. With a non-zero ``relevance_weight`` it also
+    counts as a criterion: the rule-based score is scaled to the remaining share.
+    The recommendation follows the settings' hire thresholds. Proximity uses the
+    geocoded distance when the location is in the gazetteer, for synced records
+    as well as uploads; the self-reported miles are only a fallback.
+    """
+    settings = settings or _settings_store.current()
+    strong, consider = settings.derive("thresholds", _thresholds)
+    miles = _geocoded_miles(applicant.location)
+    if miles is not None and miles != applicant.distance_miles:
+        applicant = applicant.with_changes(distance_miles=miles)
+    result = score_applicant(applicant)
+    # The record keeps the reported miles; this is the figure proximity was scored on.
+    result["geocoded_miles"] = miles
+    relevance = _relevance.score(applicant.id) or 0.0
+    result["relevance"] = relevance
+    weight = settings["scoring"]["relevance_weight"]
+    if weight:
+        points = round(relevance * weight / 100)
+        result["base_score"] = result["score"]
+        result["score"] = round(result["score"] * (100 - weight) / 100) + points
+        result["breakdown"]["Job Description Match"] = {"points": points, "max": weight}
+        terms = ", ".join(_relevance.explain(applicant.id, 3)) or "nothing"
+        mark = "✅" if relevance >= 30 else "⚠️" if relevance >= 15 else "❌"
+        result["reasons"].append(f"{mark} Resume matches the job posting on: {terms} ({relevance:.0f}/100)")
+    result["recommendation"], result["badge"] = recommendation_for(result["score"], strong, consider)
+    return result
+
+
+def _warm_settings(settings: SettingsSnapshot, previous: SettingsSnapshot) -> None:
+    """Build the new version's derived values up front instead of inside the first request."""
+    settings.derive("template", _compiled_template)
+    settings.derive("question_buckets", _question_buckets)
+    settings.derive("thresholds", _thresholds)
+
+
+def _refresh_recommendations(settings: SettingsSnapshot, previous: SettingsSnapshot) -> None:
+    """Relabel cached scores when the hire thresholds move; the points stay as they are."""
+    strong, consider = settings.derive("thresholds", _thresholds)
+    if (strong, consider) == previous.derive("thresholds", _thresholds):
+        return
+    for applicant_id, result in _store.scores_snapshot().items():
+        recommendation, badge = recommendation_for(result["score"], strong, consider)
+        if (result.get("recommendation"), result.get("badge")) != (recommendation, badge):
+            _store.set_score(applicant_id, {**result, "recommendation": recommendation, "badge": badge})
+
+
+_settings_store.subscribe(_warm_settings)
+_settings_store.subscribe(_refresh_recommendations)
+
+
+async def _score_all_run() -> dict:
+    with JOBS_IN_FLIGHT.track(job="score_all"):
+        settings = _settings_store.current()
+        threshold = settings["scoring"]["auto_promote_threshold"]
+        scored = []
+        promote = {}
+        for applicant in _store.snapshot():
+            if SCORE_ALL_DELAY:
+                await asyncio.sleep(SCORE_ALL_DELAY)
+            result = _score(applicant, settings)
+            _store.set_score(applicant.id, result)
+            if result["score"] >= threshold and applicant.status is Status.NEW:
+                promote[applicant.id] = Status.REVIEWING
+            scored.append({"id": applicant.id, **result})
+        # One pipeline batch, so the promotions get the state machine's hooks and counters. Anyone
+        # moved on from New since the snapshot keeps their status.
+        outcome = _pipeline.apply(promote, atomic=False, only_from=Status.NEW)
+        auto_promoted = len(outcome.applied)
+        scored.sort(key=lambda x: x["score"], reverse=True)
+        # Encoded once here; every caller that joined this run streams the same fragments.
+        return {"scored": [encode(r) for r in scored], "auto_promoted": auto_promoted, "threshold": threshold}
 
 
 @app.post("/api/score/all")
-async def score_all():
-    threshold = _settings["scoring"]["auto_promote_threshold"]
-    scored = []
-    auto_promoted = 0
-    for applicant_id, applicant in _applicant_store.items():
-        await asyncio.sleep(0.05)
-        result = score_applicant(applicant)
-        _scores_cache[applicant_id] = result
-        if result["score"] >= threshold and _applicant_store[applicant_id]["status"] == "new":
-            _applicant_store[applicant_id]["status"] = "reviewing"
-            auto_promoted += 1
-        scored.append({"id": applicant_id, **result})
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    return {"scored": len(scored), "auto_promoted": auto_promoted, "threshold": threshold, "results": scored}
+async def score_all(top: Optional[int] = None):
+    """Score everyone; a call made while a run is in progress joins it and gets the same result.
+
+    ``top`` limits ``results`` to the best N; the counts still cover everyone.
+    """
+    run = await _jobs.do("score_all", _score_all_run)
+    scored = run["scored"]
+    results = scored if top is None else scored[:max(0, top)]
+    return list_response(
+        iter(results), len(results),
+        envelope={"scored": len(scored), "auto_promoted": run["auto_promoted"], "threshold": run["threshold"]},
+    )
 
 
 @app.post("/api/score/{applicant_id}")
 def score_one(applicant_id: str):
-    if applicant_id not in _applicant_store:
+    applicant = _store.get(applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    result = score_applicant(_applicant_store[applicant_id])
-    _scores_cache[applicant_id] = result
+    result = _score(applicant)
+    _store.set_score(applicant_id, result)
     return result
 
 
@@ -237,42 +882,249 @@ class StatusUpdate(BaseModel):
 
 @app.patch("/api/applicants/{applicant_id}/status")
 def update_status(applicant_id: str, body: StatusUpdate):
-    if applicant_id not in _applicant_store:
+    applicant = _store.get(applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    valid = {"new", "reviewing", "shortlisted", "awaiting_reply", "booked", "rejected", "hired"}
-    if body.status not in valid:
-        raise HTTPException(400, f"Status must be one of: {valid}")
-    _applicant_store[applicant_id]["status"] = body.status
+    if body.status not in STATUS_VALUES:
+        raise HTTPException(400, f"Status must be one of: {set(STATUS_VALUES)}")
+    try:
+        _pipeline.apply({applicant_id: body.status})
+    except TransitionError as e:
+        reason = e.errors[applicant_id]
+        if reason == "not_found":
+            raise HTTPException(404, "Applicant not found")
+        if reason.startswith("invalid_transition"):
+            raise HTTPException(
+                409, f"Cannot move {applicant.status.value} to {body.status}; "
+                     f"allowed: {', '.join(allowed_targets(applicant.status))}",
+            )
+        raise HTTPException(409, f"Status change failed: {reason}")
     return {"id": applicant_id, "status": body.status}
 
 
+class TransitionItem(BaseModel):
+    id: str
+    status: str
+
+
+class TransitionBatch(BaseModel):
+    transitions: list[TransitionItem]
+    atomic: bool = True
+
+
+@app.post("/api/applicants/transitions")
+def apply_transitions(body: TransitionBatch):
+    with JOBS_IN_FLIGHT.track(job="transitions"):
+        try:
+            outcome = _pipeline.apply({t.id: t.status for t in body.transitions}, atomic=body.atomic)
+        except TransitionError as e:
+            raise HTTPException(409, {"message": str(e), "errors": e.errors})
+        counts = collections.Counter(f"{b.status.value}->{a.status.value}" for b, a in outcome.applied.values())
+        return {
+            "applied": len(outcome.applied),
+            "counts": dict(counts),
+            "results": [{"id": aid, "from": b.status.value, "to": a.status.value} for aid, (b, a) in outcome.applied.items()],
+            "errors": outcome.errors,
+        }
+
+
+EMAIL_PREVIEW_PAGE = 10
+MAX_PREVIEW_PAGE = 50
+
+
+def _invite(applicant: Applicant, sd, settings: SettingsSnapshot) -> tuple[str, list[str]]:
+    """Rendered body and picked questions for one invite.
+
+    Cached per applicant against the settings snapshot (one per version) and
+    the parts of the record the text uses, not the whole record. A status move
+    therefore keeps the render, and sending reuses the one its preview made.
+    """
+    def build():
+        questions = _pick_questions_for_candidate(applicant, settings)
+        return _render_email(applicant, sd, settings, questions), questions
+
+    sources = (settings, sd, applicant.resume, applicant.first_name, applicant.last_name, applicant.location)
+    return _email_renders.get(applicant.id, sources, build)
+
+
+def _recipient(applicant: Applicant, settings: SettingsSnapshot) -> str:
+    if settings["email"]["mode"] == "real":
+        return applicant.email
+    return settings["email"].get("mock_email", "test@demo.com")
+
+
 class PreviewRequest(BaseModel):
     applicant_ids: list[str]
 
 
+class PreviewPageRequest(PreviewRequest):
+    offset: int = 0
+    limit: int = EMAIL_PREVIEW_PAGE
+
+
+def _preview_fragments(applicant_ids: list[str], settings: SettingsSnapshot) -> Iterator[bytes]:
+    mode = settings["email"]["mode"]
+
+    def build(applicant: Applicant, sd) -> dict:
+        body, questions = _invite(applicant, sd, settings)
+        return {
+            "id": applicant.id,
+            "name": applicant.name,
+            "email": _recipient(applicant, settings),
+            "actual_email": applicant.email,
+            "subject": settings["email"]["subject"],
+            "body": body,
+            "questions": questions,
+            "mode": mode,
+        }
+
+    for aid in applicant_ids:
+        applicant = _store.get(aid)
+        if applicant is None:
+            continue
+        sd = _store.score(aid)
+        yield _preview_json.get(aid, (applicant, sd, settings), lambda: build(applicant, sd))
+
+
 @app.post("/api/email/preview")
 def preview_emails(body: PreviewRequest):
-    template = _settings["email"]["template"]
-    subject = _settings["email"]["subject"]
-    mode = _settings["email"]["mode"]
-    previews = []
-    for aid in body.applicant_ids:
-        if aid not in _applicant_store:
+    """Every requested invite, rendered. Large selections should use ``summary`` and ``page``."""
+    settings = _settings_store.current()
+    return list_response(_preview_fragments(body.applicant_ids, settings), len(body.applicant_ids),
+                         envelope={"mode": settings["email"]["mode"]}, key="previews")
+
+
+@app.post("/api/email/preview/summary")
+def preview_summary(body: PreviewRequest):
+    """Who an invite to ``applicant_ids`` would reach, without rendering any bodies."""
+    settings = _settings_store.current()
+    recipients, missing = [], []
+    for aid in dict.fromkeys(body.applicant_ids):
+        applicant = _store.get(aid)
+        if applicant is None:
+            missing.append(aid)
             continue
-        applicant = _applicant_store[aid]
-        sd = _scores_cache.get(aid)
-        questions = _pick_questions_for_candidate(applicant)
-        previews.append({
-            "id": aid,
-            "name": f"{applicant['first_name']} {applicant['last_name']}",
-            "email": applicant["email"] if mode == "real" else _settings["email"].get("mock_email", "test@demo.com"),
-            "actual_email": applicant["email"],
-            "subject": subject,
-            "body": _render_email(template, applicant, sd),
-            "questions": questions,
-            "mode": mode,
+        recipients.append({
+            "id": aid, "name": applicant.name, "email": _recipient(applicant, settings),
+            "actual_email": applicant.email, "status": applicant.status.value,
         })
-    return {"previews": previews, "mode": mode}
+    return json_response(encode({
+        "mode": settings["email"]["mode"], "subject": settings["email"]["subject"],
+        "total": len(recipients), "missing": missing, "page_size": EMAIL_PREVIEW_PAGE, "recipients": recipients,
+    }))
+
+
+@app.post("/api/email/preview/page")
+def preview_page(body: PreviewPageRequest):
+    """Rendered previews for one page of the ``summary`` recipients, in the same order."""
+    settings = _settings_store.current()
+    limit = max(1, min(body.limit, MAX_PREVIEW_PAGE))
+    offset = max(0, body.offset)
+    ids = [aid for aid in dict.fromkeys(body.applicant_ids) if aid in _store]
+    page = ids[offset:offset + limit]
+    return json_response(join_object({
+        "mode": settings["email"]["mode"], "offset": offset, "total": len(ids),
+        "next_offset": offset + limit if offset + limit < len(ids) else None,
+        "previews": join_array(_preview_fragments(page, settings)),
+    }))
+
+
+MAX_BATCH_OPS = 50
+
+
+class BatchOp(BaseModel):
+    op: str
+    id: Optional[str] = None
+    ids: list[str] = []
+    status: Optional[str] = None
+    query: Optional[str] = None
+    limit: int = 20
+
+
+class BatchRequest(BaseModel):
+    ops: list[BatchOp]
+    stop_on_error: bool = False
+
+
+def _batch_search(op: BatchOp, settings: SettingsSnapshot) -> list[dict]:
+    q = op.query.lower()
+    scores = _store.scores_snapshot()
+    matches = [a for a in _store.snapshot() if q in a.name.lower()]
+    matches.sort(key=lambda a: scores[a.id]["score"] if a.id in scores else -1, reverse=True)
+    return [
+        {"id": a.id, "name": a.name, "status": a.status.value, "location": a.location,
+         "score": scores[a.id]["score"] if a.id in scores else None}
+        for a in matches[:max(0, min(op.limit, 200))]
+    ]
+
+
+def _batch_get(op: BatchOp, settings: SettingsSnapshot) -> bytes:
+    applicant = _store.get(op.id)
+    if applicant is None:
+        raise HTTPException(404, "Applicant not found")
+    return _applicant_fragment(applicant)
+
+
+def _batch_score(op: BatchOp, settings: SettingsSnapshot) -> dict:
+    applicant = _store.get(op.id)
+    if applicant is None:
+        raise HTTPException(404, "Applicant not found")
+    result = _score(applicant, settings)
+    _store.set_score(op.id, result)
+    return result
+
+
+def _batch_preview(op: BatchOp, settings: SettingsSnapshot) -> bytes:
+    if len(op.ids) > MAX_PREVIEW_PAGE:
+        raise HTTPException(422, f"'preview' takes at most {MAX_PREVIEW_PAGE} ids; page larger selections "
+                                 "with /api/email/preview/page")
+    return join_array(_preview_fragments(op.ids, settings))
+
+
+# op -> (handler, required fields); handlers get the op and the batch's settings snapshot and
+# return a JSON-able value or encoded bytes.
+_BATCH_OPS = {
+    "get": (_batch_get, ("id",)),
+    "search": (_batch_search, ("query",)),
+    "score": (_batch_score, ("id",)),
+    "status": (lambda op, settings: update_status(op.id, StatusUpdate(status=op.status)), ("id", "status")),
+    "preview": (_batch_preview, ("ids",)),
+}
+
+
+@app.post("/api/batch")
+def run_batch(body: BatchRequest):
+    """Run agent sub-operations in order, each with its own status, in one round trip."""
+    if len(body.ops) > MAX_BATCH_OPS:
+        raise HTTPException(400, f"At most {MAX_BATCH_OPS} operations per batch")
+    settings = _settings_store.current()
+    results, succeeded, failed = [], 0, 0
+    for op in body.ops:
+        entry = {"op": op.op, "id": op.id} if op.id else {"op": op.op}
+        if failed and body.stop_on_error:
+            results.append(join_object({**entry, "ok": False, "status": 424, "error": "Skipped after an earlier failure"}))
+            continue
+        try:
+            handler, required = _BATCH_OPS.get(op.op, (None, ()))
+            if handler is None:
+                raise HTTPException(400, f"Unknown op; use one of: {', '.join(_BATCH_OPS)}")
+            missing = [field for field in required if not getattr(op, field)]
+            if missing:
+                raise HTTPException(422, f"'{op.op}' needs {' and '.join(missing)}")
+            result = handler(op, settings)
+        except HTTPException as e:
+            failed += 1
+            results.append(join_object({**entry, "ok": False, "status": e.status_code, "error": e.detail}))
+            continue
+        succeeded += 1
+        results.append(join_object({**entry, "ok": True, "status": 200, "result": result}))
+    return json_response(join_object({
+        "results": join_array(results), "succeeded": succeeded, "failed": failed,
+        "skipped": len(body.ops) - succeeded - failed,
+    }))
+
+
+_BULK_TARGETS = {"send_invite": Status.AWAITING_REPLY, "reject": Status.REJECTED, "book_interview": Status.BOOKED}
 
 
 class BulkAction(BaseModel):
@@ -282,56 +1134,69 @@ class BulkAction(BaseModel):
 
 @app.post("/api/bulk")
 def bulk_action(body: BulkAction):
-    results = []
-    for aid in body.applicant_ids:
-        if aid not in _applicant_store:
-            continue
-        applicant = _applicant_store[aid]
-        name = f"{applicant['first_name']} {applicant['last_name']}"
-        sd = _scores_cache.get(aid)
-
-        if body.action == "send_invite":
-            email_body = _render_email(_settings["email"]["template"], applicant, sd)
-            mode = _settings["email"]["mode"]
-            to_email = applicant["email"] if mode == "real" else _settings["email"].get("mock_email", "test@demo.com")
-            results.append({
-                "id": aid, "name": name, "email": to_email, "actual_email": applicant["email"],
-                "action": "invite_sent", "mode": mode,
-                "subject": _settings["email"]["subject"], "body": email_body,
-            })
-            _applicant_store[aid]["status"] = "awaiting_reply"
-            _applicant_store[aid]["email_sent_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        elif body.action == "reject":
-            results.append({"id": aid, "name": name, "action": "rejected"})
-            _applicant_store[aid]["status"] = "rejected"
-
-        elif body.action == "book_interview":
-            slot_hour = 8 + (len(results) % 8)
-            calendar_event = {
-                "title": f"Ski Lift Operator Interview — {name}",
-                "date": "2026-03-05",
-                "time": f"{slot_hour:02d}:00",
-                "location": "Vail Mountain Operations HQ, Room A2",
-                "duration": "30 min",
-            }
-            results.append({"id": aid, "name": name, "action": "interview_booked", "calendar_event": calendar_event})
-            _applicant_store[aid]["status"] = "booked"
-            _applicant_store[aid]["calendar_event"] = calendar_event
-
-    return {"action": body.action, "processed": len(results), "results": results}
+    with JOBS_IN_FLIGHT.track(job="bulk"):
+        target = _BULK_TARGETS.get(body.action)
+        settings = _settings_store.current()
+        ids = [aid for aid in dict.fromkeys(body.applicant_ids) if aid in _store] if target else []
+        outcome = _pipeline.apply({aid: target for aid in ids}, atomic=False)
+        results = []
+        for aid in ids:
+            if aid not in outcome.applied:
+                continue
+            applicant = outcome.applied[aid][1]
+            name = applicant.name
+
+            if body.action == "send_invite":
+                email_body, _ = _invite(applicant, _store.score(aid), settings)
+                results.append({
+                    "id": aid, "name": name, "email": _recipient(applicant, settings), "actual_email": applicant.email,
+                    "action": "invite_sent", "mode": settings["email"]["mode"],
+                    "subject": settings["email"]["subject"], "body": email_body,
+                })
+            elif body.action == "reject":
+                results.append({"id": aid, "name": name, "action": "rejected"})
+            elif body.action == "book_interview":
+                results.append({
+                    "id": aid, "name": name, "action": "interview_booked", "calendar_event": applicant.calendar_event,
+                })
+
+        response = {"action": body.action, "processed": len(results), "results": results}
+        unscheduled = [aid for aid, reason in outcome.errors.items() if reason == "no_slot_available"]
+        if unscheduled:
+            response["unscheduled"] = unscheduled
+        skipped = {aid: reason for aid, reason in outcome.errors.items() if reason != "no_slot_available"}
+        if skipped:
+            response["skipped"] = skipped
+        if body.action == "send_invite" and results:
+            response["dispatch_job"] = _mailer.submit([
+                {"applicant_id": r["id"], "to": r["email"], "subject": r["subject"], "body": r["body"]} for r in results
+            ])
+        return response
+
+
+@app.get("/api/email/jobs")
+def list_email_jobs():
+    return {"jobs": _mailer.jobs()}
+
+
+@app.get("/api/email/jobs/{job_id}")
+def get_email_job(job_id: str, messages: bool = False):
+    job = _mailer.job(job_id, include_messages=messages)
+    if job is None:
+        raise HTTPException(404, "Dispatch job not found")
+    return job
 
 
 @app.post("/api/simulate-response/{applicant_id}")
 def simulate_response(applicant_id: str):
-    if applicant_id not in _applicant_store:
+    applicant = _store.get(applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    applicant = _applicant_store[applicant_id]
-    sd = _scores_cache.get(applicant_id)
+    sd = _store.score(applicant_id)
     resume_score = sd["score"] if sd else 50
 
-    ski_years = sum(e.get("years", 0) for e in applicant["resume"]["experience"] if e.get("ski_related"))
-    first = applicant["first_name"]
+    ski_years = applicant.resume.ski_years
+    first = applicant.first_name
 
     if resume_score >= 75:
         template = random.choice(MOCK_RESPONSES_HIGH)
@@ -343,7 +1208,7 @@ def simulate_response(applicant_id: str):
     response_text = template.format(
         first_name=first,
         ski_years=ski_years if ski_years > 0 else "a few",
-        company=applicant["resume"]["experience"][0]["company"] if applicant["resume"]["experience"] else "my previous resort",
+        company=applicant.resume.experience[0].company if applicant.resume.experience else "my previous resort",
     )
     response_score = _score_response(response_text, applicant)
     response_data = {
@@ -351,10 +1216,19 @@ def simulate_response(applicant_id: str):
         "received_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
         **response_score,
     }
-    _applicant_store[applicant_id]["response_data"] = response_data
+    _store.update(applicant_id, lambda a: a.with_changes(response_data=response_data))
     return {"id": applicant_id, "response_data": response_data}
 
 
+@app.post("/api/inbox/poll")
+def poll_inbox():
+    if _inbox is None:
+        raise HTTPException(404, "No inbox configured; set HR_INBOX_PATH")
+    stats = _inbox.poll()
+    _count_inbox(stats)
+    return stats
+
+
 class ScoreResponseRequest(BaseModel):
     applicant_id: str
     text: str
@@ -362,15 +1236,16 @@ class ScoreResponseRequest(BaseModel):
 
 @app.post("/api/score-response")
 def score_response_endpoint(body: ScoreResponseRequest):
-    if body.applicant_id not in _applicant_store:
+    applicant = _store.get(body.applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    applicant = _applicant_store[body.applicant_id]
     result = _score_response(body.text, applicant)
-    _applicant_store[body.applicant_id]["response_data"] = {
+    response_data = {
         "text": body.text,
         "received_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
         **result,
     }
+    _store.update(body.applicant_id, lambda a: a.with_changes(response_data=response_data))
     return result
 
 
@@ -381,39 +1256,49 @@ class CandidateReply(BaseModel):
 
 @app.post("/api/simulate-reply")
 def simulate_candidate_reply(body: CandidateReply):
-    if body.applicant_id not in _applicant_store:
+    applicant = _store.get(body.applicant_id)
+    if applicant is None:
         raise HTTPException(404, "Applicant not found")
-    applicant = _applicant_store[body.applicant_id]
     msg_lower = body.message.lower()
     if any(w in msg_lower for w in ["confirm", "yes", "available", "accept"]):
-        reply = f"Hi {applicant['first_name']},\n\nThank you for confirming! Your interview is on March 5th at Vail Mountain Operations HQ. Bring a valid ID and any certification documents.\n\nSee you then!\n\nMountain Ops HR"
+        reply = f"Hi {applicant.first_name},\n\nThank you for confirming! Your interview is on March 5th at Vail Mountain Operations HQ. Bring a valid ID and any certification documents.\n\nSee you then!\n\nMountain Ops HR"
     elif any(w in msg_lower for w in ["reschedule", "different", "change"]):
-        reply = f"Hi {applicant['first_name']},\n\nAbsolutely! We have openings March 6th (9am–3pm) or March 7th (8am–2pm).\n\nMountain Ops HR"
+        reply = f"Hi {applicant.first_name},\n\nAbsolutely! We have openings March 6th (9am–3pm) or March 7th (8am–2pm).\n\nMountain Ops HR"
     elif any(w in msg_lower for w in ["salary", "pay", "wage"]):
-        reply = f"Hi {applicant['first_name']},\n\nThe position pays $22–26/hour plus a full ski pass. Full details at interview.\n\nMountain Ops HR"
+        reply = f"Hi {applicant.first_name},\n\nThe position pays $22–26/hour plus a full ski pass. Full details at interview.\n\nMountain Ops HR"
     else:
-        reply = f"Hi {applicant['first_name']},\n\nThank you for reaching out! Our team will follow up within 24 hours.\n\nMountain Ops HR"
-    return {"applicant": f"{applicant['first_name']} {applicant['last_name']}", "ai_drafted_reply": reply}
+        reply = f"Hi {applicant.first_name},\n\nThank you for reaching out! Our team will follow up within 24 hours.\n\nMountain Ops HR"
+    return {"applicant": applicant.name, "ai_drafted_reply": reply}
 
 
 @app.get("/api/settings")
 def get_settings():
-    return _settings
+    return json_response(_settings_store.current().encoded)
 
 
 @app.put("/api/settings")
 def update_settings(new_settings: dict):
-    global _settings
-    _settings = new_settings
-    return _settings
+    """Validate and publish the next settings version; sections left out keep their values."""
+    try:
+        snapshot = _settings_store.update(new_settings)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return json_response(snapshot.encoded)
+
+
+@app.get("/api/schedule")
+def get_schedule():
+    return _scheduler.summary()
 
 
 @app.post("/api/paycom/refresh")
 def paycom_refresh():
-    global _applicant_store, _scores_cache
-    _applicant_store = {a["id"]: dict(a) for a in APPLICANTS}
-    _scores_cache = {}
-    return {"refreshed": True, "applicant_count": len(_applicant_store)}
+    _store.reset(_seed_records())
+    _scheduler.clear()
+    _applicant_json.clear()
+    _preview_json.clear()
+    _email_renders.clear()
+    return {"refreshed": True, "applicant_count": len(_store)}
 
 
 class UploadedResume(BaseModel):
@@ -421,26 +1306,86 @@ class UploadedResume(BaseModel):
     last_name: str
     email: str
     location: str
-    distance_miles: float
+    # Only used when the location is not in the gazetteer.
+    distance_miles: Optional[float] = None
     resume_text: str
 
 
-@app.post("/api/upload-resume")
-def upload_resume(body: UploadedResume):
+_DEFAULT_DISTANCE_MILES = 50.0
+
+
+def _upload_distance(body: UploadedResume) -> tuple[float, str]:
+    """Miles from the job and where the figure came from: the gazetteer, the form, or the default."""
+    miles = _geocoded_miles(body.location)
+    if miles is not None:
+        return miles, "geocoded"
+    if body.distance_miles is not None:
+        return body.distance_miles, "reported"
+    return _DEFAULT_DISTANCE_MILES, "default"
+
+
+def _add_uploaded(body: UploadedResume) -> dict:
     parsed = _parse_freeform_resume(body.resume_text)
-    new_id = f"PAY-UPL-{len(_applicant_store) + 1:04d}"
-    applicant = {
-        "id": new_id, "first_name": body.first_name, "last_name": body.last_name,
-        "email": body.email, "phone": "N/A", "location": body.location,
-        "distance_miles": body.distance_miles, "applied_date": time.strftime("%Y-%m-%d"),
-        "status": "new", "resume": parsed,
+    distance, distance_source = _upload_distance(body)
+    new_id = _store.allocate_id("PAY-UPL-")
+    applicant = Applicant(
+        id=new_id, first_name=body.first_name, last_name=body.last_name,
+        email=body.email, phone="N/A", location=body.location,
+        distance_miles=distance, applied_date=time.strftime("%Y-%m-%d"),
+        status=Status.NEW, resume=Resume.from_dict(parsed),
+    )
+    _store.add(applicant)
+    score_result = _score(applicant)
+    _store.set_score(new_id, score_result)
+    return {
+        "id": new_id, "applicant": applicant.to_dict(), "score_data": score_result,
+        "distance_source": distance_source,
+        "possible_duplicates": _dupes.candidates(new_id)[:5],
     }
-    _applicant_store[new_id] = applicant
-    score_result = score_applicant(applicant)
-    _scores_cache[new_id] = score_result
-    return {"id": new_id, "applicant": applicant, "score_data": score_result}
 
 
+@app.post("/api/upload-resume")
+def upload_resume(body: UploadedResume):
+    return _add_uploaded(body)
+
+
+@app.post("/api/upload-resume/file")
+async def upload_resume_file(request: Request):
+    """Multipart form: ``file`` (PDF, DOCX or plain text) plus the ``UploadedResume`` fields except ``resume_text``."""
+    kind = "unknown"
+    try:
+        upload = await spool(request)
+        try:
+            fields = upload.fields
+            missing = [k for k in ("first_name", "last_name", "email") if not fields.get(k, "").strip()]
+            if missing:
+                raise UploadRejected(422, f"Missing form fields: {', '.join(missing)}")
+            try:
+                distance = float(fields["distance_miles"]) if fields.get("distance_miles") else None
+            except ValueError:
+                raise UploadRejected(422, "distance_miles must be a number") from None
+            kind = await anyio.to_thread.run_sync(detect_kind, upload.path, upload.filename)
+            text = await _extractor.extract(upload.path, kind)
+        finally:
+            upload.discard()
+        if not text:
+            raise UploadRejected(422, f"No text found in the {kind} file (scanned PDFs are not supported)")
+    except UploadRejected as e:
+        RESUME_UPLOADS.inc(kind=kind, result=str(e.status))
+        raise HTTPException(e.status, e.detail, headers={"Retry-After": "5"} if e.status == 503 else None)
+    body = UploadedResume(
+        first_name=fields["first_name"].strip(), last_name=fields["last_name"].strip(),
+        email=fields["email"].strip(), location=fields.get("location", "").strip(),
+        distance_miles=distance, resume_text=text,
+    )
+    # Parsing, scoring and the store writes are synchronous; keep them off the event loop too.
+    result = await anyio.to_thread.run_sync(_add_uploaded, body)
+    RESUME_UPLOADS.inc(kind=kind, result="added")
+    result["source"] = {"filename": upload.filename, "kind": kind, "bytes": upload.size, "chars": len(text)}
+    return result
+
+
+@timed("parse_freeform_resume")
 def _parse_freeform_resume(text: str) -> dict:
     text_lower = text.lower()
     ski_kws = ["ski", "lift", "resort", "snowboard", "mountain"]
@@ -479,4 +1424,7 @@ def _parse_freeform_resume(text: str) -> dict:
 
 static_dir = os.path.join(os.path.dirname(__file__), "../frontend/dist")
 if os.path.exists(static_dir):
-    app.mount("/", StaticFiles(directory=static_dir, html=True), name="static")
+    from compression import PrecompressedStaticFiles
+    app.mount("/", PrecompressedStaticFiles(directory=static_dir, html=True), name="static")
+
+STARTUP["module_s"] = round(time.perf_counter() - _STARTED, 4)
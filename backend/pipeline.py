@@ -0,0 +1,177 @@
+"""Declarative applicant status state machine.
+
+``TRANSITIONS`` lists where each status may move to. ``ON_ENTER`` and
+``ON_EXIT`` name the side effects tied to a status, such as stamping
+``email_sent_at`` or reserving an interview slot. The handlers are registered
+by the app as ``Effect`` objects.
+
+``Pipeline.apply`` works on a whole batch:
+
+- it validates every transition up front;
+- it runs each effect once for all applicants that need it;
+- it writes the records with a single ``update_many`` and then calls
+  ``on_batch`` once with per-edge counts.
+
+In atomic mode any failure, including a record changed by another writer in
+the meantime, leaves the store untouched and compensates effects already
+prepared.
+"""
+import collections
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from records import Applicant, Status
+from store import ApplicantStore
+
+S = Status
+TRANSITIONS: dict[Status, frozenset] = {
+    S.NEW: frozenset({S.REVIEWING, S.SHORTLISTED, S.AWAITING_REPLY, S.BOOKED, S.REJECTED}),
+    S.REVIEWING: frozenset({S.NEW, S.SHORTLISTED, S.AWAITING_REPLY, S.BOOKED, S.REJECTED}),
+    S.SHORTLISTED: frozenset({S.REVIEWING, S.AWAITING_REPLY, S.BOOKED, S.REJECTED}),
+    S.AWAITING_REPLY: frozenset({S.SHORTLISTED, S.BOOKED, S.REJECTED}),
+    S.BOOKED: frozenset({S.SHORTLISTED, S.AWAITING_REPLY, S.HIRED, S.REJECTED}),
+    S.REJECTED: frozenset({S.REVIEWING, S.SHORTLISTED}),
+    S.HIRED: frozenset({S.BOOKED}),
+}
+
+# Enter effects also run when re-entering the same status (re-sending an invite restamps it).
+ON_ENTER: dict[Status, tuple[str, ...]] = {
+    S.AWAITING_REPLY: ("stamp_email_sent",),
+    S.BOOKED: ("reserve_interview",),
+}
+ON_EXIT: dict[Status, tuple[str, ...]] = {
+    S.BOOKED: ("release_interview",),
+}
+
+Move = tuple[Applicant, Status]
+
+
+@dataclass(frozen=True)
+class Effect:
+    """``prepare`` returns field changes per applicant ID; IDs it leaves out fail with ``failure``."""
+    prepare: Callable[[list[Move]], dict[str, dict]]
+    commit: Optional[Callable[[list[Move]], None]] = None
+    rollback: Optional[Callable[[list[Move]], None]] = None
+    failure: str = "effect_failed"
+
+
+class TransitionError(Exception):
+    def __init__(self, errors: dict[str, str]):
+        super().__init__(f"{len(errors)} transition(s) rejected")
+        self.errors = errors
+
+
+def allowed(source: Status, target: Status) -> bool:
+    return source is target or target in TRANSITIONS[source]
+
+
+def allowed_targets(source: Status) -> list[str]:
+    return sorted(t.value for t in TRANSITIONS[Status(source)])
+
+
+@dataclass
+class BatchResult:
+    applied: dict[str, tuple[Applicant, Applicant]]
+    errors: dict[str, str]
+
+
+class _Stale(Exception):
+    pass
+
+
+class Pipeline:
+    def __init__(self, store: ApplicantStore, effects: dict[str, Effect],
+                 on_batch: Optional[Callable[[collections.Counter], None]] = None):
+        self.store = store
+        self.effects = effects
+        self.on_batch = on_batch
+
+    def apply(self, targets: dict[str, str], changes: Optional[dict[str, dict]] = None,
+              atomic: bool = True, only_from: Optional[Status] = None) -> BatchResult:
+        """Move each applicant to ``targets[id]``, also writing ``changes[id]`` if given.
+
+        Atomic batches raise ``TransitionError`` with every rejected ID. Otherwise invalid
+        transitions are skipped and reported in ``BatchResult.errors``. With ``only_from``,
+        applicants in any other status are left alone and reported as ``not_<status>``.
+        """
+        changes = changes or {}
+        errors: dict[str, str] = {}
+        moves: dict[str, Move] = {}
+        for applicant_id, target in targets.items():
+            try:
+                target = Status(target)
+            except ValueError:
+                errors[applicant_id] = "unknown_status"
+                continue
+            record = self.store.get(applicant_id)
+            if record is None:
+                errors[applicant_id] = "not_found"
+            elif only_from is not None and record.status is not only_from:
+                errors[applicant_id] = f"not_{only_from.value}"
+            elif not allowed(record.status, target):
+                errors[applicant_id] = f"invalid_transition:{record.status.value}->{target.value}"
+            else:
+                moves[applicant_id] = (record, target)
+        if atomic and errors:
+            raise TransitionError(errors)
+
+        prepared: list[tuple[Effect, list[Move]]] = []
+        updates = {aid: dict(changes.get(aid, ())) for aid in moves}
+        for name, batch in self._effect_batches(moves.values()).items():
+            effect = self.effects[name]
+            result = effect.prepare(batch)
+            prepared.append((effect, batch))
+            for record, _ in batch:
+                if record.id in result:
+                    updates[record.id].update(result[record.id])
+                else:
+                    errors.setdefault(record.id, effect.failure)
+        if atomic and errors:
+            self._rollback(prepared, set(moves))
+            raise TransitionError(errors)
+
+        def transition(applicant_id: str, record: Applicant, target: Status):
+            def fn(current: Applicant) -> Applicant:
+                if current is not record:
+                    if atomic:
+                        raise _Stale(applicant_id)
+                    return current
+                return current.with_changes(status=target, **updates[applicant_id])
+            return fn
+
+        writes = {aid: transition(aid, record, target) for aid, (record, target) in moves.items() if aid not in errors}
+        try:
+            applied = self.store.update_many(writes, atomic=atomic)
+        except _Stale as e:
+            self._rollback(prepared, set(moves))
+            raise TransitionError({str(e): "conflict"}) from None
+        applied = {aid: ba for aid, ba in applied.items() if ba[0] is moves[aid][0] and ba[1] is not ba[0]}
+        for aid in moves:
+            if aid not in applied:
+                errors.setdefault(aid, "conflict")
+
+        self._rollback(prepared, set(errors))
+        for effect, batch in prepared:
+            done = [m for m in batch if m[0].id in applied]
+            if effect.commit and done:
+                effect.commit(done)
+        if self.on_batch and applied:
+            self.on_batch(collections.Counter((b.status, a.status) for b, a in applied.values()))
+        return BatchResult(applied, errors)
+
+    def _effect_batches(self, moves) -> dict[str, list[Move]]:
+        batches: dict[str, list[Move]] = {}
+        for record, target in moves:
+            names = ON_ENTER.get(target, ())
+            if record.status is not target:
+                names = ON_EXIT.get(record.status, ()) + names
+            for name in names:
+                batches.setdefault(name, []).append((record, target))
+        return batches
+
+    @staticmethod
+    def _rollback(prepared, failed_ids: set) -> None:
+        for effect, batch in prepared:
+            undo = [m for m in batch if m[0].id in failed_ids]
+            if effect.rollback and undo:
+                effect.rollback(undo)
@@ -0,0 +1,160 @@
+"""Opt-in sampling profiler for individual API requests.
+
+A request is profiled when it carries ``X-Profile: 1`` (matching
+``HR_PROFILE_TOKEN`` if one is set) or is picked by ``HR_PROFILE_SAMPLE_RATE``.
+While it runs, a background thread samples every thread's stack and keeps the
+ones passing through this backend's modules, so both async handlers on the
+event loop and sync handlers on the threadpool are covered. Output is in
+collapsed-stack format (``frame;frame;frame count``), ready for flamegraph.pl
+or speedscope. Concurrent requests can leak into each other's samples. With a
+token set, the ``/api/debug/profiles`` routes require the same ``X-Profile`` header.
+"""
+import collections
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+import anyio.to_thread
+
+SAMPLE_RATE = float(os.environ.get("HR_PROFILE_SAMPLE_RATE", "0"))
+TOKEN = os.environ.get("HR_PROFILE_TOKEN", "")
+INTERVAL = float(os.environ.get("HR_PROFILE_INTERVAL_MS", "5")) / 1000
+BUFFER_SIZE = int(os.environ.get("HR_PROFILE_BUFFER", "32"))
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass
+class Profile:
+    id: str
+    method: str
+    path: str
+    started_at: str
+    duration_ms: float = 0.0
+    samples: int = 0
+    stacks: dict = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id, "method": self.method, "path": self.path, "started_at": self.started_at,
+            "duration_ms": self.duration_ms, "samples": self.samples, "unique_stacks": len(self.stacks),
+        }
+
+    def collapsed(self) -> str:
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items(), key=lambda kv: -kv[1])]
+        return "\n".join(lines) + "\n"
+
+
+class ProfileBuffer:
+    """Bounded ring buffer of recent profiles; the oldest is evicted first."""
+
+    def __init__(self, size: int = BUFFER_SIZE):
+        self._profiles: collections.deque[Profile] = collections.deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def list(self) -> list[Profile]:
+        with self._lock:
+            return list(reversed(self._profiles))
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, interval: float = INTERVAL):
+        super().__init__(name="hr-profiler", daemon=True)
+        self.interval = interval
+        self.stacks: collections.Counter = collections.Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        names: dict = {}
+        while not self._stop_event.wait(self.interval):
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = _collapse(frame)
+                if not stack:
+                    continue
+                if ident not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                self.stacks[f"{names.get(ident, ident)};{stack}"] += 1
+
+    def stop(self) -> None:
+        """Ask the thread to finish; ``join()`` it (off the event loop) before reading results."""
+        self._stop_event.set()
+
+
+def authorized(header: Optional[str]) -> bool:
+    """Whether an ``X-Profile`` header value may read stored profiles."""
+    return not TOKEN or header == TOKEN
+
+
+def _collapse(frame) -> str:
+    frames = []
+    in_app = False
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_APP_DIR):
+            in_app = True
+        frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(frames)) if in_app else ""
+
+
+class ProfilingMiddleware:
+    def __init__(self, app, buffer: ProfileBuffer, sample_rate: float = SAMPLE_RATE, token: str = TOKEN):
+        self.app = app
+        self.buffer = buffer
+        self.sample_rate = sample_rate
+        self.token = token
+
+    def _wanted(self, scope) -> bool:
+        if not scope["path"].startswith("/api/") or scope["path"].startswith("/api/debug/"):
+            return False
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                value = value.decode("latin-1")
+                return value == self.token if self.token else value not in ("", "0")
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(
+            id=uuid.uuid4().hex[:12], method=scope["method"], path=scope["path"],
+            started_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        )
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile.id.encode())]
+            await send(message)
+
+        sampler = StackSampler()
+        sampler.start()
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            await anyio.to_thread.run_sync(sampler.join)
+            profile.duration_ms = round((time.perf_counter() - t0) * 1000, 3)
+            profile.samples = sampler.samples
+            profile.stacks = dict(sampler.stacks)
+            self.buffer.add(profile)
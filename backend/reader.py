@@ -0,0 +1,235 @@
+"""Read-only API workers for the multi-process deployment.
+
+    HR_ROLE=writer HR_SNAPSHOT_PATH=/tmp/hr.snap uvicorn main:app --port 8788
+    HR_SNAPSHOT_PATH=/tmp/hr.snap HR_WRITER_URL=http://127.0.0.1:8788 \\
+        uvicorn reader:app --port 8787 --workers 4
+
+Each worker maps the writer's snapshot (see ``snapshot.py``) and answers the
+dashboard's hot GETs from it: the applicant list in either sort order, single
+applicants, the job, settings and schedule. The responses are slices of the
+mapping, so every worker serves the same page-cache copy and read throughput
+grows with the worker count. Everything else, including all writes, is
+forwarded to the writer. A forwarded write waits for the snapshot that
+contains it before returning, so the next read through any worker sees it.
+Until the first snapshot appears, every request is forwarded.
+
+Small request bodies are read and sent whole. Larger ones (resume uploads) are
+streamed through to the writer chunk by chunk on their own connection, so a
+worker never holds an upload in memory. Bodies over the upload limit get 413
+here, like they would from the writer.
+"""
+import http.client
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Optional
+
+import anyio.from_thread
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from serialization import iter_array, json_response, json_stream_response
+from snapshot import GENERATION_HEADER, SnapshotReader
+from uploads import MAX_FIELD_BYTES, MAX_UPLOAD_BYTES
+
+SNAPSHOT_PATH = os.environ.get("HR_SNAPSHOT_PATH", "hr-snapshot.bin")
+WRITER_URL = os.environ.get("HR_WRITER_URL", "http://127.0.0.1:8788")
+FORWARD_TIMEOUT = float(os.environ.get("HR_FORWARD_TIMEOUT", "120"))
+# How long a forwarded write waits for its snapshot before returning anyway.
+SNAPSHOT_WAIT = float(os.environ.get("HR_SNAPSHOT_WAIT", "5"))
+GZIP_MIN_BYTES = int(os.environ.get("HR_GZIP_MIN_BYTES", "1024"))
+# Bodies up to this size are buffered, so they can be resent if a keep-alive connection went stale.
+BUFFERED_BODY_BYTES = 64 * 1024
+# The writer's own limit for a multipart upload: the file plus its form fields.
+MAX_BODY_BYTES = MAX_UPLOAD_BYTES + MAX_FIELD_BYTES
+# Connection-level headers are not forwarded; neither is Accept-Encoding, so the writer answers
+# uncompressed and this worker's GZipMiddleware compresses once.
+_HOP_HEADERS = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+    "transfer-encoding", "upgrade", "host", "content-length", "accept-encoding", "content-encoding",
+})
+_log = logging.getLogger("uvicorn.error")
+
+app = FastAPI(title="HR Resume Processing Demo (reader)")
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=6)
+
+_snapshots = SnapshotReader(SNAPSHOT_PATH)
+_writer = urllib.parse.urlsplit(WRITER_URL)
+_connections = threading.local()
+_stats = {"served": 0, "forwarded": 0, "forward_errors": 0, "write_waits_timed_out": 0}
+
+
+def _snapshot_headers(snap) -> dict:
+    return {"X-HR-Snapshot": str(snap.generation)}
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+def _connect() -> http.client.HTTPConnection:
+    return http.client.HTTPConnection(_writer.hostname, _writer.port or 80, timeout=FORWARD_TIMEOUT)
+
+
+def _send(conn: http.client.HTTPConnection, method: str, target: str, headers: list[tuple[str, str]],
+          body, length: Optional[int]):
+    """Send one request; ``body`` is bytes or an iterable of chunks, ``length`` None means chunked."""
+    conn.putrequest(method, target, skip_host=True, skip_accept_encoding=True)
+    conn.putheader("Host", _writer.netloc)
+    for name, value in headers:
+        conn.putheader(name, value)
+    conn.putheader(*(("Transfer-Encoding", "chunked") if length is None else ("Content-Length", str(length))))
+    conn.endheaders(body, encode_chunked=length is None)
+    resp = conn.getresponse()
+    return resp.status, resp.getheaders(), resp.read()
+
+
+def _stream_sync(method: str, target: str, headers: list[tuple[str, str]], chunks, length: Optional[int]):
+    """One request with a streamed body, on a fresh connection: a consumed stream cannot be resent."""
+    conn = _connect()
+    try:
+        return _send(conn, method, target, headers, chunks, length)
+    finally:
+        conn.close()
+
+
+def _body_chunks(request: Request, limit: int):
+    """The request body as a blocking iterator for a worker thread, cut off past ``limit`` bytes."""
+    stream = request.stream().__aiter__()
+    received = 0
+    while True:
+        try:
+            chunk = anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+        received += len(chunk)
+        if received > limit:
+            raise _BodyTooLarge()
+        if chunk:
+            yield chunk
+
+
+def _forward_sync(method: str, target: str, headers: list[tuple[str, str]], body: bytes):
+    """One request to the writer over this thread's keep-alive connection."""
+    for attempt in (0, 1):
+        conn = getattr(_connections, "conn", None)
+        reused = conn is not None
+        if conn is None:
+            conn = _connections.conn = _connect()
+        try:
+            return _send(conn, method, target, headers, body, len(body))
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            conn.close()
+            _connections.conn = None
+            # The writer closed an idle keep-alive connection; only then is a resend safe.
+            if not reused or attempt:
+                raise
+        except Exception:
+            conn.close()
+            _connections.conn = None
+            raise
+
+
+async def _forward(request: Request) -> Response:
+    target = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+    headers = [(k, v) for k, v in request.headers.items() if k.lower() not in _HOP_HEADERS]
+    declared = request.headers.get("content-length", "")
+    length = int(declared) if declared.isdigit() else None
+    if length is not None and length > MAX_BODY_BYTES:
+        raise HTTPException(413, f"Request body exceeds {MAX_BODY_BYTES // (1024 * 1024)} MB")
+    chunked = "transfer-encoding" in request.headers
+    _stats["forwarded"] += 1
+    try:
+        if chunked or (length or 0) > BUFFERED_BODY_BYTES:
+            status, resp_headers, content = await anyio.to_thread.run_sync(
+                _stream_sync, request.method, target, headers, _body_chunks(request, MAX_BODY_BYTES), length)
+        else:
+            body = await request.body()
+            status, resp_headers, content = await anyio.to_thread.run_sync(
+                _forward_sync, request.method, target, headers, body)
+    except _BodyTooLarge:
+        raise HTTPException(413, f"Request body exceeds {MAX_BODY_BYTES // (1024 * 1024)} MB")
+    except (OSError, http.client.HTTPException) as e:
+        _stats["forward_errors"] += 1
+        _log.warning("Forwarding %s %s to the writer failed: %s", request.method, target, e)
+        raise HTTPException(502, "The writer process is unavailable")
+    out = {k: v for k, v in resp_headers if k.lower() not in _HOP_HEADERS}
+    generation = next((v for k, v in resp_headers if k.lower() == GENERATION_HEADER), None)
+    if generation is not None and status < 400:
+        if not await _snapshots.wait_for(int(generation), SNAPSHOT_WAIT):
+            _stats["write_waits_timed_out"] += 1
+    return Response(content=content, status_code=status, headers=out)
+
+
+@app.get("/api/health")
+def health():
+    snap = _snapshots.current()
+    return {
+        "status": "ok", "role": "reader", "pid": os.getpid(),
+        "snapshot": None if snap is None else {
+            "generation": snap.generation, "applicants": len(snap),
+            "age_s": round(time.time() - snap.published_at, 3), "loads": _snapshots.loads,
+        },
+        **_stats,
+    }
+
+
+@app.get("/api/applicants")
+async def get_applicants(request: Request, sort: str = "score"):
+    snap = _snapshots.current()
+    if snap is None or (sort != "score" and not snap.has_order(sort)):
+        # Includes unknown sort keys, which the writer rejects.
+        return await _forward(request)
+    _stats["served"] += 1
+    if sort == "score":
+        response = json_response(snap.array())
+    else:
+        response = json_stream_response(iter_array(snap.ordered(sort)))
+    response.headers.update(_snapshot_headers(snap))
+    return response
+
+
+@app.get("/api/applicants/{applicant_id}")
+async def get_applicant(request: Request, applicant_id: str):
+    snap = _snapshots.current()
+    body = snap.item(applicant_id) if snap is not None else None
+    if body is None:
+        # Unknown here (or newer than the snapshot): the writer has the final word, including 404s.
+        return await _forward(request)
+    _stats["served"] += 1
+    response = json_response(body)
+    response.headers.update(_snapshot_headers(snap))
+    return response
+
+
+def _blob_route(name: str):
+    async def serve(request: Request):
+        snap = _snapshots.current()
+        body = snap.blob(name) if snap is not None else None
+        if body is None:
+            return await _forward(request)
+        _stats["served"] += 1
+        response = json_response(body)
+        response.headers.update(_snapshot_headers(snap))
+        return response
+    return serve
+
+
+for _path, _blob in (("/api/job", "job"), ("/api/settings", "settings"), ("/api/schedule", "schedule")):
+    app.add_api_route(_path, _blob_route(_blob), methods=["GET"])
+
+
+@app.api_route("/api/{path:path}", methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"])
+async def forward(request: Request, path: str):
+    return await _forward(request)
+
+
+static_dir = os.path.join(os.path.dirname(__file__), "../frontend/dist")
+if os.path.exists(static_dir):
+    from compression import PrecompressedStaticFiles
+    app.mount("/", PrecompressedStaticFiles(directory=static_dir, html=True), name="static")
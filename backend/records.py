@@ -0,0 +1,194 @@
+"""Compact in-memory applicant records.
+
+The API speaks nested dicts, but the store keeps frozen ``__slots__`` dataclasses:
+repeated strings are interned, statuses are enum singletons and the handful of
+availability combinations are shared instances. Records are immutable, so
+handlers can hand them out without copying and mutate by swapping in a new
+record built with ``dataclasses.replace``.
+"""
+import sys
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Optional
+
+
+class Status(str, Enum):
+    NEW = "new"
+    REVIEWING = "reviewing"
+    SHORTLISTED = "shortlisted"
+    AWAITING_REPLY = "awaiting_reply"
+    BOOKED = "booked"
+    REJECTED = "rejected"
+    HIRED = "hired"
+
+
+STATUS_VALUES = tuple(s.value for s in Status)
+
+
+def _intern(value) -> str:
+    return sys.intern(str(value))
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    title: str
+    company: str
+    years: int
+    ski_related: bool
+
+    def to_dict(self) -> dict:
+        return {"title": self.title, "company": self.company, "years": self.years, "ski_related": self.ski_related}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Experience":
+        return cls(_intern(d.get("title", "")), _intern(d.get("company", "")), d.get("years", 0), bool(d.get("ski_related")))
+
+
+@dataclass(frozen=True, slots=True)
+class Availability:
+    weekends: bool = False
+    holidays: bool = False
+    early_am: bool = False
+
+    def to_dict(self) -> dict:
+        return {"weekends": self.weekends, "holidays": self.holidays, "early_am": self.early_am}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Availability":
+        key = (bool(d.get("weekends")), bool(d.get("holidays")), bool(d.get("early_am")))
+        return _AVAILABILITY[key]
+
+
+_AVAILABILITY = {
+    (w, h, e): Availability(w, h, e)
+    for w in (False, True) for h in (False, True) for e in (False, True)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    summary: str
+    experience: tuple[Experience, ...]
+    certifications: tuple[str, ...]
+    availability: Availability
+    skills: tuple[str, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "summary": self.summary,
+            "experience": [e.to_dict() for e in self.experience],
+            "certifications": list(self.certifications),
+            "availability": self.availability.to_dict(),
+            "skills": list(self.skills),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Resume":
+        return cls(
+            summary=d.get("summary", ""),
+            experience=tuple(Experience.from_dict(e) for e in d.get("experience", [])),
+            certifications=tuple(_intern(c) for c in d.get("certifications", [])),
+            availability=Availability.from_dict(d.get("availability", {})),
+            skills=tuple(_intern(s) for s in d.get("skills", [])),
+        )
+
+    @property
+    def ski_years(self) -> int:
+        return sum(e.years for e in self.experience if e.ski_related)
+
+
+@dataclass(frozen=True, slots=True)
+class Applicant:
+    id: str
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    location: str
+    distance_miles: float
+    applied_date: str
+    status: Status
+    resume: Resume
+    email_sent_at: Optional[str] = None
+    calendar_event: Optional[dict] = None
+    response_data: Optional[dict] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    def with_changes(self, **changes) -> "Applicant":
+        if "status" in changes:
+            changes["status"] = Status(changes["status"])
+        return replace(self, **changes)
+
+    def to_dict(self) -> dict:
+        out = {
+            "id": self.id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "email": self.email,
+            "phone": self.phone,
+            "location": self.location,
+            "distance_miles": self.distance_miles,
+            "applied_date": self.applied_date,
+            "status": self.status.value,
+            "resume": self.resume.to_dict(),
+        }
+        if self.email_sent_at is not None:
+            out["email_sent_at"] = self.email_sent_at
+        if self.calendar_event is not None:
+            out["calendar_event"] = self.calendar_event
+        if self.response_data is not None:
+            out["response_data"] = self.response_data
+        return out
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Applicant":
+        return cls(
+            id=d["id"],
+            first_name=d["first_name"],
+            last_name=d["last_name"],
+            email=d["email"],
+            phone=d.get("phone", "N/A"),
+            location=_intern(d.get("location", "")),
+            distance_miles=float(d.get("distance_miles", 100)),
+            applied_date=_intern(d.get("applied_date", "")),
+            status=Status(d.get("status", "new")),
+            resume=Resume.from_dict(d["resume"]),
+            email_sent_at=d.get("email_sent_at"),
+            calendar_event=d.get("calendar_event"),
+            response_data=d.get("response_data"),
+        )
+
+
+def measure_footprint(count: int = 100_000) -> dict:
+    """Bytes per applicant for ``count`` fixture clones, as dicts vs records."""
+    import copy
+    import tracemalloc
+    from mock_data import APPLICANTS
+
+    def _measure(build) -> int:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        held = build()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del held
+        return (after - before) // count
+
+    def _clone(i: int) -> dict:
+        a = copy.deepcopy(APPLICANTS[i % len(APPLICANTS)])
+        a["id"] = f"PAY-{i:07d}"
+        a["email"] = f"applicant{i}@email.com"
+        return a
+
+    return {
+        "count": count,
+        "dict_bytes_per_applicant": _measure(lambda: [_clone(i) for i in range(count)]),
+        "record_bytes_per_applicant": _measure(lambda: [Applicant.from_dict(_clone(i)) for i in range(count)]),
+    }
+
+
+if __name__ == "__main__":
+    print(measure_footprint(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,222 @@
+"""BM25 relevance of applicant resumes to the job posting.
+
+The index holds an inverted list per term over each resume's summary,
+experience titles, certifications and skills. It follows the store through
+``ApplicantStore.subscribe``. The listener only queues the changed records,
+which keeps it cheap inside the writer's lock. Queued changes are folded in on
+the next read, so a bulk reset of 100k applicants costs nothing until someone
+asks for relevance.
+
+``scores()`` rates every applicant against the posting in one pass over the
+posting lists of the query terms. The result is cached until the index
+changes. Scores are scaled to 0-100 against the posting scored as if it were
+a resume, so a resume covering the posting as fully as the posting itself
+scores 100.
+Everything is local; no model or network is involved.
+"""
+import collections
+import gc
+import math
+import re
+import threading
+from typing import Optional
+
+from records import Applicant
+
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"[a-z][a-z0-9]+|\d+[a-z]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our the their to up was we were will with "
+    "you your all any must within who this that than into per".split()
+)
+_SUFFIXES = ("ations", "ation", "ators", "ator", "ating", "ates", "ate", "ings", "ing", "ies", "ied",
+             "ness", "ly", "ed", "es", "s")
+# Suffix -> shortest stem it may leave ("daily" and "early" keep their "ly").
+_MIN_STEM = {"ly": 4}
+_STEMS: dict[str, str] = {}
+_MAX_CACHED_WORDS = 500_000
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM.get(suffix, 3):
+            if suffix == "s" and word.endswith("ss"):
+                break
+            if suffix == "es" and not word.endswith(("sses", "xes", "zes", "ches", "shes")):
+                continue
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    out = []
+    for word in _WORD.findall(text.lower()):
+        stem = _STEMS.get(word)
+        if stem is None:
+            stem = "" if word in _STOPWORDS else _stem(word)
+            if len(_STEMS) < _MAX_CACHED_WORDS:
+                _STEMS[word] = stem
+        if stem:
+            out.append(stem)
+    return out
+
+
+def resume_text(applicant: Applicant) -> str:
+    r = applicant.resume
+    parts = [r.summary, *(f"{e.title} {e.company}" for e in r.experience), *r.certifications, *r.skills]
+    return " ".join(parts)
+
+
+def posting_text(posting: dict) -> str:
+    return " ".join([posting.get("title", ""), posting.get("description", ""), *posting.get("requirements", [])])
+
+
+class RelevanceIndex:
+    def __init__(self, query: str = ""):
+        self._lock = threading.Lock()
+        # Guards only the queue, so writers never wait for an index rebuild.
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, Applicant] = {}
+        self._reset_pending = False
+        self._slots: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._free: list[int] = []
+        self._lengths: list[int] = []
+        self._terms: list[Optional[dict[str, int]]] = []
+        self._postings: dict[str, dict[int, int]] = {}
+        self._total_length = 0
+        self._version = 0
+        self._cache: Optional[tuple[int, dict[str, float]]] = None
+        self.set_query(query)
+
+    # -- feeding ------------------------------------------------------------
+
+    def set_query(self, text: str) -> None:
+        words = {}
+        for word in _WORD.findall(text.lower()):
+            words.setdefault(_stem(word), word)
+        with self._lock:
+            self._query = collections.Counter(tokenize(text))
+            self._query_length = sum(self._query.values())
+            # Readable word for each query stem, for explanations.
+            self._words = {stem: words.get(stem, stem) for stem in self._query}
+            self._cache = None
+
+    def on_change(self, kind: str, payload) -> None:
+        """``ApplicantStore.subscribe`` listener."""
+        with self._pending_lock:
+            if kind == "reset":
+                self._reset_pending = True
+                self._pending = {r.id: r for r in payload}
+            elif kind == "add":
+                self._pending[payload.id] = payload
+            elif kind == "update":
+                for before, after in payload:
+                    if after.resume is not before.resume:
+                        self._pending[after.id] = after
+
+    def _drain(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            reset, self._reset_pending = self._reset_pending, False
+        if reset:
+            self._slots, self._ids, self._free, self._lengths, self._terms = {}, [], [], [], []
+            self._postings, self._total_length = {}, 0
+        if not pending and not reset:
+            return
+        # Large batches allocate millions of small objects; keep the collector out of the way.
+        was_enabled = gc.isenabled() and len(pending) > 10_000
+        if was_enabled:
+            gc.disable()
+        try:
+            for applicant_id, record in pending.items():
+                self._remove(applicant_id)
+                self._add(record)
+        finally:
+            if was_enabled:
+                gc.enable()
+        self._version += 1
+
+    def _add(self, applicant: Applicant) -> None:
+        counts = collections.Counter(tokenize(resume_text(applicant)))
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot], self._terms[slot] = applicant.id, counts
+            self._lengths[slot] = sum(counts.values())
+        else:
+            slot = len(self._ids)
+            self._ids.append(applicant.id)
+            self._terms.append(counts)
+            self._lengths.append(sum(counts.values()))
+        self._slots[applicant.id] = slot
+        self._total_length += self._lengths[slot]
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[slot] = tf
+
+    def _remove(self, applicant_id: str) -> None:
+        slot = self._slots.pop(applicant_id, None)
+        if slot is None:
+            return
+        for term in self._terms[slot]:
+            posting = self._postings[term]
+            del posting[slot]
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._lengths[slot]
+        self._ids[slot], self._terms[slot], self._lengths[slot] = None, None, 0
+        self._free.append(slot)
+
+    # -- scoring ------------------------------------------------------------
+
+    def _weights(self) -> tuple[dict[str, float], float, float]:
+        """Per-term idf, the average resume length and the posting's own raw score."""
+        n = len(self._slots)
+        weights = {}
+        for term in self._query:
+            df = len(self._postings.get(term, ()))
+            weights[term] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        avg = self._total_length / n if n else 1.0
+        norm = K1 * (1 - B + B * self._query_length / avg)
+        best = sum(w * tf * (K1 + 1) / (tf + norm) for w, tf in zip(weights.values(), self._query.values()))
+        return weights, avg, best
+
+    def scores(self) -> dict[str, float]:
+        """Relevance (0-100, one decimal) of every indexed applicant."""
+        with self._lock:
+            self._drain()
+            if self._cache is not None and self._cache[0] == self._version:
+                return self._cache[1]
+            weights, avg, best = self._weights()
+            acc = [0.0] * len(self._ids)
+            lengths = self._lengths
+            norm = [K1 * (1 - B + B * length / avg) for length in lengths]
+            for term, weight in weights.items():
+                for slot, tf in self._postings.get(term, {}).items():
+                    acc[slot] += weight * tf * (K1 + 1) / (tf + norm[slot])
+            scale = 100 / best if best else 0.0
+            out = {aid: min(100.0, round(acc[slot] * scale, 1)) for aid, slot in self._slots.items()}
+            self._cache = (self._version, out)
+            return out
+
+    def score(self, applicant_id: str) -> Optional[float]:
+        return self.scores().get(applicant_id)
+
+    def explain(self, applicant_id: str, limit: int = 5) -> list[str]:
+        """Posting words contributing most to one applicant's relevance, best first."""
+        with self._lock:
+            self._drain()
+            slot = self._slots.get(applicant_id)
+            if slot is None:
+                return []
+            weights, avg, _ = self._weights()
+            norm = K1 * (1 - B + B * self._lengths[slot] / avg)
+            counts = self._terms[slot]
+            parts = {t: w * counts[t] * (K1 + 1) / (counts[t] + norm) for t, w in weights.items() if t in counts}
+        return [self._words[t] for t in sorted(parts, key=parts.get, reverse=True)[:limit]]
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._drain()
+            return {"documents": len(self._slots), "terms": len(self._postings), "query_terms": sorted(self._query)}
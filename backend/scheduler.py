@@ -0,0 +1,291 @@
+"""Conflict-free interview slot allocation.
+
+The calendar is a grid of fixed-length slots on the configured weekdays. Each
+slot has one seat per room/interviewer pair, so its capacity is
+``min(len(rooms), len(interviewers))``. Slot starts that may still have a free
+seat are kept in a min-heap of minute offsets, so the earliest open slot is at
+the top. A slot that fills up stays in the heap until it reaches the top and is
+dropped there, and a release pushes it back, so each booking costs O(log n).
+Weeks are added lazily up to ``max_weeks``, so a batch of thousands of
+candidates simply rolls forward into later weeks.
+
+Every reservation in a ``reserve_many`` call happens under one lock. Concurrent
+bulk calls therefore never hand out the same seat, and re-booking an applicant
+who already holds a slot returns that slot unchanged.
+"""
+import heapq
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+DEFAULT_CONFIG = {
+    "start_date": "2026-03-05",
+    "weekdays": ["Tue", "Wed", "Thu"],
+    "day_start": "08:00",
+    "day_end": "16:00",
+    "slot_minutes": 30,
+    "location": "Vail Mountain Operations HQ",
+    "rooms": ["Room A2", "Room B1"],
+    "interviewers": ["Lift Supervisor", "HR Coordinator"],
+    "max_weeks": 52,
+}
+
+_WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+_MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class Reservation:
+    applicant_id: str
+    start: datetime
+    minutes: int
+    location: str
+    room: str
+    interviewer: str
+
+    def calendar_event(self, title: str) -> dict:
+        return {
+            "title": title,
+            "date": self.start.strftime("%Y-%m-%d"),
+            "time": self.start.strftime("%H:%M"),
+            "location": f"{self.location}, {self.room}",
+            "duration": f"{self.minutes} min",
+            "room": self.room,
+            "interviewer": self.interviewer,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _Grid:
+    origin: datetime
+    weekdays: frozenset
+    day_start: int
+    day_end: int
+    slot_minutes: int
+    location: str
+    rooms: tuple
+    interviewers: tuple
+    max_weeks: int
+
+    @property
+    def capacity(self) -> int:
+        return min(len(self.rooms), len(self.interviewers))
+
+    def is_slot(self, key: int) -> bool:
+        if key < 0 or key >= self.max_weeks * 7 * _MINUTES_PER_DAY:
+            return False
+        day, minute = divmod(key, _MINUTES_PER_DAY)
+        return (
+            (self.origin + timedelta(days=day)).weekday() in self.weekdays
+            and self.day_start <= minute <= self.day_end - self.slot_minutes
+            and (minute - self.day_start) % self.slot_minutes == 0
+        )
+
+    def overlapping(self, key: int, minutes: int) -> Iterable[int]:
+        """Grid slots that intersect ``[key, key + minutes)``; a reservation never crosses midnight."""
+        base = key // _MINUTES_PER_DAY * _MINUTES_PER_DAY + self.day_start
+        steps = max(0, -(-(key - self.slot_minutes + 1 - base) // self.slot_minutes))
+        for slot in range(base + steps * self.slot_minutes, key + minutes, self.slot_minutes):
+            if self.is_slot(slot):
+                yield slot
+
+    def week_slots(self, week: int) -> Iterable[int]:
+        for day in range(week * 7, week * 7 + 7):
+            if (self.origin + timedelta(days=day)).weekday() in self.weekdays:
+                base = day * _MINUTES_PER_DAY
+                for minute in range(self.day_start, self.day_end - self.slot_minutes + 1, self.slot_minutes):
+                    yield base + minute
+
+
+def _minutes(value: str) -> int:
+    hours, _, minutes = value.partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
+def parse_config(config: dict) -> _Grid:
+    """Validate a ``settings["scheduling"]`` dict; raises ``ValueError`` on bad input."""
+    merged = {**DEFAULT_CONFIG, **(config or {})}
+    try:
+        origin = datetime.strptime(merged["start_date"], "%Y-%m-%d")
+        weekdays = frozenset(_WEEKDAYS.index(str(d).strip().lower()[:3]) for d in merged["weekdays"])
+        day_start, day_end = _minutes(merged["day_start"]), _minutes(merged["day_end"])
+        slot_minutes = int(merged["slot_minutes"])
+        max_weeks = int(merged["max_weeks"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid scheduling settings: {e}") from e
+    rooms, interviewers = tuple(merged["rooms"]), tuple(merged["interviewers"])
+    if not weekdays:
+        raise ValueError("Invalid scheduling settings: no interview weekdays")
+    if slot_minutes <= 0 or not 0 <= day_start < day_end <= _MINUTES_PER_DAY or day_end - day_start < slot_minutes:
+        raise ValueError("Invalid scheduling settings: day window does not fit one slot")
+    if not rooms or not interviewers:
+        raise ValueError("Invalid scheduling settings: need at least one room and one interviewer")
+    if max_weeks <= 0:
+        raise ValueError("Invalid scheduling settings: max_weeks must be positive")
+    return _Grid(origin, weekdays, day_start, day_end, slot_minutes, str(merged["location"]),
+                 rooms, interviewers, max_weeks)
+
+
+class Scheduler:
+    def __init__(self, config: Optional[dict] = None):
+        self._lock = threading.Lock()
+        self._by_applicant: dict[str, Reservation] = {}
+        self._grid = parse_config(config or DEFAULT_CONFIG)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._by_applicant)
+
+    def get(self, applicant_id: str) -> Optional[Reservation]:
+        return self._by_applicant.get(applicant_id)
+
+    def configure(self, config: dict) -> None:
+        """Switch to a new grid, keeping existing reservations that still fit in it."""
+        grid = parse_config(config)
+        with self._lock:
+            self._grid = grid
+            self._rebuild()
+
+    def restore(self, events: dict[str, dict]) -> None:
+        """Re-adopt bookings recorded on applicants (``id -> calendar_event``), e.g. after a replay."""
+        with self._lock:
+            for applicant_id, event in events.items():
+                try:
+                    start = datetime.strptime(f"{event['date']} {event['time']}", "%Y-%m-%d %H:%M")
+                    minutes = int(str(event.get("duration", self._grid.slot_minutes)).split()[0])
+                except (KeyError, ValueError):
+                    continue
+                if event.get("room"):
+                    self._by_applicant[applicant_id] = Reservation(
+                        applicant_id=applicant_id, start=start, minutes=minutes,
+                        location=event.get("location", "").rsplit(", ", 1)[0],
+                        room=event["room"], interviewer=event.get("interviewer", ""),
+                    )
+            self._rebuild()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_applicant = {}
+            self._rebuild()
+
+    def _key(self, start: datetime) -> int:
+        return int((start - self._grid.origin).total_seconds() // 60)
+
+    def _seat(self, reservation: Reservation) -> Optional[int]:
+        try:
+            seat = self._grid.rooms.index(reservation.room)
+        except ValueError:
+            return None
+        return seat if seat < self._grid.capacity else None
+
+    def _full(self, key: int) -> bool:
+        return len(set(self._taken.get(key, ()))) >= self._grid.capacity
+
+    def _rebuild(self) -> None:
+        # Heap of slot starts that may have a free seat; ``_listed`` is the same keys as a set.
+        self._free: list[int] = []
+        self._listed: set[int] = set()
+        # Seats held in each slot. A reservation made under an older grid blocks its seat in
+        # every slot it overlaps, so the list can repeat a seat.
+        self._taken: dict[int, list[int]] = {}
+        self._weeks = 0
+        for reservation in self._by_applicant.values():
+            seat = self._seat(reservation)
+            if seat is not None:
+                for key in self._grid.overlapping(self._key(reservation.start), reservation.minutes):
+                    self._taken.setdefault(key, []).append(seat)
+        self._extend()
+
+    def _extend(self) -> bool:
+        """Open the next week of slots; False once ``max_weeks`` is reached."""
+        if self._weeks >= self._grid.max_weeks:
+            return False
+        for key in self._grid.week_slots(self._weeks):
+            if not self._full(key):
+                heapq.heappush(self._free, key)
+                self._listed.add(key)
+        self._weeks += 1
+        return True
+
+    def _first_free(self, after: int, skipped: list[int]) -> Optional[int]:
+        """Earliest slot at or after ``after`` with a free seat.
+
+        Open slots before ``after`` are popped into ``skipped``; the caller pushes them back.
+        """
+        while True:
+            while self._free:
+                key = self._free[0]
+                if self._full(key):
+                    heapq.heappop(self._free)
+                    self._listed.discard(key)
+                elif key < after:
+                    skipped.append(heapq.heappop(self._free))
+                else:
+                    return key
+            if not self._extend():
+                return None
+
+    def reserve_many(self, applicant_ids: Iterable[str], earliest: Optional[datetime] = None) -> dict[str, Reservation]:
+        """Give each applicant the earliest free seat, in order. Applicants left out did not fit before ``max_weeks``."""
+        with self._lock:
+            grid, capacity = self._grid, self._grid.capacity
+            cursor = max(0, self._key(earliest)) if earliest else 0
+            out: dict[str, Reservation] = {}
+            skipped: list[int] = []
+            try:
+                for applicant_id in applicant_ids:
+                    existing = self._by_applicant.get(applicant_id)
+                    if existing is not None:
+                        out[applicant_id] = existing
+                        continue
+                    key = self._first_free(cursor, skipped)
+                    if key is None:
+                        break
+                    cursor = key
+                    taken = self._taken.setdefault(key, [])
+                    seat = next(s for s in range(capacity) if s not in taken)
+                    taken.append(seat)
+                    reservation = Reservation(
+                        applicant_id=applicant_id, start=grid.origin + timedelta(minutes=key),
+                        minutes=grid.slot_minutes, location=grid.location,
+                        room=grid.rooms[seat], interviewer=grid.interviewers[seat],
+                    )
+                    self._by_applicant[applicant_id] = reservation
+                    out[applicant_id] = reservation
+            finally:
+                for key in skipped:
+                    heapq.heappush(self._free, key)
+            return out
+
+    def release(self, applicant_id: str) -> bool:
+        with self._lock:
+            reservation = self._by_applicant.pop(applicant_id, None)
+            if reservation is None:
+                return False
+            seat = self._seat(reservation)
+            for key in self._grid.overlapping(self._key(reservation.start), reservation.minutes):
+                taken = self._taken.get(key)
+                if taken is None or seat not in taken:
+                    continue
+                was_full = self._full(key)
+                taken.remove(seat)
+                if (was_full and not self._full(key) and key not in self._listed
+                        and key < self._weeks * 7 * _MINUTES_PER_DAY):
+                    heapq.heappush(self._free, key)
+                    self._listed.add(key)
+            return True
+
+    def summary(self) -> dict:
+        with self._lock:
+            grid = self._grid
+            key = self._first_free(0, [])
+            next_free = grid.origin + timedelta(minutes=key) if key is not None else None
+            return {
+                "booked": len(self._by_applicant),
+                "seats_per_slot": grid.capacity,
+                "slot_minutes": grid.slot_minutes,
+                "weeks_open": self._weeks,
+                "max_weeks": grid.max_weeks,
+                "next_free": next_free.strftime("%Y-%m-%dT%H:%M") if next_free else None,
+            }
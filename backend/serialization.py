@@ -0,0 +1,129 @@
+"""Pre-encoded JSON for the large list endpoints.
+
+FastAPI runs every returned dict through ``jsonable_encoder`` before encoding,
+which dominates response time once lists reach tens of thousands of applicants.
+These helpers encode straight to bytes and keep a per-item fragment cache so
+unchanged applicants are never re-encoded.
+"""
+import json
+import os
+from typing import Iterable, Iterator, Optional
+
+from fastapi.responses import Response, StreamingResponse
+
+STREAM_BATCH = 512
+STREAM_MIN_ITEMS = int(os.environ.get("HR_STREAM_MIN_ITEMS", "2000"))
+
+
+def encode(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def join_array(fragments) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def join_object(fields: dict) -> bytes:
+    """Encode ``fields`` as a JSON object; ``bytes`` values are spliced in as-is."""
+    parts = [encode(k) + b":" + (v if isinstance(v, bytes) else encode(v)) for k, v in fields.items()]
+    return b"{" + b",".join(parts) + b"}"
+
+
+def iter_array(fragments: Iterable[bytes], batch: int = STREAM_BATCH) -> Iterator[bytes]:
+    """Yield a JSON array as chunks of ``batch`` already-encoded items."""
+    yield b"["
+    sep = b""
+    buf = []
+    for frag in fragments:
+        buf.append(frag)
+        if len(buf) >= batch:
+            yield sep + b",".join(buf)
+            sep, buf = b",", []
+    if buf:
+        yield sep + b",".join(buf)
+    yield b"]"
+
+
+def iter_object(fields: dict) -> Iterator[bytes]:
+    """Streaming ``join_object``; values may also be chunk iterators such as ``iter_array``."""
+    yield b"{"
+    for i, (k, v) in enumerate(fields.items()):
+        yield (b"," if i else b"") + encode(k) + b":"
+        if isinstance(v, bytes):
+            yield v
+        elif isinstance(v, Iterator):
+            yield from v
+        else:
+            yield encode(v)
+    yield b"}"
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def json_stream_response(chunks: Iterable[bytes], status_code: int = 200) -> StreamingResponse:
+    return StreamingResponse(chunks, status_code=status_code, media_type="application/json")
+
+
+def list_response(fragments: Iterable[bytes], count: int, envelope: Optional[dict] = None, key: str = "results"):
+    """JSON array of ``fragments`` (or ``envelope`` holding it under ``key``).
+
+    Lists of ``STREAM_MIN_ITEMS`` or more are streamed in batches rather than
+    joined into one buffer; ``fragments`` may be a lazy generator either way.
+    """
+    if count >= STREAM_MIN_ITEMS:
+        body = iter_array(fragments)
+        return json_stream_response(body if envelope is None else iter_object({**envelope, key: body}))
+    body = join_array(fragments)
+    return json_response(body if envelope is None else join_object({**envelope, key: body}))
+
+
+class IdentityCache:
+    """Built values per key, reused while their source objects are unchanged.
+
+    Sources are compared by identity: applicant records, score dicts and the
+    settings object are all replaced rather than mutated, so a new object is
+    exactly what invalidates an entry. With ``max_entries`` the oldest keys are
+    dropped first.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._entries: dict = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, sources: tuple, build):
+        entry = self._entries.get(key)
+        if entry is not None and len(entry[0]) == len(sources) and all(a is b for a, b in zip(entry[0], sources)):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        data = self._make(build)
+        self._entries[key] = (sources, data)
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            try:
+                del self._entries[next(iter(self._entries))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass  # another thread got there first
+        return data
+
+    def _make(self, build):
+        return build()
+
+    def discard(self, key) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FragmentCache(IdentityCache):
+    """Encoded JSON per key, reused while its source objects are unchanged."""
+
+    def _make(self, build) -> bytes:
+        return encode(build())
@@ -0,0 +1,225 @@
+"""Versioned settings: validated, immutable snapshots and values derived from them.
+
+``SettingsStore.update`` validates a new settings document against
+``SettingsModel``. Sections it leaves out keep their current values, and so do
+keys left out of a section (``{"scoring": {"consider_threshold": 60}}``). The result
+is published as a ``SettingsSnapshot`` with the next version number. Snapshots
+are never modified, so a request that takes ``current()`` once works from one
+consistent set of settings however many updates land meanwhile.
+
+Anything expensive to derive from settings (the compiled email template, the
+question buckets, the recommendation thresholds) is built once per snapshot
+with ``SettingsSnapshot.derive``, not on every use. Listeners registered with
+``SettingsStore.subscribe`` run once per new version. They reconfigure the
+scheduler, republish the reader snapshot and warm the derived values.
+"""
+import re
+import threading
+from collections.abc import Mapping
+from typing import Callable, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+from scheduler import DEFAULT_CONFIG as DEFAULT_SCHEDULING, parse_config
+from serialization import encode
+
+DEFAULT_SETTINGS = {
+    "scoring": {
+        "auto_promote_threshold": 75,
+        "strong_hire_threshold": 75,
+        "consider_threshold": 55,
+        # Share of the score (0-100) given to the resume's BM25 match with the job posting.
+        "relevance_weight": 0,
+    },
+    "email": {
+        "mode": "mock",
+        "mock_email": "test@yourdomain.com",
+        "real_email": "",
+        "subject": "Interview Invitation — Ski Lift Operator at Vail Mountain",
+        "template": "Hi {{first_name}},\n\nWe reviewed your application and were impressed by your background{{ski_experience_note}}.\n\nWe'd love to invite you for a 30-minute interview for the Ski Lift Operator position at Vail Mountain.\n\n{{interview_details}}\n\nTo help us prepare, here are a few questions we'd love for you to reflect on:\n\n{{interview_questions}}\n\nPlease reply to confirm your availability.\n\nBest regards,\nMountain Operations HR Team",
+        "interview_details": "We have availability this week — Tuesday through Thursday, 8am–4pm.",
+    },
+    "questions": [
+        "Can you describe your experience operating ski lifts or similar equipment?",
+        "Are you available to work weekends, holidays, and early morning shifts starting at 6am?",
+        "Do you hold any safety certifications (OSHA, First Aid, CPR)?",
+        "How do you handle a situation where a guest refuses to follow safety instructions?",
+        "What's your experience working in cold outdoor conditions for extended periods?",
+        "How would you respond if the lift stopped unexpectedly with guests on board?",
+    ],
+    "scheduling": DEFAULT_SCHEDULING,
+}
+
+PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+TEMPLATE_FIELDS = frozenset({
+    "first_name", "last_name", "ski_experience_note", "interview_details", "interview_questions", "location", "score",
+})
+
+
+class ScoringSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    auto_promote_threshold: int = Field(ge=0, le=100)
+    strong_hire_threshold: int = Field(ge=0, le=100)
+    consider_threshold: int = Field(ge=0, le=100)
+    relevance_weight: Union[int, float] = Field(0, ge=0, le=100)
+
+    @model_validator(mode="after")
+    def _ordered(self):
+        if self.consider_threshold > self.strong_hire_threshold:
+            raise ValueError("consider_threshold must not exceed strong_hire_threshold")
+        return self
+
+
+class EmailSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    mode: Literal["mock", "real"]
+    mock_email: str = ""
+    real_email: str = ""
+    subject: str = Field(min_length=1)
+    template: str = Field(min_length=1)
+    interview_details: str = ""
+
+    @field_validator("template")
+    @classmethod
+    def _known_placeholders(cls, template: str) -> str:
+        unknown = sorted(set(PLACEHOLDER.findall(template)) - TEMPLATE_FIELDS)
+        if unknown:
+            raise ValueError(f"unknown placeholders {unknown}; use {', '.join(sorted(TEMPLATE_FIELDS))}")
+        return template
+
+
+class SettingsModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    scoring: ScoringSettings
+    email: EmailSettings
+    questions: list[str]
+    scheduling: dict
+    # Echoed back by clients that PUT what they fetched; the store assigns versions itself.
+    version: Optional[int] = None
+
+    @field_validator("questions")
+    @classmethod
+    def _drop_blank(cls, questions: list[str]) -> list[str]:
+        return [q.strip() for q in questions if q.strip()]
+
+    @field_validator("scheduling")
+    @classmethod
+    def _valid_grid(cls, scheduling: dict) -> dict:
+        parse_config(scheduling)
+        return scheduling
+
+
+def validate(raw: dict) -> dict:
+    """The settings document ``raw`` as checked, normalized plain data; raises ``ValueError``."""
+    try:
+        model = SettingsModel.model_validate(raw)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(p) for p in err['loc'])}: {err['msg'].removeprefix('Value error, ')}"
+            for err in e.errors()
+        )
+        raise ValueError(f"Invalid settings: {problems}") from None
+    return model.model_dump(exclude={"version"})
+
+
+def compile_template(template: str) -> tuple[str, ...]:
+    """``template`` split at its placeholders: literals at even indices, field names at odd ones."""
+    return tuple(PLACEHOLDER.split(template))
+
+
+class _Frozen(dict):
+    """A dict that refuses changes, so a snapshot cannot be edited in place."""
+
+    def _refuse(self, *args, **kwargs):
+        raise TypeError("settings snapshots are read-only; PUT /api/settings to change them")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _refuse
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _Frozen((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, dict):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+class SettingsSnapshot(Mapping):
+    """One immutable version of the settings, read like the settings dict itself."""
+
+    def __init__(self, version: int, data: dict):
+        self.version = version
+        self._data = _freeze(data)
+        # What GET /api/settings and the reader snapshot serve.
+        self.encoded = encode({**self._data, "version": version})
+        self._derived: dict = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_dict(self) -> dict:
+        return _thaw(self._data)
+
+    def derive(self, name: str, build: Callable[["SettingsSnapshot"], object]):
+        """``build(self)``, computed once for this version and shared by every caller."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = build(self)
+            return self._derived[name]
+
+
+def _merge(current: dict, raw: dict) -> dict:
+    """``raw`` over ``current``, section by section; lists and scalars are replaced whole."""
+    merged = dict(current)
+    for section, value in raw.items():
+        if isinstance(value, dict) and isinstance(current.get(section), dict):
+            merged[section] = {**current[section], **value}
+        else:
+            merged[section] = value
+    return merged
+
+
+class SettingsStore:
+    def __init__(self, initial: dict = DEFAULT_SETTINGS):
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[SettingsSnapshot, SettingsSnapshot], None]] = []
+        self._current = SettingsSnapshot(1, validate(initial))
+
+    def current(self) -> SettingsSnapshot:
+        return self._current
+
+    def subscribe(self, listener: Callable[[SettingsSnapshot, SettingsSnapshot], None]) -> None:
+        """Call ``listener(new, previous)`` after each update, in version order."""
+        self._listeners.append(listener)
+
+    def update(self, raw: dict) -> SettingsSnapshot:
+        """Validate ``raw`` over the current settings and publish it as the next version."""
+        with self._lock:
+            previous = self._current
+            snapshot = SettingsSnapshot(previous.version + 1, validate(_merge(previous.to_dict(), raw)))
+            self._current = snapshot
+            for listener in self._listeners:
+                listener(snapshot, previous)
+        return snapshot
@@ -0,0 +1,89 @@
+"""Single-flight request coalescing.
+
+When identical work is requested while an earlier call for the same key is
+still running, the later callers wait for that call and share its result (or
+its exception) instead of repeating the work. Nothing is cached: once the
+leading call finishes, the next caller starts fresh. A burst of dashboard
+loads therefore costs one computation, and results are never older than the
+computation that was already in flight.
+
+``SingleFlight`` serves threadpool (sync) handlers. ``AsyncSingleFlight``
+serves coroutines. Its shared task is shielded, so a caller that disconnects
+does not cancel the work for everyone else.
+"""
+import asyncio
+import collections
+import threading
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def _label(key: Hashable) -> str:
+    """Metric label for a key: ``("applicants", "score")`` -> ``"applicants:score"``."""
+    return ":".join(map(str, key)) if isinstance(key, tuple) else str(key)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        # (key label, "leader" | "shared") -> calls
+        self.stats: collections.Counter = collections.Counter()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self.stats[_label(key), "leader" if leader else "shared"] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self.stats: collections.Counter = collections.Counter()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+            self.stats[_label(key), "leader"] += 1
+        else:
+            self.stats[_label(key), "shared"] += 1
+        return await asyncio.shield(task)
+
+    def running(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
@@ -0,0 +1,272 @@
+"""Versioned read snapshots shared between a writer and reader processes.
+
+In the multi-worker deployment (see ``run.sh`` and ``reader.py``), one
+writer process owns the store. ``Publisher`` writes a fresh snapshot file
+after changes settle (``HR_SNAPSHOT_INTERVAL``). The file holds the encoded
+applicant list in score order, other orderings as item positions, per-applicant
+offsets and a few small JSON blobs. It is written next to its final path and
+renamed into place, so readers only ever see complete files.
+
+Readers ``mmap`` the current file through ``SnapshotReader`` and answer GETs
+with ``memoryview`` slices of the mapping. Responses are not copied or decoded,
+and the snapshot is shared through the page cache by every worker. A reader
+keeps serving from its old mapping until it notices the rename.
+
+Every change bumps the publisher's generation. The writer returns that
+generation on write responses (``X-HR-Generation``), and a reader can wait
+for the snapshot to catch up before answering. That gives clients
+read-your-writes through any worker.
+"""
+import array
+import asyncio
+import logging
+import marshal
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+MAGIC = b"HRSNAP1" + bytes([marshal.version])
+_HEADER = struct.Struct("<QdQQ")  # generation, published_at, toc offset, toc length
+GENERATION_HEADER = "x-hr-generation"
+_log = logging.getLogger("uvicorn.error")
+MAX_RETRY_DELAY = 5.0
+
+
+def write(path: str, generation: int, items: list[tuple[str, bytes]], orders: dict[str, list[int]],
+          blobs: dict[str, bytes]) -> int:
+    """Write a snapshot atomically; returns its size in bytes.
+
+    ``items`` are ``(id, encoded JSON)`` in the default (score) order, stored
+    as one JSON array. ``orders`` are other orderings as positions into ``items``.
+    """
+    offsets, lengths = array.array("Q"), array.array("I")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(0, 0.0, 0, 0))
+            array_start = pos = f.tell()
+            f.write(b"[")
+            pos += 1
+            for i, (_, fragment) in enumerate(items):
+                if i:
+                    f.write(b",")
+                    pos += 1
+                offsets.append(pos)
+                lengths.append(len(fragment))
+                f.write(fragment)
+                pos += len(fragment)
+            f.write(b"]")
+            pos += 1
+            array_span = (array_start, pos - array_start)
+            blob_spans = {}
+            for name, data in blobs.items():
+                blob_spans[name] = (pos, len(data))
+                f.write(data)
+                pos += len(data)
+            toc = marshal.dumps({
+                "array": array_span,
+                "ids": [aid for aid, _ in items],
+                "offsets": offsets.tobytes(), "lengths": lengths.tobytes(),
+                "orders": {name: array.array("I", positions).tobytes() for name, positions in orders.items()},
+                "blobs": blob_spans,
+            })
+            f.write(toc)
+            f.seek(len(MAGIC))
+            f.write(_HEADER.pack(generation, time.time(), pos, len(toc)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Leave no half-written file next to the snapshot.
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return pos + len(toc)
+
+
+class Snapshot:
+    """One mapped snapshot file. Slices stay valid for as long as they are referenced."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.identity = (os.fstat(f.fileno()).st_ino, os.fstat(f.fileno()).st_mtime_ns)
+        view = memoryview(self._map)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a snapshot for this Python version")
+        self.generation, self.published_at, toc_at, toc_len = _HEADER.unpack_from(view, len(MAGIC))
+        toc = marshal.loads(view[toc_at:toc_at + toc_len])
+        self._view = view
+        self._ids: list[str] = toc["ids"]
+        self._offsets = memoryview(toc["offsets"]).cast("Q")
+        self._lengths = memoryview(toc["lengths"]).cast("I")
+        self._orders = {name: memoryview(data).cast("I") for name, data in toc["orders"].items()}
+        self._blobs = toc["blobs"]
+        start, length = toc["array"]
+        self._array = (start, length)
+        self._positions: Optional[dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def array(self) -> memoryview:
+        """The whole applicant list, already a JSON array."""
+        start, length = self._array
+        return self._view[start:start + length]
+
+    def item(self, applicant_id: str) -> Optional[memoryview]:
+        if self._positions is None:
+            # Built on first lookup; list endpoints never need it.
+            self._positions = {aid: i for i, aid in enumerate(self._ids)}
+        i = self._positions.get(applicant_id)
+        if i is None:
+            return None
+        return self._view[self._offsets[i]:self._offsets[i] + self._lengths[i]]
+
+    def has_order(self, name: str) -> bool:
+        return name in self._orders
+
+    def ordered(self, name: str) -> Iterator[memoryview]:
+        view, offsets, lengths = self._view, self._offsets, self._lengths
+        for i in self._orders[name]:
+            yield view[offsets[i]:offsets[i] + lengths[i]]
+
+    def blob(self, name: str) -> Optional[memoryview]:
+        span = self._blobs.get(name)
+        return self._view[span[0]:span[0] + span[1]] if span else None
+
+
+class SnapshotReader:
+    """The newest snapshot at ``path``, re-checked at most every ``poll`` seconds."""
+
+    def __init__(self, path: str, poll: float = 0.02):
+        self.path = path
+        self.poll = poll
+        self._current: Optional[Snapshot] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def current(self) -> Optional[Snapshot]:
+        now = time.monotonic()
+        if now - self._checked < self.poll:
+            return self._current
+        with self._lock:
+            self._checked = now
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return self._current
+            if self._current is None or self._current.identity != (st.st_ino, st.st_mtime_ns):
+                try:
+                    self._current = Snapshot(self.path)
+                    self.loads += 1
+                except (OSError, ValueError, EOFError) as e:
+                    _log.warning("Snapshot %s unreadable, keeping the previous one: %s", self.path, e)
+        return self._current
+
+    async def wait_for(self, generation: int, timeout: float) -> bool:
+        """Wait until the snapshot covers ``generation``; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            snap = self.current()
+            if snap is not None and snap.generation >= generation:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.poll)
+
+
+class Publisher:
+    """Rewrites the snapshot after changes, at most once per ``interval`` seconds.
+
+    A failed publish is retried with backoff, so readers waiting on its
+    generation are not left on the old file until an unrelated change comes in.
+    """
+
+    def __init__(self, path: str, build: Callable[[], tuple], interval: float = 0.25):
+        self.path = path
+        self.interval = interval
+        self._build = build
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stopping = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Starts from the clock so generations keep increasing across writer restarts and a
+        # reader never mistakes the previous run's file for a newer one.
+        self.generation = time.time_ns() // 1_000_000
+        self.published = 0
+        self.last_seconds = 0.0
+        self.last_bytes = 0
+        self.failures = 0
+
+    def mark_dirty(self, *_) -> None:
+        """Also usable directly as an ``ApplicantStore.subscribe`` listener."""
+        with self._lock:
+            self.generation += 1
+        self._dirty.set()
+
+    def start(self) -> None:
+        self.mark_dirty()
+        self._thread = threading.Thread(target=self._run, name="hr-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._stopped.set()
+        self._dirty.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        delay = 0.0
+        while True:
+            self._dirty.wait()
+            if self._stopping:
+                return
+            # Let a burst of writes settle into one snapshot (and back off after a failure).
+            if self._stopped.wait(max(self.interval, delay)):
+                return
+            self._dirty.clear()
+            generation = self.generation
+            t0 = time.perf_counter()
+            try:
+                items, orders, blobs = self._build()
+                self.last_bytes = write(self.path, generation, items, orders, blobs)
+            except Exception:
+                self.failures += 1
+                delay = min(MAX_RETRY_DELAY, delay * 2 or self.interval * 2 or 0.1)
+                _log.exception("Snapshot publish failed; retrying in %.1fs", delay)
+                self._dirty.set()
+                continue
+            delay = 0.0
+            self.published = generation
+            self.last_seconds = round(time.perf_counter() - t0, 4)
+
+
+class GenerationHeaderMiddleware:
+    """ASGI middleware: tag responses to writes with the generation they will be visible in."""
+
+    def __init__(self, app, publisher: Publisher):
+        self.app = app
+        self.publisher = publisher
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            return await self.app(scope, receive, send)
+
+        async def send_with_generation(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((GENERATION_HEADER.encode(), str(self.publisher.generation).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_generation)
@@ -0,0 +1,207 @@
+"""Thread-safe applicant store shared by the sync (threadpool) and async handlers.
+
+Records are immutable, so a read is a plain dict lookup and a write swaps in a
+new record. Read-modify-write cycles on one applicant are serialized by a lock
+stripe chosen from the applicant ID, which keeps unrelated applicants from
+contending. Only inserts, resets, snapshot copies and status-index moves take
+the store-wide index lock, so scans see a consistent list without blocking
+per-record updates. Batch updates move the status index once per batch.
+
+Listeners registered with ``subscribe`` see every committed change while the
+writer still holds its lock, so changes to one applicant reach them in commit
+order. They must not block: anything slow, like the event log's disk writes,
+belongs on the listener's own thread.
+"""
+import threading
+from typing import Callable, Optional
+
+from records import Applicant, Status
+
+DEFAULT_STRIPES = 64
+
+
+class ApplicantStore:
+    def __init__(self, records=(), stripes: int = DEFAULT_STRIPES):
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._index_lock = threading.Lock()
+        self._records: dict[str, Applicant] = {}
+        self._scores: dict[str, dict] = {}
+        self._by_email: dict[str, str] = {}
+        self._by_status: dict[Status, set[str]] = {}
+        self._indexed_status: dict[str, Status] = {}
+        self._next_upload = 1
+        self._listeners: list[Callable[[str, object], None]] = []
+        self.reset(records)
+
+    def subscribe(self, listener: Callable[[str, object], None]) -> None:
+        """Call ``listener(kind, payload)`` after each write.
+
+        Kinds are ``reset`` (list of records), ``add`` (record), ``update``
+        (list of ``(before, after)``) and ``score`` (``(id, result)``).
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, kind: str, payload) -> None:
+        for listener in self._listeners:
+            listener(kind, payload)
+
+    def _stripe(self, applicant_id: str) -> int:
+        return hash(applicant_id) % len(self._stripes)
+
+    def _lock_for(self, applicant_id: str) -> threading.Lock:
+        return self._stripes[self._stripe(applicant_id)]
+
+    def __contains__(self, applicant_id: str) -> bool:
+        return applicant_id in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, applicant_id: str) -> Optional[Applicant]:
+        return self._records.get(applicant_id)
+
+    def find_by_email(self, email: str) -> Optional[Applicant]:
+        """Most recently added applicant with this address (case-insensitive)."""
+        applicant_id = self._by_email.get(email.strip().lower())
+        return self._records.get(applicant_id) if applicant_id else None
+
+    def ids_with_status(self, status: Status) -> list[str]:
+        with self._index_lock:
+            return list(self._by_status.get(Status(status), ()))
+
+    def status_counts(self) -> dict[str, int]:
+        with self._index_lock:
+            return {status.value: len(self._by_status.get(status, ())) for status in Status}
+
+    def score(self, applicant_id: str) -> Optional[dict]:
+        return self._scores.get(applicant_id)
+
+    def score_count(self) -> int:
+        return len(self._scores)
+
+    def snapshot(self) -> list[Applicant]:
+        """Point-in-time list of records; safe to iterate while writers run."""
+        with self._index_lock:
+            return list(self._records.values())
+
+    def scores_snapshot(self) -> dict[str, dict]:
+        with self._index_lock:
+            return dict(self._scores)
+
+    def reset(self, records) -> None:
+        with self._index_lock:
+            self._records = {r.id: r for r in records}
+            self._scores = {}
+            self._by_email = {r.email.lower(): r.id for r in self._records.values()}
+            self._by_status = {}
+            self._indexed_status = {}
+            for r in self._records.values():
+                self._by_status.setdefault(r.status, set()).add(r.id)
+                self._indexed_status[r.id] = r.status
+            self._next_upload = len(self._records) + 1
+            self._notify("reset", list(self._records.values()))
+
+    def allocate_id(self, prefix: str = "PAY-UPL-") -> str:
+        with self._index_lock:
+            while True:
+                new_id = f"{prefix}{self._next_upload:04d}"
+                self._next_upload += 1
+                if new_id not in self._records:
+                    return new_id
+
+    def add(self, record: Applicant) -> None:
+        with self._index_lock:
+            if record.id in self._records:
+                raise KeyError(f"Applicant {record.id} already exists")
+            self._records[record.id] = record
+            self._by_email[record.email.lower()] = record.id
+            self._by_status.setdefault(record.status, set()).add(record.id)
+            self._indexed_status[record.id] = record.status
+            self._notify("add", record)
+
+    def update(self, applicant_id: str, fn: Callable[[Applicant], Applicant]) -> Optional[tuple[Applicant, Applicant]]:
+        """Atomically replace a record with ``fn(record)``; returns ``(before, after)``."""
+        with self._lock_for(applicant_id):
+            result = self._apply(applicant_id, fn)
+            if result is not None and result[1] is not result[0]:
+                self._notify("update", [result])
+        if result is not None:
+            self._reindex_status([result])
+        return result
+
+    def _apply(self, applicant_id: str, fn) -> Optional[tuple[Applicant, Applicant]]:
+        before = self._records.get(applicant_id)
+        if before is None:
+            return None
+        return self._commit(before, fn(before))
+
+    def _commit(self, before: Applicant, after: Applicant) -> tuple[Applicant, Applicant]:
+        if after is not before:
+            self._records[before.id] = after
+            if after.email != before.email:
+                self._by_email[after.email.lower()] = before.id
+        return before, after
+
+    def _reindex_status(self, changes) -> None:
+        # Index each moved record under its *current* status, so racing writers converge.
+        moved = [after.id for before, after in changes if after.status is not before.status]
+        if not moved:
+            return
+        with self._index_lock:
+            for applicant_id in moved:
+                current = self._records.get(applicant_id)
+                indexed = self._indexed_status.get(applicant_id)
+                if current is None or current.status is indexed:
+                    continue
+                self._by_status.get(indexed, set()).discard(applicant_id)
+                self._by_status.setdefault(current.status, set()).add(applicant_id)
+                self._indexed_status[applicant_id] = current.status
+
+    def update_many(self, updates: dict[str, Callable[[Applicant], Applicant]],
+                    atomic: bool = False) -> dict[str, tuple[Applicant, Applicant]]:
+        """Apply many ``update`` calls, taking each lock stripe once rather than once per record.
+
+        With ``atomic=True`` every stripe involved is held for the whole batch, all
+        ``fn`` calls run before anything is written, and an exception from any of
+        them leaves the store untouched.
+        """
+        by_stripe: dict[int, list[str]] = {}
+        for applicant_id in updates:
+            by_stripe.setdefault(self._stripe(applicant_id), []).append(applicant_id)
+        changed = {}
+        if atomic:
+            locks = [self._stripes[stripe] for stripe in sorted(by_stripe)]
+            for lock in locks:
+                lock.acquire()
+            try:
+                staged = []
+                for applicant_id, fn in updates.items():
+                    before = self._records.get(applicant_id)
+                    if before is not None:
+                        staged.append((before, fn(before)))
+                for before, after in staged:
+                    changed[before.id] = self._commit(before, after)
+                self._notify("update", [(b, a) for b, a in changed.values() if a is not b])
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+        else:
+            for stripe, ids in by_stripe.items():
+                with self._stripes[stripe]:
+                    batch = []
+                    for applicant_id in ids:
+                        result = self._apply(applicant_id, updates[applicant_id])
+                        if result is not None:
+                            changed[applicant_id] = result
+                            if result[1] is not result[0]:
+                                batch.append(result)
+                    if batch:
+                        self._notify("update", batch)
+        self._reindex_status(changed.values())
+        return changed
+
+    def set_score(self, applicant_id: str, result: dict) -> None:
+        with self._lock_for(applicant_id):
+            if applicant_id in self._records:
+                self._scores[applicant_id] = result
+                self._notify("score", (applicant_id, result))
@@ -0,0 +1,262 @@
+"""Deterministic synthetic applicants for load tests and capacity sizing.
+
+Every applicant is derived from ``(seed, index)`` alone. Applicant #123456 is
+therefore identical whether you generate ten of them or ten million, and
+whether you start at 0 or at 123456, which makes a regression reproducible
+from one number. Output has the same schema as ``mock_data.APPLICANTS``.
+Generation streams, so millions of applicants never sit in memory.
+
+The score mix is controlled per tier: ``strong`` (75+), ``consider`` (55-74),
+``weak`` (35-54) and ``reject`` (below 35). A profile is drawn with a quality
+level for its tier, then redrawn until ``score_applicant`` places it in that
+tier. With ``freeform=True`` each applicant also gets a ``resume_text``
+written for ``_parse_freeform_resume`` and the upload endpoint.
+
+    python synthetic.py --count 1000000 --seed 7 --out applicants.ndjson
+    python synthetic.py --count 5000 --mix strong=0.5,reject=0.5 --freeform --stats --out -
+    python synthetic.py --count 100000 --fixture fixture.bin
+"""
+import argparse
+import collections
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+from mock_data import score_applicant
+from records import Applicant
+
+TIERS = {"strong": (75, 100), "consider": (55, 74), "weak": (35, 54), "reject": (0, 34)}
+DEFAULT_MIX = {"strong": 0.2, "consider": 0.3, "weak": 0.3, "reject": 0.2}
+_QUALITY = {"strong": 0.95, "consider": 0.65, "weak": 0.4, "reject": 0.1}
+MAX_REDRAWS = 30
+REFERENCE_DATE = date(2026, 2, 27)
+
+FIRST_NAMES = [
+    "Avery", "Blake", "Cameron", "Dakota", "Emerson", "Finley", "Harper", "Jesse", "Kendall", "Logan",
+    "Morgan", "Noah", "Olivia", "Parker", "Quinn", "Riley", "Sage", "Taylor", "Uma", "Wren",
+    "Ximena", "Yusuf", "Zoe", "Mateo", "Priya", "Liam", "Sofia", "Kai", "Aiden", "Lucia",
+]
+LAST_NAMES = [
+    "Baker", "Cruz", "Dunn", "Ellis", "Frost", "Gray", "Hayes", "Ivers", "Jensen", "Keller",
+    "Lopez", "Murphy", "Nakamura", "Okafor", "Patel", "Quintero", "Reyes", "Schmidt", "Tran", "Underwood",
+    "Vasquez", "Walsh", "Xu", "Yilmaz", "Zimmerman", "Olsen", "Brennan", "Castillo", "Dubois", "Fischer",
+]
+# (town, miles from the resort)
+LOCATIONS = [
+    ("Vail, CO", 2.0), ("Minturn, CO", 7.0), ("Avon, CO", 6.0), ("Edwards, CO", 6.5), ("Keystone, CO", 3.5),
+    ("Frisco, CO", 8.5), ("Dillon, CO", 10.0), ("Breckenridge, CO", 5.0), ("Silverthorne, CO", 13.0),
+    ("Wolcott, CO", 16.5), ("Leadville, CO", 20.0), ("Gypsum, CO", 22.0), ("Eagle, CO", 28.0),
+    ("Glenwood Springs, CO", 65.0), ("Denver, CO", 85.0), ("Steamboat Springs, CO", 86.0),
+    ("Aurora, CO", 92.0), ("Grand Junction, CO", 112.0),
+]
+RESORTS = [
+    "Keystone Resort", "Copper Mountain", "Breckenridge", "Beaver Creek Resort", "Arapahoe Basin",
+    "Winter Park", "Steamboat Resort", "Vail Mountain", "Loveland Ski Area", "Aspen Snowmass",
+]
+LIFT_TITLES = ["Lift Operator", "Lift Mechanic", "Lift Attendant", "Chairlift Operator", "Gondola Operator"]
+SKI_TITLES = ["Ski Instructor", "Ski Patroller", "Rental Technician", "Snowmaker", "Guest Services"]
+OTHER_JOBS = [
+    ("Trail Crew", "USFS"), ("Landscaper", "Summit Landscaping"), ("Construction Laborer", "Alpine Builders"),
+    ("Barista", "Starbucks"), ("Warehouse Associate", "Amazon"), ("River Guide", "Colorado River Runs"),
+    ("Retail Associate", "REI"), ("Line Cook", "Mountain Grill"), ("Delivery Driver", "FedEx"),
+]
+SKILLS = [
+    "chairlift operation", "safety protocols", "guest communication", "snow grooming", "emergency procedures",
+    "mechanical maintenance", "customer service", "radio communication", "first aid", "equipment inspection",
+    "team leadership", "cash handling", "heavy lifting", "snowmobile operation", "avalanche awareness",
+]
+PHYSICAL_PHRASES = [
+    "Years of outdoor work in all weather.", "Physical labor background.", "Former construction crew member.",
+    "Backcountry guide in the summers.", "Worked on a trail crew.",
+]
+OTHER_PHRASES = [
+    "Friendly and reliable.", "Looking for a seasonal role.", "Quick learner with great references.",
+    "Moving to the valley this winter.", "Passionate about the mountains.",
+]
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """``"strong=0.1,consider=0.3"`` → normalized weights; tiers left out get 0."""
+    mix = {tier: 0.0 for tier in TIERS}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        tier, _, weight = part.partition("=")
+        if tier not in TIERS:
+            raise ValueError(f"Unknown tier {tier!r}; expected one of {', '.join(TIERS)}")
+        mix[tier] = float(weight)
+    return _normalized(mix)
+
+
+def _normalized(mix: dict[str, float]) -> dict[str, float]:
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError("Score mix must have a positive weight")
+    return {tier: mix.get(tier, 0.0) / total for tier in TIERS}
+
+
+def _profile(rng: random.Random, q: float) -> dict:
+    experience = []
+    roll = rng.random()
+    if roll < q * 0.85:
+        experience.append({"title": rng.choice(LIFT_TITLES), "company": rng.choice(RESORTS),
+                           "years": rng.randint(1, 2 + int(6 * q)), "ski_related": True})
+    elif roll < q * 0.85 + (1 - q * 0.85) * q:
+        experience.append({"title": rng.choice(SKI_TITLES), "company": rng.choice(RESORTS),
+                           "years": rng.randint(1, 2 + int(4 * q)), "ski_related": True})
+    for _ in range(rng.randint(0, 2)):
+        title, company = rng.choice(OTHER_JOBS)
+        experience.append({"title": title, "company": company, "years": rng.randint(1, 5), "ski_related": False})
+
+    certifications = []
+    if rng.random() < q * 0.5:
+        certifications.append("OSHA 30")
+    elif rng.random() < q * 0.7:
+        certifications.append("OSHA 10")
+    if rng.random() < q * 0.4:
+        certifications.append("ANSI/ASME B77.1")
+    if rng.random() < 0.2 + q * 0.7:
+        certifications.append(rng.choice(["First Aid/CPR", "CPR/AED", "Wilderness First Responder", "EMT-B"]))
+    if rng.random() < 0.2:
+        certifications.append(rng.choice(["Food Handler", "Avalanche Level 1", "Forklift Certified"]))
+
+    availability = {key: rng.random() < 0.25 + 0.75 * q for key in ("weekends", "holidays", "early_am")}
+    nearby = [loc for loc in LOCATIONS if loc[1] <= 15]
+    location, miles = rng.choice(nearby if rng.random() < q else LOCATIONS)
+    distance = round(max(0.5, miles + rng.uniform(-1.5, 1.5)), 1)
+
+    sentences = []
+    for e in experience[:2]:
+        sentences.append(f"{e['years']} {'seasons' if e['ski_related'] else 'years'} as {e['title']} at {e['company']}.")
+    if rng.random() < 0.3 + 0.6 * q:
+        sentences.append(rng.choice(PHYSICAL_PHRASES))
+    if certifications:
+        sentences.append(f"{' and '.join(certifications[:2])} certified.")
+    open_for = [label for key, label in (("weekends", "weekends"), ("holidays", "holidays"), ("early_am", "6am shifts"))
+                if availability[key]]
+    if open_for:
+        sentences.append(f"Available {', '.join(open_for)}.")
+    sentences.append(rng.choice(OTHER_PHRASES))
+
+    return {
+        "location": location,
+        "distance_miles": distance,
+        "resume": {
+            "summary": " ".join(sentences),
+            "experience": experience,
+            "certifications": certifications,
+            "availability": availability,
+            "skills": rng.sample(SKILLS, rng.randint(2, 5)),
+        },
+    }
+
+
+def freeform_resume(applicant: dict, rng: Optional[random.Random] = None) -> str:
+    """Plain-text resume for ``applicant`` in the style candidates paste into the upload form."""
+    rng = rng or random.Random(applicant["id"])
+    resume = applicant["resume"]
+    lines = [f"{applicant['first_name']} {applicant['last_name']} — {applicant['location']}", ""]
+    for e in resume["experience"]:
+        where = "at the ski resort" if e["ski_related"] else "in the area"
+        lines.append(f"- {e['title']}, {e['company']} ({e['years']} years {where})")
+    if resume["certifications"]:
+        lines.append("Certifications: " + ", ".join(resume["certifications"]))
+    avail = resume["availability"]
+    open_for = [w for key, w in (("weekends", "weekends"), ("holidays", "holidays"), ("early_am", "early morning 6am shifts"))
+                if avail[key]]
+    lines.append(f"Availability: {', '.join(open_for)}." if open_for else "Availability: weekdays only.")
+    lines.append(rng.choice(OTHER_PHRASES))
+    return "\n".join(lines)
+
+
+def applicant(index: int, seed: int = 0, mix: Optional[dict] = None, freeform: bool = False,
+              id_prefix: str = "PAY-S") -> tuple[dict, dict]:
+    """``(applicant dict, score)`` for one index; identical for the same ``(seed, index)``."""
+    rng = random.Random(seed * 0x9E3779B1 + index)
+    mix = _normalized(mix) if mix else DEFAULT_MIX
+    tier = rng.choices(list(mix), weights=list(mix.values()))[0]
+    low, high = TIERS[tier]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    out = {
+        "id": f"{id_prefix}{index:08d}",
+        "first_name": first,
+        "last_name": last,
+        "email": f"{first.lower()}.{last.lower()}{index}@email.com",
+        "phone": f"+1-{rng.randint(200, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "location": None,
+        "distance_miles": None,
+        "applied_date": (REFERENCE_DATE - timedelta(days=rng.randint(1, 30))).isoformat(),
+        "status": "new",
+        "resume": None,
+    }
+    for _ in range(MAX_REDRAWS):
+        out.update(_profile(rng, _QUALITY[tier]))
+        score = score_applicant(Applicant.from_dict(out))
+        if low <= score["score"] <= high:
+            break
+    if freeform:
+        out["resume_text"] = freeform_resume(out, rng)
+    return out, score
+
+
+def generate(count: int, seed: int = 0, mix: Optional[dict] = None, start: int = 0, freeform: bool = False,
+             id_prefix: str = "PAY-S") -> Iterator[dict]:
+    for index in range(start, start + count):
+        yield applicant(index, seed, mix, freeform, id_prefix)[0]
+
+
+def generate_records(count: int, seed: int = 0, mix: Optional[dict] = None, start: int = 0,
+                     id_prefix: str = "PAY-S") -> Iterator[Applicant]:
+    for d in generate(count, seed, mix, start, id_prefix=id_prefix):
+        yield Applicant.from_dict(d)
+
+
+def upload_payload(applicant: dict) -> dict:
+    """Body for ``POST /api/upload-resume``; needs an applicant generated with ``freeform=True``."""
+    return {k: applicant[k] for k in ("first_name", "last_name", "email", "location", "distance_miles", "resume_text")}
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic applicants")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=int, default=0, help="first applicant index")
+    parser.add_argument("--mix", help="tier weights, e.g. strong=0.2,consider=0.3,weak=0.3,reject=0.2")
+    parser.add_argument("--freeform", action="store_true", help="add a resume_text to each applicant")
+    parser.add_argument("--uploads", action="store_true", help="emit upload-resume request bodies instead")
+    parser.add_argument("--out", default="-", help="NDJSON path, or - for stdout")
+    parser.add_argument("--fixture", help="write a store fixture (fixtures.py format) instead of NDJSON")
+    parser.add_argument("--stats", action="store_true", help="print the score distribution to stderr")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else None
+    tiers: collections.Counter = collections.Counter()
+    t0 = time.perf_counter()
+
+    def rows() -> Iterator[dict]:
+        for index in range(args.start, args.start + args.count):
+            d, score = applicant(index, args.seed, mix, args.freeform or args.uploads)
+            tiers[next(t for t, (low, high) in TIERS.items() if low <= score["score"] <= high)] += 1
+            yield d
+
+    if args.fixture:
+        from fixtures import dump
+        dump(args.fixture, [Applicant.from_dict(d) for d in rows()], meta={"seed": args.seed, "count": args.count})
+    else:
+        out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+        try:
+            for d in rows():
+                out.write(json.dumps(upload_payload(d) if args.uploads else d, ensure_ascii=False) + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    elapsed = time.perf_counter() - t0
+    print(f"{args.count} applicants in {elapsed:.2f}s ({args.count / elapsed:,.0f}/s)", file=sys.stderr)
+    if args.stats:
+        for tier in TIERS:
+            print(f"  {tier:<9} {tiers[tier]:>9}  {tiers[tier] / max(1, args.count):.1%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main_cli()
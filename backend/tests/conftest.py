@@ -0,0 +1,19 @@
+import os
+import sys
+
+# The backend modules import each other by bare name, as uvicorn runs them from backend/.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("HR_SCORE_ALL_DELAY", "0")
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    """The app over freshly reseeded mock data."""
+    from fastapi.testclient import TestClient
+
+    import main
+    with TestClient(main.app) as c:
+        c.post("/api/paycom/refresh")
+        yield c
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+
+from admission import Admission, AdmissionClass, AdmissionMiddleware, Rejected
+
+CLASSES = (
+    AdmissionClass("interactive", 0, 1, 4, 1.0),
+    AdmissionClass("listing", 1, 1, 4, 1.0),
+    AdmissionClass("batch", 2, 1, 1, 0.05),
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_freed_slot_goes_to_the_most_urgent_waiter():
+    async def scenario():
+        admission = Admission(CLASSES, total=1)
+        await admission.acquire("batch")
+        order = []
+
+        async def queued(name):
+            await admission.acquire(name)
+            order.append(name)
+
+        tasks = [asyncio.create_task(queued("listing")), asyncio.create_task(queued("interactive"))]
+        await asyncio.sleep(0)
+        assert (admission.waiting("listing"), admission.waiting("interactive")) == (1, 1)
+        admission.release("batch")
+        while not order:
+            await asyncio.sleep(0)
+        admission.release(order[0])
+        await asyncio.gather(*tasks)
+        return order
+
+    assert run(scenario()) == ["interactive", "listing"]
+
+
+def test_class_at_its_own_limit_does_not_block_others():
+    async def scenario():
+        admission = Admission(CLASSES, total=4)
+        await admission.acquire("interactive")
+        second = asyncio.create_task(admission.acquire("interactive"))
+        await asyncio.sleep(0)
+        assert admission.waiting("interactive") == 1
+        # Total capacity is idle, so the listing runs now instead of queueing behind it.
+        await asyncio.wait_for(admission.acquire("listing"), 0.1)
+        admission.release("listing")
+        assert admission.running("listing") == 0
+        assert not second.done()
+        admission.release("interactive")
+        await asyncio.wait_for(second, 0.1)
+        return admission.running("interactive")
+
+    assert run(scenario()) == 1
+
+
+def test_full_queue_is_429_and_a_long_wait_is_503():
+    async def scenario():
+        admission = Admission(CLASSES, total=4)
+        await admission.acquire("batch")
+        waiter = asyncio.create_task(admission.acquire("batch"))
+        await asyncio.sleep(0)
+        with pytest.raises(Rejected) as full:
+            await admission.acquire("batch")
+        with pytest.raises(Rejected) as slow:
+            await waiter
+        return full.value, slow.value, admission.waiting("batch")
+
+    full, slow, waiting = run(scenario())
+    assert (full.status, slow.status, waiting) == (429, 503, 0)
+    assert full.retry_after >= 1 and slow.retry_after >= 1
+
+
+def test_middleware_answers_with_retry_after():
+    async def app(scope, receive, send):
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    admission = Admission(CLASSES, total=0)
+    client = TestClient(AdmissionMiddleware(app, admission, lambda method, path: "batch"))
+    response = client.get("/api/score/all")
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    unmetered = TestClient(AdmissionMiddleware(app, admission, lambda method, path: None))
+    assert unmetered.get("/api/health").text == "ok"
@@ -0,0 +1,34 @@
+import main
+
+
+def test_batch_runs_as_batch_work():
+    assert main._admission_class("POST", "/api/batch") == "batch"
+
+
+def test_batch_reports_each_op(client):
+    response = client.post("/api/batch", json={"ops": [
+        {"op": "get", "id": "PAY-0001"},
+        {"op": "get", "id": "PAY-9999"},
+        {"op": "search", "query": "jake"},
+    ]})
+    body = response.json()
+    assert [r["status"] for r in body["results"]] == [200, 404, 200]
+    assert (body["succeeded"], body["failed"], body["skipped"]) == (2, 1, 0)
+
+
+def test_stop_on_error_skips_the_rest(client):
+    body = client.post("/api/batch", json={"stop_on_error": True, "ops": [
+        {"op": "score", "id": "PAY-9999"},
+        {"op": "get", "id": "PAY-0001"},
+    ]}).json()
+    assert [r["status"] for r in body["results"]] == [404, 424]
+    assert (body["succeeded"], body["failed"], body["skipped"]) == (0, 1, 1)
+
+
+def test_preview_op_is_capped(client):
+    ids = [f"PAY-{i:04d}" for i in range(1, main.MAX_PREVIEW_PAGE + 2)]
+    [result] = client.post("/api/batch", json={"ops": [{"op": "preview", "ids": ids}]}).json()["results"]
+    assert result["status"] == 422
+
+    [result] = client.post("/api/batch", json={"ops": [{"op": "preview", "ids": ids[:3]}]}).json()["results"]
+    assert result["ok"] and len(result["result"]) == 3
@@ -0,0 +1,55 @@
+import mock_data
+from dedupe import DuplicateIndex
+from records import Applicant
+
+JAKE = next(a for a in mock_data.APPLICANTS if a["id"] == "PAY-0001")
+
+
+def _upload(client, email: str) -> dict:
+    body = {"first_name": "Jake", "last_name": "Morrison", "email": email,
+            "location": JAKE["location"], "resume_text": JAKE["resume"]["summary"]}
+    response = client.post("/api/upload-resume", json=body)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_reupload_under_a_new_email_is_flagged(client):
+    uploaded = [_upload(client, email) for email in
+                ("jake.morrison2@gmail.com", "jake.morrison@gmail.com", "jmorrison@email.com")]
+    for upload in uploaded:
+        assert "PAY-0001" in {d["id"] for d in upload["possible_duplicates"]}
+
+    groups = client.get("/api/duplicates").json()["groups"]
+    jake = next(g for g in groups if g["keep"]["id"] == "PAY-0001")
+    assert {m["id"] for m in jake["merge"]} == {u["id"] for u in uploaded}
+
+
+def _person(i: int, first: str, last: str, email: str, summary: str) -> Applicant:
+    return Applicant.from_dict({**JAKE, "id": f"T-{i}", "first_name": first, "last_name": last,
+                                "email": email, "phone": "N/A",
+                                "resume": {**JAKE["resume"], "summary": summary, "experience": [],
+                                           "certifications": [], "skills": []}})
+
+
+def test_numbered_addresses_of_namesakes_are_not_merged():
+    index = DuplicateIndex()
+    index.on_change("reset", [
+        _person(1, "Jake", "Morrison", "jake.morrison12@email.com",
+                "Barista in Denver for two years, then shift lead at a downtown coffee roastery "
+                "training new staff, handling opening duties and managing weekly inventory orders."),
+        _person(2, "Jake", "Morrison", "jake.morrison40@email.com",
+                "Ski patroller and EMT at Copper Mountain for four seasons, trained in avalanche "
+                "rescue, toboggan evacuation and lift evacuation drills with the mountain safety team."),
+    ])
+    assert index.candidates("T-1") == []
+    assert index.sweep()["pairs"] == {}
+
+
+def test_same_email_confirms_despite_different_resumes():
+    index = DuplicateIndex()
+    index.on_change("reset", [
+        _person(1, "Jake", "Morrison", "Jake.Morrison+jobs@googlemail.com", "Barista in Denver."),
+        _person(2, "J", "Morrison", "jakemorrison@gmail.com", "Ski patroller at Copper Mountain."),
+    ])
+    [match] = index.candidates("T-1")
+    assert match["id"] == "T-2" and "same email" in match["reasons"]
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import mock_data
+import eventlog
+from eventlog import EventLog
+from records import Applicant, Status
+from store import ApplicantStore
+
+
+def _store() -> ApplicantStore:
+    return ApplicantStore([Applicant.from_dict(a) for a in mock_data.APPLICANTS[:5]])
+
+
+def test_changes_replay_after_restart(tmp_path):
+    store = _store()
+    log = EventLog(str(tmp_path))
+    log.open(store)
+    aid = store.snapshot()[0].id
+    store.update(aid, lambda a: a.with_changes(status=Status.REVIEWING))
+    store.set_score(aid, {"score": 80})
+    log.close()
+
+    restored = _store()
+    replay = EventLog(str(tmp_path)).open(restored)
+    assert replay["seq"] == log.seq
+    assert restored.get(aid).status is Status.REVIEWING
+    assert restored.score(aid) == {"score": 80}
+    assert [e["type"] for e in EventLog(str(tmp_path)).tail(after=replay["seq"] - 2)] == ["status_changed", "scored"]
+
+
+def test_writers_do_not_wait_for_the_disk(tmp_path):
+    store = _store()
+    log = EventLog(str(tmp_path))
+    log.open(store)
+    log.flush()
+    gate = threading.Event()
+    append = log._append
+
+    def slow_append(events, roll=False):
+        gate.wait(5)
+        append(events, roll)
+
+    log._append = slow_append
+    aid = store.snapshot()[0].id
+    t0 = time.perf_counter()
+    for status in (Status.REVIEWING, Status.SHORTLISTED, Status.REJECTED):
+        store.update(aid, lambda a, s=status: a.with_changes(status=s))
+    assert time.perf_counter() - t0 < 1
+    assert not log.flush(timeout=0.05)
+
+    gate.set()
+    assert log.flush(timeout=5)
+    moves = [e["changes"]["status"] for e in log.history(aid) if e["type"] == "status_changed"]
+    assert moves == ["reviewing", "shortlisted", "rejected"]
+    log.close()
+
+
+def test_failed_write_is_retried_without_gaps(tmp_path, monkeypatch):
+    store = _store()
+    log = EventLog(str(tmp_path), fsync=True)
+    log.open(store)
+    assert log.flush(timeout=5)
+    log._snapshot_thread.join()
+    disk_full = threading.Event()
+    disk_full.set()
+    real_fsync = eventlog.os.fsync
+
+    def fsync(fd):
+        if disk_full.is_set():
+            raise OSError(28, "No space left on device")
+        real_fsync(fd)
+
+    monkeypatch.setattr(eventlog.os, "fsync", fsync)
+    aid = store.snapshot()[0].id
+    store.update(aid, lambda a: a.with_changes(status=Status.REVIEWING))
+    assert not log.flush(timeout=5)
+    assert "No space left" in log.error and log.pending == 1
+    store.update(aid, lambda a: a.with_changes(status=Status.SHORTLISTED))
+
+    disk_full.clear()
+    assert log.flush(timeout=5)
+    assert log.error is None and log.pending == 0
+    events = log.tail()
+    assert [e["seq"] for e in events] == list(range(1, len(events) + 1))
+    moves = [e["changes"]["status"] for e in log.history(aid) if e["type"] == "status_changed"]
+    assert moves == ["reviewing", "shortlisted"]
+    log.close()
+
+
+def test_history_index_spans_segments_and_follows_appends(tmp_path):
+    store = _store()
+    log = EventLog(str(tmp_path), snapshot_every=4)
+    log.open(store)
+    aid, other = store.snapshot()[0].id, store.snapshot()[1].id
+    for i in range(6):
+        store.set_score(aid, {"score": i})
+        store.set_score(other, {"score": -i})
+        log.flush(timeout=5)
+    assert len(log._segments()) > 1
+    assert [e["score"]["score"] for e in log.history(aid) if e["type"] == "scored"] == list(range(6))
+
+    store.set_score(aid, {"score": 99})
+    recent = log.history(aid, limit=2)
+    assert [e["score"]["score"] for e in recent] == [5, 99]
+    assert log.history("PAY-NOPE") == []
+    log.close()
@@ -0,0 +1,34 @@
+import main
+from geo import haversine_miles
+
+
+def test_haversine_matches_a_known_distance():
+    # Denver to Vail, Colorado: about 74 miles as the crow flies.
+    [miles] = haversine_miles(39.7392, -104.9903, [39.6403], [-106.3742])
+    assert 73 < miles < 75
+
+
+def test_synced_records_score_on_geocoded_distance(client):
+    synced = main._store.get("PAY-0001").with_changes(
+        id="PAY-GEO-1", email="far.away@example.com", location="Denver, CO", distance_miles=5.0,
+    )
+    main._store.add(synced)
+    result = client.post("/api/score/PAY-GEO-1").json()
+    assert result["breakdown"]["Proximity"]["points"] == 0
+    assert any("73.9 miles" in reason for reason in result["reasons"])
+
+    unknown = synced.with_changes(id="PAY-GEO-2", email="nowhere@example.com", location="Atlantis", distance_miles=5.0)
+    main._store.add(unknown)
+    result = client.post("/api/score/PAY-GEO-2").json()
+    assert result["breakdown"]["Proximity"]["points"] == 15
+
+
+def test_score_reports_the_distance_it_used(client):
+    record = client.get("/api/applicants/PAY-0018").json()
+    result = client.post("/api/score/PAY-0018").json()
+    assert record["distance_miles"] == 5.9
+    assert result["geocoded_miles"] == 11.7
+    assert any("11.7 miles" in reason for reason in result["reasons"])
+    page = client.get("/api/applicants/page?fields=id,distance_miles,geocoded_miles&limit=50").json()
+    row = next(r for r in page["items"] if r["id"] == "PAY-0018")
+    assert (row["distance_miles"], row["geocoded_miles"]) == (5.9, 11.7)
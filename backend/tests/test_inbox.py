@@ -0,0 +1,74 @@
+import os
+
+import mock_data
+from inbox import InboxIngester
+from records import Applicant
+from store import ApplicantStore
+
+
+def _store():
+    return ApplicantStore([Applicant.from_dict(a) for a in mock_data.APPLICANTS])
+
+
+def _message(sender: str, body: str) -> bytes:
+    return f"From: {sender}\nSubject: Re: Interview\nDate: Mon, 5 Jan 2026 09:00:00 -0700\n\n{body}\n".encode()
+
+
+def _score(text, applicant):
+    return {"score": len(text.split())}
+
+
+def test_maildir_message_moved_to_cur_is_not_read_again(tmp_path):
+    store = _store()
+    applicant = store.get("PAY-0001")
+    maildir = tmp_path / "Maildir"
+    for sub in ("new", "cur", "tmp"):
+        (maildir / sub).mkdir(parents=True)
+    (maildir / "new" / "1700000000.M1P1.host").write_bytes(_message(applicant.email, "Yes, available weekends."))
+
+    inbox = InboxIngester(str(maildir), store, _score)
+    assert inbox.poll()["matched"] == 1
+    assert store.get("PAY-0001").response_data["text"] == "Yes, available weekends."
+
+    # The mail client marks it read: new/NAME -> cur/NAME:2,S, with a fresh mtime.
+    os.rename(maildir / "new" / "1700000000.M1P1.host", maildir / "cur" / "1700000000.M1P1.host:2,S")
+    os.utime(maildir / "cur" / "1700000000.M1P1.host:2,S", ns=(2 * 10**18, 2 * 10**18))
+    assert inbox.poll()["read"] == 0
+
+    (maildir / "new" / "1600000000.M2P2.host").write_bytes(_message(applicant.email, "Also free on holidays."))
+    restarted = InboxIngester(str(maildir), store, _score)
+    stats = restarted.poll()
+    assert (stats["read"], stats["seen"]) == (1, 2)
+    assert store.get("PAY-0001").response_data["text"] == "Also free on holidays."
+
+
+def test_mbox_resumes_from_its_offset(tmp_path):
+    store = _store()
+    mbox = tmp_path / "inbox.mbox"
+    email = store.get("PAY-0002").email
+    mbox.write_bytes(b"From sender Mon Jan  5 09:00:00 2026\n" + _message(email, "First reply.") + b"\n")
+    inbox = InboxIngester(str(mbox), store, _score)
+    assert inbox.poll()["matched"] == 1
+    with open(mbox, "ab") as f:
+        f.write(b"From sender Mon Jan  5 10:00:00 2026\n" + _message(email, "Second reply.") + b"\n")
+    stats = InboxIngester(str(mbox), store, _score).poll()
+    assert stats["read"] == 1 and stats["high_water"] == mbox.stat().st_size
+    assert store.get("PAY-0002").response_data["text"] == "Second reply."
+
+
+def test_unreadable_message_is_skipped_not_retried_forever(tmp_path):
+    store = _store()
+    applicant = store.get("PAY-0003")
+    maildir = tmp_path / "Maildir"
+    for sub in ("new", "cur", "tmp"):
+        (maildir / sub).mkdir(parents=True)
+    bogus = (f"From: {applicant.email}\nSubject: Re: Interview\nMIME-Version: 1.0\n"
+             'Content-Type: text/plain; charset="x-bogus"\n\nYes please.\n').encode()
+    (maildir / "new" / "1500000000.M1P1.host").write_bytes(bogus)
+    (maildir / "new" / "1600000000.M2P2.host").write_bytes(_message(applicant.email, "Available all season."))
+
+    inbox = InboxIngester(str(maildir), store, _score)
+    stats = inbox.poll()
+    assert (stats["read"], stats["failed"], stats["matched"]) == (2, 1, 1)
+    assert store.get("PAY-0003").response_data["text"] == "Available all season."
+    assert inbox.poll()["read"] == 0
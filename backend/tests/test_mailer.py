@@ -0,0 +1,63 @@
+import smtplib
+import time
+
+import pytest
+
+from mailer import Dispatcher, permanent
+
+# Recipient -> errors its sends raise, in order; then it is accepted.
+SCRIPT = {
+    "bounce@x.com": [smtplib.SMTPRecipientsRefused({"bounce@x.com": (550, b"No such user")})],
+    "greylisted@x.com": [smtplib.SMTPRecipientsRefused({"greylisted@x.com": (450, b"Try later")})],
+    "data@x.com": [smtplib.SMTPDataError(554, b"Rejected as spam")],
+    "sender@x.com": [smtplib.SMTPSenderRefused(553, b"Bad sender", "hr@x.com")],
+    "busy@x.com": [smtplib.SMTPDataError(421, b"Busy"), smtplib.SMTPServerDisconnected("gone"), OSError("reset")],
+}
+
+
+class ScriptedTransport:
+    def __init__(self):
+        self.pending = {to: list(errors) for to, errors in SCRIPT.items()}
+
+    def send(self, msg):
+        errors = self.pending.get(msg["To"])
+        if errors:
+            raise errors.pop(0)
+
+    def close(self):
+        pass
+
+
+def _deliver(recipients: list[str]) -> dict:
+    transport = ScriptedTransport()
+    dispatcher = Dispatcher(lambda: transport, rate=1000, connections=1, max_attempts=5, backoff=0.001)
+    job_id = dispatcher.submit([{"applicant_id": to, "to": to, "subject": "s", "body": "b"} for to in recipients])
+    try:
+        for _ in range(500):
+            job = dispatcher.job(job_id, include_messages=True)
+            if job["done"]:
+                return {m["to"]: m for m in job["messages"]}
+            time.sleep(0.01)
+        raise AssertionError(f"job did not finish: {job}")
+    finally:
+        dispatcher.stop()
+
+
+def test_5xx_replies_fail_at_once_and_4xx_are_retried():
+    messages = _deliver(list(SCRIPT) + ["ok@x.com"])
+    for to in ("bounce@x.com", "data@x.com", "sender@x.com"):
+        assert (messages[to]["state"], messages[to]["attempts"]) == ("failed", 1), to
+    assert (messages["greylisted@x.com"]["state"], messages["greylisted@x.com"]["attempts"]) == ("sent", 2)
+    assert (messages["busy@x.com"]["state"], messages["busy@x.com"]["attempts"]) == ("sent", 4)
+    assert (messages["ok@x.com"]["state"], messages["ok@x.com"]["attempts"]) == ("sent", 1)
+
+
+@pytest.mark.parametrize("error, expected", [
+    (smtplib.SMTPResponseException(550, b"no"), True),
+    (smtplib.SMTPResponseException(451, b"later"), False),
+    (smtplib.SMTPServerDisconnected("gone"), False),
+    (ConnectionRefusedError(), False),
+    (smtplib.SMTPNotSupportedError("no SMTPUTF8"), True),
+])
+def test_permanent(error, expected):
+    assert permanent(error) is expected
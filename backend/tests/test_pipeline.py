@@ -0,0 +1,82 @@
+import mock_data
+import pytest
+
+import main
+from pipeline import Effect, Pipeline, TransitionError
+from records import Applicant, Status
+from store import ApplicantStore
+
+
+def _store() -> ApplicantStore:
+    return ApplicantStore([Applicant.from_dict(a) for a in mock_data.APPLICANTS[:4]])
+
+
+def _booking(fail: set, rolled_back: list) -> dict:
+    """A ``reserve_interview`` effect that cannot place the IDs in ``fail``."""
+    def prepare(moves):
+        return {r.id: {"calendar_event": {"room": "A"}} for r, _ in moves if r.id not in fail}
+    return {"reserve_interview": Effect(prepare, rollback=rolled_back.extend, failure="no_slot_available")}
+
+
+def test_failed_effect_rolls_back_the_whole_atomic_batch():
+    store, rolled_back = _store(), []
+    ids = [a.id for a in store.snapshot()[:3]]
+    before = {aid: store.get(aid) for aid in ids}
+    pipeline = Pipeline(store, _booking({ids[1]}, rolled_back))
+
+    with pytest.raises(TransitionError) as e:
+        pipeline.apply({aid: "booked" for aid in ids})
+
+    assert e.value.errors == {ids[1]: "no_slot_available"}
+    assert all(store.get(aid) is before[aid] for aid in ids)
+    assert sorted(r.id for r, _ in rolled_back) == sorted(ids)
+
+
+def test_non_atomic_batch_rolls_back_only_the_failures():
+    store, rolled_back, batches = _store(), [], []
+    ids = [a.id for a in store.snapshot()[:3]]
+    pipeline = Pipeline(store, _booking({ids[1]}, rolled_back), on_batch=batches.append)
+
+    outcome = pipeline.apply({aid: "booked" for aid in ids}, atomic=False)
+
+    assert set(outcome.applied) == {ids[0], ids[2]}
+    assert outcome.errors == {ids[1]: "no_slot_available"}
+    assert store.get(ids[1]).status is Status.NEW
+    assert [r.id for r, _ in rolled_back] == [ids[1]]
+    assert batches[0][(Status.NEW, Status.BOOKED)] == 2
+
+
+def test_illegal_transitions_are_rejected_up_front():
+    store = _store()
+    aid = store.snapshot()[0].id
+    with pytest.raises(TransitionError) as e:
+        Pipeline(store, {}).apply({aid: "hired"})
+    assert e.value.errors == {aid: "invalid_transition:new->hired"}
+
+
+def test_only_from_leaves_other_statuses_alone():
+    store = _store()
+    first, second = (a.id for a in store.snapshot()[:2])
+    pipeline = Pipeline(store, {})
+    pipeline.apply({second: "shortlisted"})
+
+    outcome = pipeline.apply({first: "reviewing", second: "reviewing"}, atomic=False, only_from=Status.NEW)
+
+    assert set(outcome.applied) == {first}
+    assert outcome.errors == {second: "not_new"}
+
+
+def test_illegal_status_change_answers_409(client):
+    response = client.patch("/api/applicants/PAY-0001/status", json={"status": "hired"})
+    assert response.status_code == 409
+    assert "allowed:" in response.json()["detail"]
+
+
+def test_auto_promotion_goes_through_the_pipeline(client):
+    def promoted() -> float:
+        return main.STATUS_TRANSITIONS.samples().get(("new", "reviewing"), 0)
+
+    before = promoted()
+    run = client.post("/api/score/all").json()
+    assert run["auto_promoted"] > 0
+    assert promoted() - before == run["auto_promoted"]
@@ -0,0 +1,24 @@
+import profiling
+
+
+def test_profile_routes_require_token(client, monkeypatch):
+    recorded = client.get("/api/applicants/PAY-0001", headers={"X-Profile": "1"})
+    profile_id = recorded.headers["x-profile-id"]
+    assert client.get(f"/api/debug/profiles/{profile_id}").status_code == 200
+
+    monkeypatch.setattr(profiling, "TOKEN", "s3cret")
+    assert client.get("/api/debug/profiles").status_code == 403
+    assert client.get(f"/api/debug/profiles/{profile_id}", headers={"X-Profile": "1"}).status_code == 403
+
+    listing = client.get("/api/debug/profiles", headers={"X-Profile": "s3cret"})
+    assert profile_id in [p["id"] for p in listing.json()["profiles"]]
+    stacks = client.get(f"/api/debug/profiles/{profile_id}", headers={"X-Profile": "s3cret"})
+    assert stacks.status_code == 200
+
+
+def test_sampler_stops_after_join():
+    sampler = profiling.StackSampler(interval=0.001)
+    sampler.start()
+    sampler.stop()
+    sampler.join(timeout=5)
+    assert not sampler.is_alive()
@@ -0,0 +1,62 @@
+import random
+from datetime import datetime, timedelta
+
+from scheduler import Scheduler
+
+CONFIG = {
+    "start_date": "2026-03-03", "weekdays": ["Tue", "Thu"], "day_start": "09:00", "day_end": "11:00",
+    "slot_minutes": 30, "rooms": ["A", "B"], "interviewers": ["X", "Y"], "max_weeks": 3,
+}
+
+
+def _seats(scheduler):
+    return {(r.start, r.room) for r in scheduler._by_applicant.values()}
+
+
+def test_fills_earliest_seats_and_stops_at_max_weeks():
+    scheduler = Scheduler(CONFIG)
+    # 2 days x 4 slots x 2 seats x 3 weeks = 48 seats.
+    booked = scheduler.reserve_many(f"A{i}" for i in range(50))
+    assert len(booked) == 48
+    starts = [r.start for r in booked.values()]
+    assert starts == sorted(starts)
+    assert starts[:3] == [datetime(2026, 3, 3, 9, 0)] * 2 + [datetime(2026, 3, 3, 9, 30)]
+    assert len(_seats(scheduler)) == 48
+    assert scheduler.summary()["next_free"] is None
+
+
+def test_release_reopens_the_seat_and_rebooking_is_stable():
+    scheduler = Scheduler(CONFIG)
+    scheduler.reserve_many(f"A{i}" for i in range(6))
+    first = scheduler.get("A1")
+    assert scheduler.reserve_many(["A1"])["A1"] == first
+    assert scheduler.release("A1") and not scheduler.release("A1")
+    assert scheduler.summary()["next_free"] == "2026-03-03T09:00"
+    assert scheduler.reserve_many(["B1"])["B1"].start == first.start
+    assert scheduler.summary()["next_free"] == "2026-03-03T10:30"
+
+
+def test_earliest_skips_ahead_without_losing_earlier_seats():
+    scheduler = Scheduler(CONFIG)
+    late = scheduler.reserve_many(["L1"], earliest=datetime(2026, 3, 5, 10, 0))["L1"]
+    assert late.start == datetime(2026, 3, 5, 10, 0)
+    assert scheduler.reserve_many(["E1"])["E1"].start == datetime(2026, 3, 3, 9, 0)
+
+
+def test_random_bookings_match_a_brute_force_grid():
+    rng = random.Random(7)
+    scheduler = Scheduler(CONFIG)
+    grid = scheduler._grid
+    seats = {(grid.origin + timedelta(minutes=k), room) for week in range(3) for k in grid.week_slots(week) for room in "AB"}
+    for step in range(400):
+        booked = list(scheduler._by_applicant)
+        if booked and rng.random() < 0.4:
+            scheduler.release(rng.choice(booked))
+            continue
+        free = sorted(seats - _seats(scheduler))
+        got = scheduler.reserve_many([f"P{step}"]).get(f"P{step}")
+        if not free:
+            assert got is None
+        else:
+            assert got.start == free[0][0]
+
@@ -0,0 +1,56 @@
+import pytest
+
+from settings import DEFAULT_SETTINGS, SettingsStore
+
+
+@pytest.fixture
+def settings_client(client):
+    yield client
+    client.put("/api/settings", json=DEFAULT_SETTINGS)
+
+
+def test_partial_section_update_keeps_the_other_keys():
+    store = SettingsStore()
+    snapshot = store.update({"scoring": {"auto_promote_threshold": 80}})
+    assert snapshot["scoring"] == {**DEFAULT_SETTINGS["scoring"], "auto_promote_threshold": 80}
+    assert snapshot["email"] == DEFAULT_SETTINGS["email"]
+    assert snapshot.version == 2
+
+
+def test_partial_update_is_still_validated():
+    store = SettingsStore()
+    with pytest.raises(ValueError, match="consider_threshold must not exceed"):
+        store.update({"scoring": {"consider_threshold": 90}})
+    with pytest.raises(ValueError, match="scoring.bogus"):
+        store.update({"scoring": {"bogus": 1}})
+    assert store.current().version == 1
+
+
+def test_partial_put(settings_client):
+    response = settings_client.put("/api/settings", json={"email": {"subject": "Come ski with us"}})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["email"]["subject"] == "Come ski with us"
+    assert body["email"]["template"] == DEFAULT_SETTINGS["email"]["template"]
+    assert body["scoring"] == DEFAULT_SETTINGS["scoring"]
+
+    bad = settings_client.put("/api/settings", json={"scoring": {"strong_hire_threshold": 101}})
+    assert bad.status_code == 400
+    assert "scoring.strong_hire_threshold" in bad.json()["detail"]
+
+
+def test_threshold_change_relabels_cached_scores(settings_client):
+    scored = settings_client.post("/api/score/PAY-0001").json()
+    points = scored["score"]
+
+    settings_client.put("/api/settings", json={"scoring": {"strong_hire_threshold": 100, "consider_threshold": 100}})
+    applicant = settings_client.get("/api/applicants/PAY-0001").json()
+    assert applicant["score_data"]["score"] == points
+    assert applicant["score_data"]["recommendation"] in ("Weak Candidate", "Reject")
+
+    settings_client.put("/api/settings", json={"scoring": {"strong_hire_threshold": 0, "consider_threshold": 0}})
+    applicant = settings_client.get("/api/applicants/PAY-0001").json()
+    assert applicant["score_data"]["recommendation"] == "Strong Hire"
+    assert applicant["score_data"]["badge"] == "🟢"
+    listed = {a["id"]: a for a in settings_client.get("/api/applicants").json()}
+    assert listed["PAY-0001"]["score_data"]["recommendation"] == "Strong Hire"
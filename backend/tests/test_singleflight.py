@@ -0,0 +1,50 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def compute():
+        runs.append(1)
+        release.wait(5)
+        return "ranked"
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(flight.do, ("applicants", "score"), compute) for _ in range(4)]
+        while sum(flight.stats.values()) < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        assert [f.result() for f in futures] == ["ranked"] * 4
+
+    assert len(runs) == 1
+    assert flight.stats == {("applicants:score", "leader"): 1, ("applicants:score", "shared"): 3}
+    assert flight.do(("applicants", "score"), lambda: "fresh") == "fresh"
+
+
+def test_shared_callers_see_the_leaders_error():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("score_all", fail) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert flight.stats == {("score_all", "leader"): 1, ("score_all", "shared"): 2}
+    assert not flight.running("score_all")
+
+
+def test_metric_labels_are_flat(client):
+    client.get("/api/applicants?sort=score")
+    text = client.get("/api/metrics").text
+    assert 'hr_coalesced_requests_total{key="applicants:score",role="leader"}' in text
+    assert "('applicants'" not in text
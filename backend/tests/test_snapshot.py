@@ -0,0 +1,50 @@
+import os
+import time
+
+import pytest
+
+import snapshot
+from snapshot import Publisher, Snapshot
+
+
+def _contents():
+    return [("PAY-0001", b'{"id":"PAY-0001"}')], {}, {"job": b"{}"}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_failed_publish_is_retried_without_another_change(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    calls = []
+
+    def build():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError(28, "No space left on device")
+        return _contents()
+
+    publisher = Publisher(path, build, interval=0.01)
+    publisher.start()
+    try:
+        assert _wait_for(lambda: publisher.published == publisher.generation)
+        assert publisher.failures == 1 and len(calls) == 2
+        assert Snapshot(path).generation == publisher.generation
+    finally:
+        publisher.stop()
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshot.bin")
+
+    def no_space(fd):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(snapshot.os, "fsync", no_space)
+    with pytest.raises(OSError):
+        snapshot.write(path, 1, *_contents())
+    assert os.listdir(tmp_path) == []
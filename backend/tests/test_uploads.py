@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from uploads import Extractor, UploadRejected
+
+RESUME = b"Ski lift operator at Vail for three seasons. OSHA 10, First Aid, CPR. Available weekends and holidays."
+
+
+def test_file_upload_is_spooled_and_scored(client):
+    response = client.post(
+        "/api/upload-resume/file",
+        data={"first_name": "Rae", "last_name": "Lindqvist", "email": "rae@example.com", "location": "Avon, CO"},
+        files={"file": ("resume.txt", RESUME, "text/plain")},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["source"]["kind"] == "text"
+    assert body["source"]["bytes"] == len(RESUME)
+
+    too_large = client.post(
+        "/api/upload-resume/file",
+        data={"first_name": "Rae", "last_name": "Lindqvist", "email": "rae@example.com"},
+        files={"file": ("resume.txt", b"x" * (11 * 1024 * 1024), "text/plain")},
+    )
+    assert too_large.status_code == 413
+
+
+def test_reset_pool_terminates_its_workers(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_bytes(RESUME)
+    extractor = Extractor(workers=1, concurrency=1)
+
+    async def scenario():
+        return await extractor.extract(str(path), "text")
+
+    try:
+        assert "Vail" in asyncio.run(scenario())
+        [worker] = extractor._workers.processes
+        assert worker.is_alive()
+        extractor._reset_pool()
+        worker.join(5)
+        assert not worker.is_alive()
+    finally:
+        extractor.close()
+
+
+def test_extract_rejects_binary(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_bytes(b"\x00\x01\x02" * 100)
+    extractor = Extractor(workers=1, concurrency=1)
+    try:
+        with pytest.raises(UploadRejected) as rejected:
+            asyncio.run(extractor.extract(str(path), "text"))
+        assert rejected.value.status == 422
+    finally:
+        extractor.close()
@@ -0,0 +1,380 @@
+"""Resume file uploads: spool to disk, then extract text on a process pool.
+
+``spool`` parses a ``multipart/form-data`` body as it arrives. The file part
+goes straight into a temp file under ``HR_UPLOAD_DIR`` and the body is never
+held in memory. Parsing and disk writes happen on a worker thread, one chunk at a
+time, so a slow disk does not stall the event loop. Uploads larger than ``HR_UPLOAD_MAX_MB`` are cut off mid-stream.
+
+``Extractor`` turns the spooled file into plain text in worker processes, so
+parsing a PDF never blocks the event loop or holds the GIL. At most
+``HR_EXTRACT_CONCURRENCY`` extractions run at once and at most
+``HR_EXTRACT_QUEUE`` wait behind them; later uploads are refused. A batch of
+large PDFs therefore cannot starve the API.
+
+File types are detected from their leading bytes:
+
+- PDF uses ``pypdf`` when it is installed. Otherwise a built-in reader handles
+  uncompressed and Flate streams with simple fonts.
+- DOCX is read with ``zipfile``.
+- Anything else must decode as text.
+"""
+import asyncio
+import os
+import re
+import tempfile
+import zipfile
+import zlib
+from multiprocessing.context import SpawnContext
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Optional
+from xml.etree import ElementTree
+
+import anyio.to_thread
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+UPLOAD_DIR = os.environ.get("HR_UPLOAD_DIR", "") or tempfile.gettempdir()
+MAX_UPLOAD_BYTES = int(float(os.environ.get("HR_UPLOAD_MAX_MB", "10")) * 1024 * 1024)
+EXTRACT_WORKERS = int(os.environ.get("HR_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+EXTRACT_CONCURRENCY = int(os.environ.get("HR_EXTRACT_CONCURRENCY", str(EXTRACT_WORKERS)))
+EXTRACT_QUEUE = int(os.environ.get("HR_EXTRACT_QUEUE", "32"))
+EXTRACT_TIMEOUT = float(os.environ.get("HR_EXTRACT_TIMEOUT", "30"))
+MAX_FIELD_BYTES = 64 * 1024
+MAX_TEXT_CHARS = 200_000
+# Largest decompressed DOCX document part we are willing to parse.
+MAX_DOCX_XML_BYTES = 50 * 1024 * 1024
+
+KINDS = ("pdf", "docx", "text")
+_EXTENSIONS = {".pdf": "pdf", ".docx": "docx", ".txt": "text", ".text": "text", ".md": "text", ".rtf": "text"}
+
+
+class UploadRejected(Exception):
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+@dataclass
+class Upload:
+    fields: dict[str, str] = field(default_factory=dict)
+    filename: Optional[str] = None
+    path: Optional[str] = None
+    size: int = 0
+
+    def discard(self) -> None:
+        if self.path:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+
+# -- spooling -----------------------------------------------------------------
+
+async def spool(request, directory: str = UPLOAD_DIR, max_bytes: int = MAX_UPLOAD_BYTES,
+                file_field: str = "file") -> Upload:
+    """Stream a multipart request into an ``Upload``; the caller must ``discard()`` it."""
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise UploadRejected(415, "Expected multipart/form-data")
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes + MAX_FIELD_BYTES:
+        raise UploadRejected(413, f"Upload exceeds {max_bytes // (1024 * 1024)} MB")
+
+    upload = Upload()
+    part: dict = {}
+    out = None
+
+    def on_part_begin():
+        part.clear()
+        part.update(headers={}, name=b"", value=b"", buf=[], fn=None)
+
+    def on_header_field(data, start, end):
+        part["name"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        part["value"] += data[start:end]
+
+    def on_header_end():
+        part["headers"][part["name"].lower()] = part["value"]
+        part["name"], part["value"] = b"", b""
+
+    def on_headers_finished():
+        nonlocal out
+        _, disposition = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        part["field"] = disposition.get(b"name", b"").decode("utf-8", "replace")
+        if b"filename" in disposition:
+            if part["field"] != file_field or out is not None:
+                raise UploadRejected(400, f"Send exactly one file, in the {file_field!r} field")
+            upload.filename = os.path.basename(disposition[b"filename"].decode("utf-8", "replace"))
+            fd, upload.path = tempfile.mkstemp(prefix="hr-upload-", dir=directory)
+            out = part["fn"] = os.fdopen(fd, "wb")
+
+    def on_part_data(data, start, end):
+        if part["fn"] is not None:
+            upload.size += end - start
+            if upload.size > max_bytes:
+                raise UploadRejected(413, f"Upload exceeds {max_bytes // (1024 * 1024)} MB")
+            part["fn"].write(data[start:end])
+        else:
+            part["buf"].append(data[start:end])
+            if sum(map(len, part["buf"])) > MAX_FIELD_BYTES:
+                raise UploadRejected(413, f"Form field {part['field']!r} is too large")
+
+    def on_part_end():
+        if part["fn"] is None:
+            upload.fields[part["field"]] = b"".join(part["buf"]).decode("utf-8", "replace")
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin, "on_header_field": on_header_field,
+        "on_header_value": on_header_value, "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished, "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+    try:
+        async for chunk in request.stream():
+            await anyio.to_thread.run_sync(parser.write, chunk)
+        await anyio.to_thread.run_sync(parser.finalize)
+    except UploadRejected:
+        upload.discard()
+        raise
+    except Exception as e:
+        upload.discard()
+        raise UploadRejected(400, f"Malformed multipart body: {e}") from None
+    finally:
+        if out is not None:
+            out.close()
+    if upload.path is None:
+        raise UploadRejected(422, f"No file in the {file_field!r} field")
+    return upload
+
+
+def detect_kind(path: str, filename: Optional[str] = None) -> str:
+    """``pdf``, ``docx`` or ``text`` from the file's leading bytes; raises ``UploadRejected(415)``."""
+    with open(path, "rb") as f:
+        head = f.read(8)
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    if head.startswith(b"\xd0\xcf\x11\xe0"):
+        raise UploadRejected(415, "Legacy .doc files are not supported; save as .docx or PDF")
+    ext = os.path.splitext(filename or "")[1].lower()
+    if _EXTENSIONS.get(ext, "text") != "text":
+        raise UploadRejected(415, f"File content does not match its {ext} extension")
+    return "text"
+
+
+# -- extraction (runs in worker processes) ------------------------------------
+
+def extract_text(path: str, kind: str) -> str:
+    if kind == "pdf":
+        text = _pdf_text(path)
+    elif kind == "docx":
+        text = _docx_text(path)
+    else:
+        text = _plain_text(path)
+    text = re.sub(r"[ \t\r\f\v]+", " ", text)
+    text = re.sub(r"\n\s*\n+", "\n\n", text).strip()
+    return text[:MAX_TEXT_CHARS]
+
+
+def _plain_text(path: str) -> str:
+    with open(path, "rb") as f:
+        data = f.read(MAX_TEXT_CHARS * 4)
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16", "replace")
+    if b"\x00" in data[:4096]:
+        raise ValueError("binary file")
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", "replace")
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _docx_text(path: str) -> str:
+    try:
+        with zipfile.ZipFile(path) as z:
+            info = z.getinfo("word/document.xml")
+            if info.file_size > MAX_DOCX_XML_BYTES:
+                raise ValueError("document.xml too large")
+            with z.open(info) as f:
+                parts = []
+                for _, el in ElementTree.iterparse(f, events=("end",)):
+                    if el.tag == _W + "t":
+                        parts.append(el.text or "")
+                    elif el.tag == _W + "tab":
+                        parts.append("\t")
+                    elif el.tag in (_W + "br", _W + "p"):
+                        parts.append("\n")
+                        if el.tag == _W + "p":
+                            el.clear()
+                return "".join(parts)
+    except (KeyError, zipfile.BadZipFile) as e:
+        raise ValueError(f"not a DOCX file: {e}") from None
+
+
+def _pdf_text(path: str) -> str:
+    if PdfReader is not None:
+        reader = PdfReader(path)
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    with open(path, "rb") as f:
+        data = f.read()
+    return _pdf_text_builtin(data)
+
+
+_STREAM = re.compile(rb"(?<!end)stream\r?\n")
+_TOKEN = re.compile(rb"\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>|\[|\]|[-+]?(?:\d+\.?\d*|\.\d+)|/[^\s/\[\]()<>]+|[A-Za-z'\"*]+", re.S)
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f", b"(": b"(", b")": b")", b"\\": b"\\"}
+
+
+def _pdf_string(token: bytes) -> str:
+    if token.startswith(b"<"):
+        digits = re.sub(rb"\s", b"", token[1:-1]).decode()
+        raw = bytes.fromhex(digits + "0" * (len(digits) % 2))
+        if raw.startswith(b"\xfe\xff"):
+            return raw[2:].decode("utf-16-be", "replace")
+    else:
+        raw = re.sub(
+            rb"\\([0-7]{1,3}|\r?\n|.)",
+            lambda m: (bytes([int(m.group(1), 8) & 0xFF]) if m.group(1)[:1].isdigit()
+                       else b"" if m.group(1).strip(b"\r\n") == b"" else _ESCAPES.get(m.group(1), m.group(1))),
+            token[1:-1], flags=re.S,
+        )
+    return "".join(ch for ch in raw.decode("cp1252", "replace") if ch.isprintable() or ch in "\n\t")
+
+
+def _pdf_text_builtin(data: bytes) -> str:
+    """Text drawn by ``Tj``/``TJ``/``'``/``"`` in each content stream, in stream order."""
+    out = []
+    for m in _STREAM.finditer(data):
+        end = data.find(b"endstream", m.end())
+        if end < 0:
+            break
+        header = data[data.rfind(b"obj", 0, m.start()):m.start()]
+        if b"/Image" in header or b"/Length1" in header or b"/ObjStm" in header or b"/XRef" in header:
+            continue
+        content = data[m.end():end]
+        if b"/FlateDecode" in header:
+            try:
+                content = zlib.decompressobj().decompress(content)
+            except zlib.error:
+                continue
+        elif b"/Filter" in header:
+            continue
+        if b"BT" not in content:
+            continue
+        operands: list = []
+        for token in _TOKEN.findall(content):
+            if token[:1] in b"(<" or token in (b"[", b"]") or token[:1] in b"-+.0123456789/":
+                operands.append(token)
+                continue
+            if token in (b"Tj", b"'", b'"'):
+                if token != b"Tj":
+                    out.append("\n")
+                out.extend(_pdf_string(t) for t in operands if t[:1] in b"(<")
+            elif token == b"TJ":
+                for t in operands:
+                    if t[:1] in b"(<":
+                        out.append(_pdf_string(t))
+                    elif t[:1] in b"-+.0123456789" and float(t) < -200:
+                        out.append(" ")
+            elif token in (b"T*", b"ET"):
+                out.append("\n")
+            elif token in (b"Td", b"TD") and len(operands) >= 2:
+                try:
+                    out.append("\n" if float(operands[-1]) != 0 else " ")
+                except ValueError:
+                    pass
+            operands = []
+    return "".join(out)
+
+
+# -- pool ---------------------------------------------------------------------
+
+class _WorkerContext(SpawnContext):
+    """Spawn context that remembers the worker processes a pool starts through it."""
+
+    def __init__(self):
+        super().__init__()
+        self.processes: list = []
+
+    def Process(self, *args, **kwargs):
+        process = super().Process(*args, **kwargs)
+        self.processes = [p for p in self.processes if p.is_alive()] + [process]
+        return process
+
+
+class Extractor:
+    def __init__(self, workers: int = EXTRACT_WORKERS, concurrency: int = EXTRACT_CONCURRENCY,
+                 queue: int = EXTRACT_QUEUE, timeout: float = EXTRACT_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_waiting = queue
+        self.concurrency = concurrency
+        self.running = 0
+        self.waiting = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._workers: Optional[_WorkerContext] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: the app runs mailer and snapshot threads, which fork() would copy mid-lock.
+            self._workers = _WorkerContext()
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=self._workers)
+        return self._pool
+
+    async def extract(self, path: str, kind: str) -> str:
+        """Text of a spooled upload; raises ``UploadRejected`` when busy, too slow or unreadable."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        if self._slots.locked() and self.waiting >= self.max_waiting:
+            raise UploadRejected(503, "Too many resumes are being processed; try again shortly")
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor(), extract_text, path, kind)
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            # The worker may be stuck on a pathological file; replace the pool rather than wait.
+            self._reset_pool()
+            raise UploadRejected(422, f"Could not extract text from the {kind} file in time") from None
+        except BrokenProcessPool:
+            self._reset_pool()
+            raise UploadRejected(503, "Text extraction worker crashed; try again") from None
+        except Exception as e:
+            raise UploadRejected(422, f"Could not read the {kind} file: {e}") from None
+        finally:
+            self.running -= 1
+            self._slots.release()
+
+    def _reset_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            for process in self._workers.processes:
+                if process.is_alive():
+                    process.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,24 @@
+#!/bin/bash
+# Builds frontend/dist from frontend/src. Run it when the UI changes (or in the image build)
+# and commit the result. dist/.source-hash records which sources it was built from, so
+# `./build.sh --check` tells run.sh whether the committed build is current.
+set -e
+cd "$(dirname "$0")/frontend"
+
+source_hash() {
+  find src index.html package.json package-lock.json tsconfig.json ./*.config.* -type f -print0 \
+    | sort -z | xargs -0 sha256sum | sha256sum | cut -d' ' -f1
+}
+
+if [ "$1" = "--check" ]; then
+  [ -f dist/.source-hash ] && [ "$(cat dist/.source-hash)" = "$(source_hash)" ]
+  exit
+fi
+
+npm ci --no-audit --no-fund --silent
+# Build next to dist and swap it in, so a failed build leaves the old one intact.
+rm -rf dist.next
+npm run build --silent -- --outDir dist.next --emptyOutDir
+source_hash > dist.next/.source-hash
+rm -rf dist
+mv dist.next dist
@@ -1,13 +1,13 @@
 import { useState, useEffect, useCallback, useRef } from 'react'
 import { Zap, Settings, UserPlus, RefreshCw, Mail, CalendarCheck, Filter } from 'lucide-react'
 import type { Applicant, JobPosting, ApplicantStatus } from './types'
-import { fetchJob, fetchApplicants, scoreAll, updateStatus, previewEmails, bulkAction, simulateReply, simulateResponse, paycomRefresh } from './api'
+import { fetchJob, fetchApplicants, scoreAll, updateStatus, previewSummary, bulkAction, simulateReply, simulateResponse, paycomRefresh } from './api'
 import ApplicantCard from './components/ApplicantCard'
 import ResumePanel from './components/ResumePanel'
 import SettingsModal from './components/SettingsModal'
 import EmailPreviewModal from './components/EmailPreviewModal'
 import UploadResumeModal from './components/UploadResumeModal'
-import type { EmailPreview } from './api'
+import type { EmailPreviewSummary } from './api'
 
 const COLUMNS: { key: ApplicantStatus; label: string; color: string; accent: string }[] = [
   { key: 'new', label: 'New', color: 'bg-gray-100', accent: 'border-gray-300' },
@@ -39,7 +39,7 @@ export default function App() {
   const [replyModal, setReplyModal] = useState<{ applicant: Applicant; reply: string } | null>(null)
   const [replyInput, setReplyInput] = useState('')
   const [showSettings, setShowSettings] = useState(false)
-  const [emailPreviews, setEmailPreviews] = useState<EmailPreview[] | null>(null)
+  const [emailPreviews, setEmailPreviews] = useState<EmailPreviewSummary | null>(null)
   const [showUpload, setShowUpload] = useState(false)
   const [syncing, setSyncing] = useState(false)
   const [draggedId, setDraggedId] = useState<string | null>(null)
@@ -100,25 +100,36 @@ export default function App() {
   }
 
   const handleStatusChange = async (id: string, status: string) => {
-    await updateStatus(id, status)
+    try {
+      await updateStatus(id, status)
+    } catch (e) {
+      showToast(`⚠️ ${(e as Error).message}`)
+      return
+    }
     await load()
     if (activeApplicant?.id === id) {
       setActiveApplicant(prev => prev ? { ...prev, status: status as ApplicantStatus } : prev)
     }
   }
 
+  // Recipients only; the modal renders bodies a page at a time as they come into view.
+  const openEmailPreview = async (ids: string[]) => {
+    const summary = await previewSummary(ids)
+    if (summary.total === 0) { showToast('⚠️ None of the selected applicants exist any more'); return }
+    setEmailPreviews(summary)
+  }
+
   const handlePreviewAndSend = async () => {
     if (selected.size === 0) { showToast('Select at least one applicant'); return }
-    const res = await previewEmails(Array.from(selected))
-    setEmailPreviews(res.previews)
+    await openEmailPreview(Array.from(selected))
   }
 
   const handleConfirmSend = async () => {
     if (!emailPreviews) return
-    const ids = emailPreviews.map(p => p.id)
+    const ids = emailPreviews.recipients.map(p => p.id)
     const names: Record<string, string> = {}
-    emailPreviews.forEach(p => { names[p.id] = p.name })
-    const mode = emailPreviews[0]?.mode ?? 'mock'
+    emailPreviews.recipients.forEach(p => { names[p.id] = p.name })
+    const mode = emailPreviews.mode
 
     await bulkAction(ids, 'send_invite')
     await load()
@@ -143,8 +154,7 @@ export default function App() {
   }
 
   const handleSendInvite = async (id: string) => {
-    const res = await previewEmails([id])
-    setEmailPreviews(res.previews)
+    await openEmailPreview([id])
   }
 
   const handleSimulateReply = async () => {
@@ -380,7 +390,7 @@ export default function App() {
       )}
 
       {showSettings && <SettingsModal onClose={() => setShowSettings(false)} onSaved={() => showToast('✅ Settings saved')} />}
-      {emailPreviews && <EmailPreviewModal previews={emailPreviews} onSend={handleConfirmSend} onClose={() => setEmailPreviews(null)} />}
+      {emailPreviews && <EmailPreviewModal summary={emailPreviews} onSend={handleConfirmSend} onClose={() => setEmailPreviews(null)} />}
       {showUpload && <UploadResumeModal onClose={() => setShowUpload(false)} onUploaded={() => { load(); showToast('✅ Resume added and scored') }} />}
     </div>
   )
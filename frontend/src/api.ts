@@ -18,11 +18,15 @@ export async function scoreAll(): Promise<{ scored: number; auto_promoted: numbe
 }
 
 export async function updateStatus(id: string, status: string): Promise<void> {
-  await fetch(`${BASE}/applicants/${id}/status`, {
+  const r = await fetch(`${BASE}/applicants/${id}/status`, {
     method: 'PATCH',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({ status }),
   })
+  if (!r.ok) {
+    const body = await r.json().catch(() => ({}))
+    throw new Error(typeof body.detail === 'string' ? body.detail : `Status change failed (${r.status})`)
+  }
 }
 
 export interface EmailPreview {
@@ -45,6 +49,41 @@ export async function previewEmails(ids: string[]): Promise<{ previews: EmailPre
   return r.json()
 }
 
+export interface EmailRecipient {
+  id: string
+  name: string
+  email: string
+  actual_email: string
+  status: string
+}
+
+export interface EmailPreviewSummary {
+  mode: string
+  subject: string
+  total: number
+  missing: string[]
+  page_size: number
+  recipients: EmailRecipient[]
+}
+
+export async function previewSummary(ids: string[]): Promise<EmailPreviewSummary> {
+  const r = await fetch(`${BASE}/email/preview/summary`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ applicant_ids: ids }),
+  })
+  return r.json()
+}
+
+export async function previewPage(ids: string[], offset: number, limit: number): Promise<{ previews: EmailPreview[]; offset: number; total: number; next_offset: number | null; mode: string }> {
+  const r = await fetch(`${BASE}/email/preview/page`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ applicant_ids: ids, offset, limit }),
+  })
+  return r.json()
+}
+
 export async function bulkAction(ids: string[], action: string): Promise<any> {
   const r = await fetch(`${BASE}/bulk`, {
     method: 'POST',
@@ -79,7 +118,9 @@ export async function saveSettings(settings: any): Promise<any> {
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify(settings),
   })
-  return r.json()
+  const body = await r.json().catch(() => ({}))
+  if (!r.ok) throw new Error(typeof body.detail === 'string' ? body.detail : `Saving settings failed (${r.status})`)
+  return body
 }
 
 export async function paycomRefresh(): Promise<{ refreshed: boolean; applicant_count: number }> {
@@ -89,7 +130,7 @@ export async function paycomRefresh(): Promise<{ refreshed: boolean; applicant_c
 
 export async function uploadResume(data: {
   first_name: string; last_name: string; email: string
-  location: string; distance_miles: number; resume_text: string
+  location: string; distance_miles?: number; resume_text: string
 }): Promise<any> {
   const r = await fetch(`${BASE}/upload-resume`, {
     method: 'POST',
@@ -98,3 +139,16 @@ export async function uploadResume(data: {
   })
   return r.json()
 }
+
+export async function uploadResumeFile(data: {
+  first_name: string; last_name: string; email: string
+  location: string; distance_miles?: number
+}, file: File): Promise<any> {
+  const form = new FormData()
+  Object.entries(data).forEach(([k, v]) => { if (v !== undefined) form.append(k, String(v)) })
+  form.append('file', file)
+  const r = await fetch(`${BASE}/upload-resume/file`, { method: 'POST', body: form })
+  const body = await r.json()
+  if (!r.ok) throw new Error(body.detail || `Upload failed (${r.status})`)
+  return body
+}
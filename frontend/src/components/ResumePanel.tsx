@@ -42,7 +42,10 @@ export default function ResumePanel({ applicant, onClose, onStatusChange, onSend
           </span>
           <span className="flex items-center gap-1.5 text-gray-600 text-xs">
             <MapPin size={13} className="text-blue-500" />
-            {applicant.location} ({applicant.distance_miles.toFixed(1)} mi)
+            {applicant.location} ({applicant.distance_miles.toFixed(1)} mi
+            {sd?.geocoded_miles != null && sd.geocoded_miles !== applicant.distance_miles && (
+              <span title="Scored on the geocoded distance from the job">, {sd.geocoded_miles.toFixed(1)} mi geocoded</span>
+            )})
           </span>
           <span className="flex items-center gap-1.5 text-gray-600 text-xs">
             <Calendar size={13} className="text-blue-500" />
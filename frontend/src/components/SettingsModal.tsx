@@ -13,6 +13,7 @@ export default function SettingsModal({ onClose, onSaved }: Props) {
   const [tab, setTab] = useState<Tab>('scoring')
   const [settings, setSettings] = useState<any>(null)
   const [saving, setSaving] = useState(false)
+  const [saveError, setSaveError] = useState('')
   const [emailPreviewText, setEmailPreviewText] = useState('')
 
   useEffect(() => { fetchSettings().then(s => { setSettings(s); renderPreview(s) }) }, [])
@@ -30,7 +31,14 @@ export default function SettingsModal({ onClose, onSaved }: Props) {
 
   const handleSave = async () => {
     setSaving(true)
-    await saveSettings(settings)
+    setSaveError('')
+    try {
+      await saveSettings(settings)
+    } catch (e) {
+      setSaveError(e instanceof Error ? e.message : String(e))
+      setSaving(false)
+      return
+    }
     setSaving(false)
     onSaved()
     onClose()
@@ -95,14 +103,15 @@ export default function SettingsModal({ onClose, onSaved }: Props) {
                     { key: 'auto_promote_threshold', label: 'Auto-Promote Threshold', desc: 'Moves "New" → "Reviewing" after scoring', color: 'text-blue-600' },
                     { key: 'strong_hire_threshold', label: 'Strong Hire Threshold', desc: '🟢 Strong Hire badge', color: 'text-emerald-600' },
                     { key: 'consider_threshold', label: 'Consider Threshold', desc: '🟡 Consider badge', color: 'text-yellow-600' },
+                    { key: 'relevance_weight', label: 'Job Description Match Weight', desc: 'Share of the score from how closely the resume matches the posting text (0 = off)', color: 'text-indigo-600' },
                   ].map(({ key, label, desc, color }) => (
                     <div key={key} className="bg-gray-50 rounded-xl p-4">
                       <div className="flex items-center justify-between mb-1">
                         <label className="font-medium text-sm text-gray-800">{label}</label>
-                        <span className={`font-bold text-lg ${color}`}>{settings.scoring[key]}</span>
+                        <span className={`font-bold text-lg ${color}`}>{settings.scoring[key] ?? 0}</span>
                       </div>
                       <p className="text-xs text-gray-500 mb-2">{desc}</p>
-                      <input type="range" min={0} max={100} value={settings.scoring[key]} onChange={e => updateScoring(key, Number(e.target.value))} className="w-full accent-blue-600" />
+                      <input type="range" min={0} max={100} value={settings.scoring[key] ?? 0} onChange={e => updateScoring(key, Number(e.target.value))} className="w-full accent-blue-600" />
                       <div className="flex justify-between text-xs text-gray-400 mt-0.5"><span>0</span><span>50</span><span>100</span></div>
                     </div>
                   ))}
@@ -202,7 +211,8 @@ export default function SettingsModal({ onClose, onSaved }: Props) {
           )}
         </div>
 
-        <div className="flex justify-end gap-2 p-4 border-t bg-gray-50 rounded-b-2xl">
+        <div className="flex justify-end items-center gap-2 p-4 border-t bg-gray-50 rounded-b-2xl">
+          {saveError && <p className="mr-auto text-sm text-red-600">{saveError}</p>}
           <button onClick={onClose} className="px-4 py-2 text-sm text-gray-600 hover:text-gray-800">Cancel</button>
           <button onClick={handleSave} disabled={saving} className="flex items-center gap-2 bg-blue-600 text-white px-5 py-2 rounded-lg hover:bg-blue-700 transition-colors font-medium text-sm disabled:opacity-60">
             <Save size={14} />{saving ? 'Saving...' : 'Save Settings'}
@@ -1,6 +1,6 @@
 import { useState } from 'react'
 import { X, Upload, UserPlus } from 'lucide-react'
-import { uploadResume } from '../api'
+import { uploadResume, uploadResumeFile } from '../api'
 import ScoreBar from './ScoreBar'
 
 interface Props {
@@ -17,6 +17,7 @@ export default function UploadResumeModal({ onClose, onUploaded }: Props) {
     distance_miles: '',
     resume_text: '',
   })
+  const [file, setFile] = useState<File | null>(null)
   const [result, setResult] = useState<any>(null)
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
@@ -24,20 +25,22 @@ export default function UploadResumeModal({ onClose, onUploaded }: Props) {
   const set = (k: string, v: string) => setForm(prev => ({ ...prev, [k]: v }))
 
   const handleSubmit = async () => {
-    if (!form.first_name || !form.last_name || !form.email || !form.resume_text) {
-      setError('Name, email, and resume text are required.')
+    if (!form.first_name || !form.last_name || !form.email || (!form.resume_text && !file)) {
+      setError('Name, email, and a resume file or text are required.')
       return
     }
     setError('')
     setLoading(true)
     try {
-      const res = await uploadResume({
-        ...form,
-        distance_miles: parseFloat(form.distance_miles) || 50,
-      })
+      // Left blank, the server measures the distance from the location.
+      const distance_miles = form.distance_miles ? parseFloat(form.distance_miles) : undefined
+      const { resume_text, ...fields } = form
+      const res = file
+        ? await uploadResumeFile({ ...fields, distance_miles }, file)
+        : await uploadResume({ ...fields, resume_text, distance_miles })
       setResult(res)
-    } catch {
-      setError('Upload failed. Please try again.')
+    } catch (e) {
+      setError(e instanceof Error && e.message ? e.message : 'Upload failed. Please try again.')
     }
     setLoading(false)
   }
@@ -83,7 +86,7 @@ export default function UploadResumeModal({ onClose, onUploaded }: Props) {
               View in Dashboard
             </button>
             <button
-              onClick={() => { setResult(null); setForm({ first_name: '', last_name: '', email: '', location: '', distance_miles: '', resume_text: '' }) }}
+              onClick={() => { setResult(null); setFile(null); setForm({ first_name: '', last_name: '', email: '', location: '', distance_miles: '', resume_text: '' }) }}
               className="px-4 py-2 text-sm text-gray-500 hover:text-gray-700"
             >
               Add Another
@@ -151,13 +154,24 @@ export default function UploadResumeModal({ onClose, onUploaded }: Props) {
               <input
                 value={form.distance_miles}
                 onChange={e => set('distance_miles', e.target.value)}
-                placeholder="5.0"
+                placeholder="Auto from location"
                 type="number"
                 className="w-full border border-gray-300 rounded-lg px-3 py-2 text-sm focus:ring-2 focus:ring-blue-500 outline-none"
               />
             </div>
           </div>
 
+          <div>
+            <label className="block text-sm font-medium text-gray-700 mb-1">Resume File</label>
+            <input
+              type="file"
+              accept=".pdf,.docx,.txt,application/pdf,application/vnd.openxmlformats-officedocument.wordprocessingml.document,text/plain"
+              onChange={e => setFile(e.target.files?.[0] ?? null)}
+              className="block w-full text-sm text-gray-600 file:mr-3 file:py-1.5 file:px-3 file:rounded-lg file:border-0 file:bg-blue-50 file:text-blue-700 hover:file:bg-blue-100"
+            />
+            <p className="text-xs text-gray-400 mt-1">PDF, DOCX or TXT. Leave empty to paste the text below instead.</p>
+          </div>
+
           <div>
             <label className="block text-sm font-medium text-gray-700 mb-1">Resume Text</label>
             <p className="text-xs text-gray-400 mb-1.5">
@@ -166,9 +180,10 @@ export default function UploadResumeModal({ onClose, onUploaded }: Props) {
             <textarea
               value={form.resume_text}
               onChange={e => set('resume_text', e.target.value)}
+              disabled={!!file}
               rows={10}
               placeholder="3 seasons at Breckenridge as lift operator. OSHA 10 certified. First Aid/CPR. Available weekends, holidays, and 6am shifts. Strong physical endurance from outdoor work..."
-              className="w-full border border-gray-300 rounded-lg px-3 py-2 text-sm focus:ring-2 focus:ring-blue-500 outline-none resize-none"
+              className="w-full border border-gray-300 rounded-lg px-3 py-2 text-sm focus:ring-2 focus:ring-blue-500 outline-none resize-none disabled:bg-gray-50"
             />
           </div>
 
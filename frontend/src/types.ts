@@ -27,6 +27,8 @@ export interface ScoreData {
   badge: string
   breakdown: Record<string, ScoreBreakdown>
   reasons: string[]
+  // Miles from the job by the gazetteer, which proximity is scored on; null for unknown places.
+  geocoded_miles?: number | null
 }
 
 export interface ResponseData {
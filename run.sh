@@ -6,5 +6,25 @@ cd "$PROJECT_DIR"
 
 pip install -r backend/requirements.txt -q
 
+# frontend/dist is committed and served as is. Rebuild only when frontend/src changed since it
+# was built; if that fails (no Node, registry down) keep serving the committed build.
+if ! ./build.sh --check; then
+  timeout "${HR_UI_BUILD_TIMEOUT:-180}" ./build.sh \
+    || echo "run.sh: frontend build failed; serving the committed frontend/dist" >&2
+fi
+
 cd backend
-exec uvicorn main:app --host 0.0.0.0 --port 8787 --workers 1
+python compression.py ../frontend/dist > /dev/null
+WORKERS="${HR_WORKERS:-1}"
+if [ "$WORKERS" -le 1 ]; then
+  exec uvicorn main:app --host 0.0.0.0 --port 8787 --workers 1
+fi
+
+# One writer owns the store and publishes read snapshots; reader workers serve GETs from them
+# and forward everything else to the writer.
+export HR_SNAPSHOT_PATH="${HR_SNAPSHOT_PATH:-/tmp/hr-snapshot.bin}"
+export HR_WRITER_URL="http://127.0.0.1:8788"
+HR_ROLE=writer uvicorn main:app --host 127.0.0.1 --port 8788 --workers 1 &
+WRITER_PID=$!
+trap 'kill "$WRITER_PID" 2>/dev/null' EXIT INT TERM
+uvicorn reader:app --host 0.0.0.0 --port 8787 --workers "$WORKERS"
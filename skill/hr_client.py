@@ -156,7 +156,7 @@ def cmd_list(args):
 
 def cmd_score_all(args):
     print("🤖 **Running AI scoring on all candidates...**")
-    result = _post("/api/score/all", {})
+    result = _post("/api/score/all?top=5", {})
     scored = result.get("scored", 0)
     promoted = result.get("auto_promoted", 0)
     threshold = result.get("threshold", 75)
@@ -245,8 +245,10 @@ def cmd_status(args):
     ce = target.get("calendar_event")
 
     print(f"**👤 {name}** (`{target['id']}`)")
+    geocoded = sd.get("geocoded_miles") if sd else None
     print(
         f"📍 {target.get('location', 'N/A')} — {target.get('distance_miles', 0):.1f} miles from resort"
+        + (f" ({geocoded:.1f} geocoded, used for scoring)" if geocoded is not None else "")
     )
     print(f"📌 Status: **{status_icon} {status.replace('_', ' ')}**")
 
@@ -302,17 +304,24 @@ def cmd_email(args):
         return
 
     if args.preview:
-        print(
-            f"**📋 Email Preview — {len(ids)} candidate{'s' if len(ids) > 1 else ''}**"
+        summary = _post("/api/email/preview/summary", {"applicant_ids": ids})
+        total = summary["total"]
+        print(f"**📋 Email Preview — {total} candidate{'s' if total != 1 else ''}**")
+        if summary["missing"]:
+            print(f"⚠️ Not found: {', '.join(summary['missing'])}")
+        page = _post(
+            "/api/email/preview/page",
+            {"applicant_ids": ids, "limit": summary["page_size"]},
         )
-        previews = _post("/api/email/preview", {"applicant_ids": ids})
-        for p in previews.get("previews", []):
+        for p in page["previews"]:
             print(f"\n---\n**To:** {p['name']} ({p['email']})")
             print(f"**Subject:** {p['subject']}")
             if p.get("questions"):
                 print(f"**Questions selected for {p['name'].split()[0]}:**")
                 for i, q in enumerate(p["questions"], 1):
                     print(f"{i}. {q}")
+        if total > len(page["previews"]):
+            print(f"\n_…and {total - len(page['previews'])} more._")
         return
 
     result = _post("/api/bulk", {"applicant_ids": ids, "action": "send_invite"})
@@ -334,6 +343,8 @@ def cmd_email(args):
         print(f"| ✅ {r['name']} | {r.get('email', '—')} | invite sent |")
     print()
     print(f"Candidates moved to **✉️ Awaiting Reply**.")
+    if result.get("dispatch_job"):
+        print(f"Delivery job `{result['dispatch_job']}` is sending in the background.")
     if mode == "mock":
         print("_Mock responses will arrive in ~5 seconds in the dashboard._")
 
@@ -363,15 +374,18 @@ def cmd_book(args):
         f"**📅 Interviews Booked — {processed} candidate{'s' if processed > 1 else ''}**"
     )
     print()
-    print("| Candidate | Date | Time | Location |")
-    print("|-----------|------|------|----------|")
+    print("| Candidate | Date | Time | Location | Interviewer |")
+    print("|-----------|------|------|----------|-------------|")
     for r in result.get("results", []):
         ce = r.get("calendar_event", {})
         print(
-            f"| {r['name']} | {ce.get('date', '—')} | {ce.get('time', '—')} | {ce.get('location', '—')} |"
+            f"| {r['name']} | {ce.get('date', '—')} | {ce.get('time', '—')} | {ce.get('location', '—')} | {ce.get('interviewer', '—')} |"
         )
     print()
     print("Candidates moved to **📅 Booked**.")
+    unscheduled = result.get("unscheduled", [])
+    if unscheduled:
+        print(f"⚠️ No free slot for {len(unscheduled)} candidate(s): {', '.join(unscheduled)}")
 
 
 def cmd_summary(args):
@@ -513,6 +527,69 @@ def cmd_digest(args):
         print("✅ _Pipeline looks good — no immediate actions needed._")
 
 
+def _parse_batch_op(spec: str) -> dict:
+    """`get:PAY-0003`, `score:PAY-0003`, `status:PAY-0003=shortlisted`, `preview:PAY-0001,PAY-0002`, `search:jake`."""
+    op, _, arg = spec.partition(":")
+    if op == "status":
+        applicant_id, _, status = arg.partition("=")
+        return {"op": op, "id": applicant_id, "status": status}
+    if op == "preview":
+        return {"op": op, "ids": [i.strip() for i in arg.split(",") if i.strip()]}
+    if op == "search":
+        return {"op": op, "query": arg}
+    return {"op": op, "id": arg}
+
+
+def cmd_batch(args):
+    if args.file:
+        with (sys.stdin if args.file == "-" else open(args.file)) as f:
+            ops = json.load(f)
+    else:
+        ops = [_parse_batch_op(spec) for spec in args.ops]
+    if not ops:
+        print("❌ No operations. Example: `batch get:PAY-0003 status:PAY-0003=shortlisted`")
+        return
+
+    result = _post("/api/batch", {"ops": ops, "stop_on_error": args.stop_on_error})
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(
+        f"**🧺 Batch — {result['succeeded']} ok, {result['failed']} failed"
+        + (f", {result['skipped']} skipped" if result["skipped"] else "")
+        + "**"
+    )
+    print()
+    print("| # | Op | Result |")
+    print("|---|----|--------|")
+    for i, r in enumerate(result["results"], 1):
+        label = f"{r['op']} `{r['id']}`" if r.get("id") else r["op"]
+        if not r["ok"]:
+            outcome = f"❌ {r['status']}: {r['error']}"
+        elif r["op"] == "get":
+            a = r["result"]
+            sd = a.get("score_data")
+            score_str = f"{_score_emoji(sd['score'])} {sd['score']}/100" if sd else "not scored"
+            outcome = (
+                f"{a['first_name']} {a['last_name']} · {score_str} · "
+                f"{STATUS_EMOJI.get(a['status'], '•')} {a['status']} · {a.get('location', '—')}"
+            )
+        elif r["op"] == "score":
+            sd = r["result"]
+            outcome = f"{_score_emoji(sd['score'])} {sd['score']}/100 — {sd['recommendation']}"
+        elif r["op"] == "status":
+            status = r["result"]["status"]
+            outcome = f"✅ now {STATUS_EMOJI.get(status, '•')} {status}"
+        elif r["op"] == "search":
+            outcome = ", ".join(f"{a['name']} (`{a['id']}`)" for a in r["result"]) or "no matches"
+        elif r["op"] == "preview":
+            outcome = "; ".join(f"{p['name']}: {p['subject']}" for p in r["result"]) or "no recipients"
+        else:
+            outcome = "✅"
+        print(f"| {i} | {label} | {outcome} |")
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="hr_client", description="HR Resume Processor — Kaji Skill CLI"
@@ -556,6 +633,21 @@ def main():
     p_search = subparsers.add_parser("search", help="Search candidates by name")
     p_search.add_argument("query", help="Name to search for")
 
+    p_batch = subparsers.add_parser(
+        "batch", help="Run several operations in one request"
+    )
+    p_batch.add_argument(
+        "ops",
+        nargs="*",
+        help="Ops like get:PAY-0003 score:PAY-0003 status:PAY-0003=shortlisted "
+        "preview:PAY-0001,PAY-0002 search:jake",
+    )
+    p_batch.add_argument("--file", help="JSON list of ops ('-' for stdin)")
+    p_batch.add_argument(
+        "--stop-on-error", action="store_true", help="Skip the rest after a failure"
+    )
+    p_batch.add_argument("--json", action="store_true", help="Print the raw response")
+
     args = parser.parse_args()
 
     dispatch = {
@@ -569,6 +661,7 @@ def main():
         "refresh": cmd_refresh,
         "digest": cmd_digest,
         "search": cmd_search,
+        "batch": cmd_batch,
     }
 
     if not args.command:
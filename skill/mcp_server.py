@@ -8,6 +8,7 @@ import json
 import os
 import urllib.request
 import urllib.error
+import urllib.parse
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
@@ -62,43 +63,80 @@ def _status_icon(status: str) -> str:
             "awaiting_reply": "✉️", "booked": "📅", "rejected": "❌", "hired": "✅"}.get(status, "•")
 
 
+# Column header and cell renderer per /api/applicants/page field.
+_COLUMNS = {
+    "id": ("ID", lambda v: f"`{v}`"),
+    "name": ("Name", str),
+    "score": ("Score", lambda v: f"{_score_icon(v)} {v}/100"),
+    "recommendation": ("Verdict", str),
+    "response_score": ("Response", lambda v: f"💬 {v}/50"),
+    "status": ("Status", lambda v: f"{_status_icon(v)} {v.replace('_', ' ')}"),
+    "location": ("Location", str),
+    "distance_miles": ("Miles", lambda v: f"{v:.0f}"),
+    "geocoded_miles": ("Geo mi", lambda v: f"{v:.0f}"),
+    "ski_years": ("Ski yrs", str),
+    "certifications": ("Certs", str),
+    "interview": ("Interview", str),
+}
+LIST_FIELDS = ("name", "id", "score", "response_score", "status", "location")
+PAGE_SIZE = 25
+MAX_CHARS = 4000
+
+
+def _page(**params) -> dict:
+    """One page from /api/applicants/page; None params are left out."""
+    query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+    return _get(f"/api/applicants/page?{query}")
+
+
+def _page_lines(page: dict, tool: str) -> list[str]:
+    """The page as a markdown table, plus how to fetch the next one."""
+    fields = page["fields"]
+    lines = [
+        "| " + " | ".join(_COLUMNS.get(f, (f, None))[0] for f in fields) + " |",
+        "|" + "|".join("---" for _ in fields) + "|",
+    ]
+    for item in page["items"]:
+        cells = []
+        for f in fields:
+            v = item.get(f)
+            cells.append("—" if v is None else _COLUMNS.get(f, (f, str))[1](v))
+        lines.append("| " + " | ".join(cells) + " |")
+    if page["next_cursor"]:
+        lines.append(f"\n_{page['remaining']} more — call `{tool}` again with cursor=\"{page['next_cursor']}\"_")
+    return lines
+
+
 @mcp.tool()
 def hr_list_candidates(
     status: Optional[str] = None,
     min_score: Optional[int] = None,
     top: Optional[int] = None,
+    fields: Optional[list[str]] = None,
+    cursor: Optional[str] = None,
+    max_chars: int = MAX_CHARS,
 ) -> str:
     """
-    List HR candidates from the pipeline. Filter by status, minimum AI score, or limit to top N.
+    List HR candidates from the pipeline, best score first, one page at a time.
+    Filter by status or minimum AI score; `top` sets the page size (default 25).
     Valid statuses: new, reviewing, shortlisted, awaiting_reply, booked, rejected, hired.
-    Returns a ranked Mattermost-formatted table.
+    `fields` picks columns (id, name, score, recommendation, response_score, status, location,
+    distance_miles, geocoded_miles, ski_years, certifications, interview, email, phone, applied_date).
+    Output stays under `max_chars`; pass the returned cursor to get the next page.
     """
-    applicants = _get("/api/applicants")
     job = _get("/api/job")
-
-    if status:
-        applicants = [a for a in applicants if a["status"] == status]
-    if min_score:
-        applicants = [a for a in applicants if a.get("score_data", {}).get("score", 0) >= min_score]
-    if top:
-        applicants = applicants[:top]
-
-    if not applicants:
+    # Leave room for the title and continuation lines around the table.
+    page = _page(
+        status=status, min_score=min_score, limit=top or PAGE_SIZE, cursor=cursor,
+        fields=",".join(fields or LIST_FIELDS), max_chars=max(200, max_chars - 300),
+    )
+    if not page["items"]:
         return "No candidates match the current filter. Try widening status or score filter, or run `hr_score_all` first."
 
-    lines = [f"**🏔 {job['title']} — {len(applicants)} candidates**\n"]
-    lines.append("| # | Name | Score | Response | Status | Location |")
-    lines.append("|---|------|-------|----------|--------|----------|")
-    for i, a in enumerate(applicants, 1):
-        sd = a.get("score_data")
-        rd = a.get("response_data")
-        score_str = f"{_score_icon(sd['score'])} {sd['score']}/100" if sd else "—"
-        resp_str = f"💬 {rd['score']}/50 {rd['recommendation']}" if rd else "—"
-        loc = f"{a.get('location', '?')} ({a.get('distance_miles', 0):.0f}mi)"
-        status_str = f"{_status_icon(a['status'])} {a['status'].replace('_', ' ')}"
-        lines.append(f"| {i} | {a['first_name']} {a['last_name']} | {score_str} | {resp_str} | {status_str} | {loc} |")
-
-    if not any(a.get("score_data") for a in applicants):
+    filters = "".join([f" · status={status}" if status else "", f" · score ≥ {min_score}" if min_score else ""])
+    lines = [f"**🏔 {job['title']} — {page['count']} of {page['total']} candidates{filters}**\n"]
+    lines += _page_lines(page, "hr_list_candidates")
+    if "score" in page["fields"] and all(item.get("score") is None for item in page["items"]):
         lines.append("\n_💡 No scores yet — call `hr_score_all` to run AI scoring._")
     return "\n".join(lines)
 
@@ -115,16 +153,21 @@ def hr_get_candidate(applicant_id: str) -> str:
         if e.code == 404:
             return f"❌ Applicant `{applicant_id}` not found. Use `hr_search_candidates` to find the correct ID."
         raise
+    return _candidate_profile(a)
+
 
+def _candidate_profile(a: dict) -> str:
     sd = a.get("score_data")
     rd = a.get("response_data")
     ce = a.get("calendar_event")
     ski_years = sum(e.get("years", 0) for e in a["resume"]["experience"] if e.get("ski_related"))
     certs = a["resume"].get("certifications", [])
 
+    geocoded = sd.get("geocoded_miles") if sd else None
     lines = [
         f"**👤 {a['first_name']} {a['last_name']}** (`{a['id']}`)",
-        f"📍 {a.get('location', 'N/A')} — {a.get('distance_miles', 0):.1f} miles from resort",
+        f"📍 {a.get('location', 'N/A')} — {a.get('distance_miles', 0):.1f} miles from resort"
+        + (f" ({geocoded:.1f} geocoded, used for scoring)" if geocoded is not None else ""),
         f"📌 Status: **{_status_icon(a['status'])} {a['status'].replace('_', ' ')}**",
         f"📅 Applied: {a.get('applied_date', 'N/A')}",
         f"📧 {a.get('email', 'N/A')}",
@@ -148,48 +191,42 @@ def hr_get_candidate(applicant_id: str) -> str:
 
 
 @mcp.tool()
-def hr_search_candidates(query: str) -> str:
+def hr_search_candidates(query: str, cursor: Optional[str] = None, max_chars: int = MAX_CHARS) -> str:
     """
-    Search candidates by name (partial match). Returns IDs, scores, and status.
+    Search candidates by name (partial match). Returns IDs, scores, and status, best score first.
     Use this to find the correct applicant_id before calling other tools.
+    Pass the returned cursor to see more matches.
     """
-    applicants = _get("/api/applicants")
-    q = query.lower()
-    matches = [a for a in applicants if q in f"{a['first_name']} {a['last_name']}".lower()]
-
-    if not matches:
+    page = _page(q=query, fields="name,id,score,status", limit=PAGE_SIZE, cursor=cursor,
+                 max_chars=max(200, max_chars - 300))
+    if not page["items"]:
         return f"No candidates found matching `{query}`."
 
-    lines = [f"**🔍 Search results for \"{query}\" — {len(matches)} found**\n"]
-    lines.append("| Name | ID | Score | Status |")
-    lines.append("|------|-----|-------|--------|")
-    for a in matches:
-        sd = a.get("score_data")
-        score_str = f"{_score_icon(sd['score'])} {sd['score']}" if sd else "—"
-        lines.append(f"| {a['first_name']} {a['last_name']} | `{a['id']}` | {score_str} | {_status_icon(a['status'])} {a['status']} |")
+    lines = [f"**🔍 Search results for \"{query}\" — {page['total']} found**\n"]
+    lines += _page_lines(page, "hr_search_candidates")
     return "\n".join(lines)
 
 
 @mcp.tool()
-def hr_score_all() -> str:
+def hr_score_all(top: int = 5) -> str:
     """
     Run AI scoring on ALL candidates. Scores against Ski Lift Operator criteria
     (ski experience 35pts, certifications 25pts, availability 20pts, proximity 15pts, physical 5pts).
     Candidates scoring above the auto-promote threshold are automatically moved to 'reviewing'.
-    Returns a summary with auto-promoted count and top 5 scores.
+    Returns a summary with auto-promoted count and the `top` scores (default 5).
     """
-    result = _post("/api/score/all", {})
+    result = _post(f"/api/score/all?top={top}", {})
     scored = result.get("scored", 0)
     promoted = result.get("auto_promoted", 0)
     threshold = result.get("threshold", 75)
-    top = result.get("results", [])[:5]
+    best = result.get("results", [])
 
     lines = [f"✅ **AI Scoring Complete — {scored} candidates scored**"]
     if promoted > 0:
         lines.append(f"⬆️ **{promoted} auto-promoted** to Reviewing (score ≥ {threshold})")
-    lines.append("\n**Top 5:**")
-    for r in top:
-        lines.append(f"• {_score_icon(r['score'])} {r['score']}/100 — {r.get('recommendation', '')}")
+    lines.append(f"\n**Top {len(best)}:**")
+    for r in best:
+        lines.append(f"• `{r['id']}` {_score_icon(r['score'])} {r['score']}/100 — {r.get('recommendation', '')}")
     lines.append(f"\nUse `hr_list_candidates(status='reviewing')` to see promoted candidates.")
     return "\n".join(lines)
 
@@ -204,6 +241,8 @@ def hr_score_candidate(applicant_id: str) -> str:
     except urllib.error.HTTPError as e:
         if e.code == 404:
             return f"❌ Applicant `{applicant_id}` not found."
+        if e.code == 409:
+            return f"❌ {json.loads(e.read()).get('detail', 'Status change not allowed')}"
         raise
 
     lines = [
@@ -232,10 +271,13 @@ def hr_send_invites(
     Candidates are moved to 'awaiting_reply'. In mock mode, responses arrive in ~5 seconds.
     """
     if preview_only:
-        result = _post("/api/email/preview", {"applicant_ids": applicant_ids})
-        previews = result.get("previews", [])
-        lines = [f"**📋 Email Preview — {len(previews)} recipient(s)**\n"]
-        for p in previews[:3]:
+        # Counts come from the summary; only the three shown bodies are rendered.
+        summary = _post("/api/email/preview/summary", {"applicant_ids": applicant_ids})
+        previews = _post("/api/email/preview/page", {"applicant_ids": applicant_ids, "limit": 3})["previews"]
+        lines = [f"**📋 Email Preview — {summary['total']} recipient(s)**\n"]
+        if summary["missing"]:
+            lines.append(f"⚠️ Not found: {', '.join(summary['missing'][:10])}\n")
+        for p in previews:
             lines.append(f"**To:** {p['name']} ({p['email']})")
             lines.append(f"**Subject:** {p['subject']}")
             if p.get("questions"):
@@ -244,6 +286,8 @@ def hr_send_invites(
                     lines.append(f"{i}. {q}")
             lines.append(f"**Body preview:** {p['body'][:200]}...")
             lines.append("---")
+        if summary["total"] > len(previews):
+            lines.append(f"_…and {summary['total'] - len(previews)} more with the same template._")
         return "\n".join(lines)
 
     result = _post("/api/bulk", {"applicant_ids": applicant_ids, "action": "send_invite"})
@@ -258,6 +302,8 @@ def hr_send_invites(
     for r in result.get("results", []):
         lines.append(f"| {r['name']} | ✅ invite sent |")
     lines.append(f"\nCandidates moved to **✉️ Awaiting Reply**.")
+    if result.get("dispatch_job"):
+        lines.append(f"Delivery job `{result['dispatch_job']}` is sending in the background.")
     if mode == "mock":
         lines.append("_Mock responses will arrive in ~5 seconds in the dashboard._")
     return "\n".join(lines)
@@ -266,19 +312,25 @@ def hr_send_invites(
 @mcp.tool()
 def hr_book_interviews(applicant_ids: list[str]) -> str:
     """
-    Book interview slots for candidates. Creates Google Calendar events and moves
-    candidates to 'booked' status with date/time/location details.
+    Book interview slots for candidates. Each candidate gets the earliest free
+    room/interviewer seat on the interview calendar (candidates who already hold a
+    slot keep it) and moves to 'booked' status with date/time/location details.
     """
     result = _post("/api/bulk", {"applicant_ids": applicant_ids, "action": "book_interview"})
     processed = result.get("processed", 0)
 
     lines = [f"**📅 Interviews Booked — {processed} candidate(s)**", ""]
-    lines.append("| Candidate | Date | Time | Location |")
-    lines.append("|-----------|------|------|----------|")
+    lines.append("| Candidate | Date | Time | Location | Interviewer |")
+    lines.append("|-----------|------|------|----------|-------------|")
     for r in result.get("results", []):
         ce = r.get("calendar_event", {})
-        lines.append(f"| {r['name']} | {ce.get('date', '—')} | {ce.get('time', '—')} | {ce.get('location', '—')} |")
+        lines.append(
+            f"| {r['name']} | {ce.get('date', '—')} | {ce.get('time', '—')} | {ce.get('location', '—')} | {ce.get('interviewer', '—')} |"
+        )
     lines.append("\nCandidates moved to **📅 Booked**.")
+    unscheduled = result.get("unscheduled", [])
+    if unscheduled:
+        lines.append(f"\n⚠️ No free slot before the scheduling horizon for: {', '.join(unscheduled)}")
     return "\n".join(lines)
 
 
@@ -300,6 +352,63 @@ def hr_update_status(applicant_id: str, status: str) -> str:
         raise
 
 
+def _batch_result(r: dict) -> str:
+    """One sub-operation's outcome from /api/batch, formatted like its single-call tool."""
+    label = f"`{r['op']}`" + (f" `{r['id']}`" if r.get("id") else "")
+    if not r["ok"]:
+        return f"❌ {label} — {r['status']}: {r['error']}"
+    result = r["result"]
+    if r["op"] == "get":
+        return _candidate_profile(result)
+    if r["op"] == "score":
+        return (f"📊 `{r['id']}`: {_score_icon(result['score'])} **{result['score']}/100** — "
+                f"{result['recommendation']}")
+    if r["op"] == "status":
+        return f"✅ {result['id']} status updated to **{_status_icon(result['status'])} {result['status']}**"
+    if r["op"] == "search":
+        if not result:
+            return f"🔍 {label} — no matches"
+        lines = [f"🔍 {label} — {len(result)} match(es)", "", "| Name | ID | Score | Status |", "|------|-----|-------|--------|"]
+        for a in result:
+            score_str = f"{_score_icon(a['score'])} {a['score']}" if a["score"] is not None else "—"
+            lines.append(f"| {a['name']} | `{a['id']}` | {score_str} | {_status_icon(a['status'])} {a['status']} |")
+        return "\n".join(lines)
+    if r["op"] == "preview":
+        lines = [f"**📋 Email Preview — {len(result)} recipient(s)**"]
+        for p in result:
+            lines.append(f"**To:** {p['name']} ({p['email']}) · **Subject:** {p['subject']}")
+            for i, q in enumerate(p.get("questions", []), 1):
+                lines.append(f"{i}. {q}")
+        return "\n".join(lines)
+    return f"✅ {label}"
+
+
+@mcp.tool()
+def hr_batch(ops: list[dict], stop_on_error: bool = False) -> str:
+    """
+    Run several operations in ONE call, in order, each with its own result.
+    Prefer this over chains of single-candidate tools (e.g. search → get → score → status).
+    Each op is a dict with "op" and its arguments:
+      {"op": "search", "query": "jake", "limit": 20}
+      {"op": "get", "id": "PAY-0003"}
+      {"op": "score", "id": "PAY-0003"}
+      {"op": "status", "id": "PAY-0003", "status": "shortlisted"}
+      {"op": "preview", "ids": ["PAY-0003", "PAY-0007"]}   (at most 50 ids)
+    Up to 50 ops. A failed op does not stop the others unless stop_on_error=True,
+    in which case the remaining ops are skipped.
+    """
+    try:
+        result = _post("/api/batch", {"ops": ops, "stop_on_error": stop_on_error})
+    except urllib.error.HTTPError as e:
+        return f"❌ {json.loads(e.read()).get('detail', 'Batch rejected')}"
+
+    lines = [f"**🧺 Batch — {result['succeeded']} ok, {result['failed']} failed"
+             + (f", {result['skipped']} skipped" if result["skipped"] else "") + "**"]
+    for i, r in enumerate(result["results"], 1):
+        lines.append(f"\n**{i}.** {_batch_result(r)}")
+    return "\n".join(lines)
+
+
 @mcp.tool()
 def hr_pipeline_summary() -> str:
     """